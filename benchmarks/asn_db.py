@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# loading an ip2asn-like dump with this many ranges into utils.asn_db and
+# looking up random IPs (all different, then from the traces' few hops)
+#
+#   python3 -m benchmarks.asn_db [number of ranges]
+import ipaddress
+import os
+import random
+import sys
+import tempfile
+import time
+
+import utils.asn_db
+
+NUMBER_OF_LOOKUPS = 1000000
+HOPS_IN_TRACES = 5000  # Different IPs
+
+
+def write_asn_db_file(db_path, number_of_ranges):
+    random.seed(0)
+    range_size = (1 << 32) // number_of_ranges
+    with open(db_path, "w") as db_file:
+        for range_step in range(number_of_ranges):
+            first_ip = range_step * range_size
+            db_file.write("\t".join([
+                str(ipaddress.IPv4Address(first_ip)),
+                str(ipaddress.IPv4Address(first_ip + range_size - 1)),
+                str(random.randrange(1, 400000)), random.choice(["NL", "DE", "IR", "US"]),
+                "Example"]) + "\n")
+
+
+def measure_lookups(asn_db, ips):
+    start_time = time.perf_counter()
+    asn_db.lookup_many(ips)
+    return format(len(ips) / (time.perf_counter() - start_time) / 1000000, '.2f') + " M/s"
+
+
+def main():
+    number_of_ranges = 500000
+    if len(sys.argv) > 1:
+        number_of_ranges = int(sys.argv[1])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "ip2asn-v4.tsv")
+        write_asn_db_file(db_path, number_of_ranges)
+        start_time = time.perf_counter()
+        asn_db = utils.asn_db.load_asn_db(db_path)
+        load_time = time.perf_counter() - start_time
+    all_ips = [str(ipaddress.IPv4Address(random.getrandbits(32)))
+               for _ in range(NUMBER_OF_LOOKUPS)]
+    hop_ips = all_ips[:HOPS_IN_TRACES]
+    print("ranges:       " + str(number_of_ranges))
+    print("load          " + format(load_time, '.2f') + " s")
+    print("different IPs " + measure_lookups(asn_db, all_ips[HOPS_IN_TRACES:]))
+    print("hops          " + measure_lookups(
+        asn_db, [random.choice(hop_ips) for _ in range(NUMBER_OF_LOOKUPS)]))
+
+
+if __name__ == "__main__":
+    main()
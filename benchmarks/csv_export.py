@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# time and peak memory of utils.csv.json2csv, sorted by hop and in the
+# order of the file, on a synthetic measurement file with this many hops
+#
+#   python3 -m benchmarks.csv_export [number of hops]
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import utils.csv
+from benchmarks.json_stream import write_measurement_file
+
+
+def measure(json_path, sort_it):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    utils.csv.json2csv(json_path, sort_it)
+    elapsed_time = time.perf_counter() - start_time
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_time, peak_memory
+
+
+def main():
+    number_of_hops = 20000
+    if len(sys.argv) > 1:
+        number_of_hops = int(sys.argv[1])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_path = os.path.join(temp_dir, "measurement.json")
+        write_measurement_file(json_path, number_of_hops)
+        results = []
+        for name, sort_it in [("sorted", True), ("raw", False)]:
+            elapsed_time, peak_memory = measure(json_path, sort_it)
+            results.append(name.ljust(14) + format(elapsed_time, '.2f') + " s   peak "
+                           + format(peak_memory / 1000000, '.1f') + " MB")
+        print("hops:         " + str(number_of_hops))
+        print("file size:    " + format(
+            os.path.getsize(json_path) / 1000000, '.1f') + " MB")
+        print("\n".join(results))
+
+
+if __name__ == "__main__":
+    main()
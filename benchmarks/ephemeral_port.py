@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# time to get a source port for each probe, with the socket dance of
+# ephemeral_port_reserve() and with the port pool
+#
+#   python3 -m benchmarks.ephemeral_port [number of ports]
+import sys
+import time
+
+import utils.ephemeral_port
+
+SOURCE_IP_ADDRESS = "127.0.0.1"
+
+
+def benchmark(get_port, proto, number_of_ports):
+    start_time = time.perf_counter()
+    for _ in range(number_of_ports):
+        get_port(SOURCE_IP_ADDRESS, proto)
+    return time.perf_counter() - start_time
+
+
+def main():
+    number_of_ports = 2000
+    if len(sys.argv) > 1:
+        number_of_ports = int(sys.argv[1])
+    print("ports:        " + str(number_of_ports))
+    for proto in ["tcp", "udp"]:
+        reserve_time = benchmark(
+            utils.ephemeral_port.ephemeral_port_reserve, proto, number_of_ports)
+        pool_time = benchmark(
+            utils.ephemeral_port.get_port, proto, number_of_ports)
+        utils.ephemeral_port.close_port_pools()
+        print(proto + " reserve:  " + format(
+            reserve_time * 1000000 / number_of_ports, '.1f') + " us/port")
+        print(proto + " pool:     " + format(
+            pool_time * 1000000 / number_of_ports, '.1f') + " us/port   ("
+            + format(reserve_time / pool_time, '.0f') + "x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# peak memory of loading a measurement file with json.load and with
+# iter_json_array, on a synthetic file with this many hops
+#
+#   python3 -m benchmarks.json_stream [number of hops]
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import utils.json_stream
+
+HOPS_PER_MEASUREMENT = 30
+RESULTS_PER_HOP = 3
+
+
+def hop_result(hop, result_step):
+    # about the size of a DNS hop with its packets
+    ip_fields = {"version": "4", "ihl": "5", "tos": "0x0", "len": "61",
+                 "id": str(hop * 10 + result_step), "flags": "", "frag": "0",
+                 "ttl": str(hop), "proto": "udp", "chksum": "0x1234",
+                 "src": "127.1.2.7", "dst": "1.1.1.1", "options": "[]"}
+    return {
+        "from": "10.0." + str(hop) + ".1", "rtt": 12.345, "size": 70, "ttl": 254,
+        "summary": "IP / ICMP 10.0." + str(hop) + ".1 > 127.1.2.7 time-exceeded",
+        "packets": {
+            "sent": {"IP": ip_fields, "UDP": {"sport": "40000", "dport": "domain",
+                                              "len": "41", "chksum": "0xabcd"}},
+            "received": [{"IP": ip_fields, "ICMP": {"type": "time-exceeded"},
+                          "IP in ICMP": ip_fields}]}}
+
+
+def write_measurement_file(json_path, number_of_hops):
+    with open(json_path, "w") as json_file:
+        json_file.write("[")
+        measurement_steps = 0
+        while measurement_steps * HOPS_PER_MEASUREMENT < number_of_hops:
+            if measurement_steps != 0:
+                json_file.write(",")
+            json_file.write(json.dumps({
+                "dst_addr": "1.1.1.1", "src_addr": "127.1.2.7", "annotation": "",
+                "result": [{"hop": hop, "result": [
+                    hop_result(hop, result_step)
+                    for result_step in range(RESULTS_PER_HOP)]}
+                    for hop in range(1, HOPS_PER_MEASUREMENT + 1)]}, indent=4))
+            measurement_steps += 1
+        json_file.write("]")
+
+
+def measure(load_measurements, json_path):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    number_of_measurements = 0
+    for _ in load_measurements(json_path):
+        number_of_measurements += 1
+    elapsed_time = time.perf_counter() - start_time
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return number_of_measurements, elapsed_time, peak_memory
+
+
+def json_load(json_path):
+    with open(json_path) as json_file:
+        return json.load(json_file)
+
+
+def main():
+    number_of_hops = 100000
+    if len(sys.argv) > 1:
+        number_of_hops = int(sys.argv[1])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_path = os.path.join(temp_dir, "measurement.json")
+        write_measurement_file(json_path, number_of_hops)
+        print("hops:         " + str(number_of_hops))
+        print("file size:    " + format(
+            os.path.getsize(json_path) / 1000000, '.1f') + " MB")
+        for name, load_measurements in [
+                ("json.load", json_load),
+                ("stream", utils.json_stream.iter_json_array)]:
+            number_of_measurements, elapsed_time, peak_memory = measure(
+                load_measurements, json_path)
+            print(name.ljust(14) + str(number_of_measurements) + " measurements   "
+                  + format(elapsed_time, '.2f') + " s   peak "
+                  + format(peak_memory / 1000000, '.1f') + " MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# compares the field walking packet2json() with parsing the text of
+# show2(), on the kind of packets we record in a trace
+#
+#   python3 -m benchmarks.packet2json [number of packets]
+import sys
+import time
+
+from scapy.all import DNS, DNSQR, DNSRR, ICMP, IP, TCP, UDP, Raw, raw
+from scapy.layers.inet import IPerror
+
+import utils.convert_packetlist
+
+PUBLIC_IP = "198.51.100.7"
+
+
+def recorded_packets(number_of_packets):
+    packets = []
+    ttl = 1
+    while len(packets) < number_of_packets:
+        dns_request = IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=ttl, id=ttl)/UDP(
+            sport=40000 + ttl, dport=53)/DNS(rd=1, qd=DNSQR(qname="example.com"))
+        http_request = IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=ttl, flags="DF")/TCP(
+            sport=50000 + ttl, dport=80, flags="PA")/Raw(
+            b"GET / HTTP/1.1\r\nHost: example.com\r\n\r\n")
+        router_ip = "10.0." + str(ttl % 250) + ".1"
+        packets += [
+            # what we send
+            IP(raw(dns_request)),
+            IP(raw(http_request)),
+            # what the routers send back
+            IP(raw(IP(src=router_ip, dst=PUBLIC_IP)/ICMP(type=11)/raw(
+                dns_request)[:28])),
+            IP(raw(IP(src=router_ip, dst=PUBLIC_IP)/ICMP(type=11)/IPerror(
+                raw(http_request)))),
+            # and the destination
+            IP(raw(IP(src="1.1.1.1", dst=PUBLIC_IP)/UDP(
+                sport=53, dport=40000 + ttl)/DNS(
+                qr=1, qd=DNSQR(qname="example.com"),
+                an=DNSRR(rrname="example.com", rdata="93.184.216.34")))),
+            IP(raw(IP(src="1.1.1.1", dst=PUBLIC_IP)/TCP(
+                sport=80, dport=50000 + ttl, flags="RA"))),
+        ]
+        ttl = ttl % 64 + 1
+    return packets[:number_of_packets]
+
+
+def benchmark(packet2json, packets):
+    start_time = time.perf_counter()
+    packet_dicts = [packet2json(packet, PUBLIC_IP) for packet in packets]
+    return time.perf_counter() - start_time, packet_dicts
+
+
+def main():
+    number_of_packets = 3000
+    if len(sys.argv) > 1:
+        number_of_packets = int(sys.argv[1])
+    packets = recorded_packets(number_of_packets)
+    show2_time, show2_dicts = benchmark(
+        utils.convert_packetlist.packet2json_show2, packets)
+    fields_time, fields_dicts = benchmark(
+        utils.convert_packetlist.packet2json, packets)
+    print("packets:      " + str(number_of_packets))
+    print("show2 text:   " + format(show2_time, '.3f') + " s")
+    print("field walk:   " + format(fields_time, '.3f') + " s")
+    print("speedup:      " + format(show2_time / fields_time, '.1f') + "x")
+    print("same output:  " + str(show2_dicts == fields_dicts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# the mean RTT of each hop from a measurement file, by reading the json
+# file again and from its parquet file, on a synthetic file with this many hops
+#
+#   python3 -m benchmarks.parquet [number of hops]
+import os
+import sys
+import tempfile
+import time
+
+import utils.json_stream
+import utils.parquet
+from benchmarks.json_stream import write_measurement_file
+
+
+def json_mean_rtt(json_path):
+    rtt_sums = {}
+    for measurement in utils.json_stream.iter_json_array(json_path):
+        for hop_step in measurement["result"]:
+            for result in hop_step["result"]:
+                if "rtt" in result.keys():
+                    rtt_sum = rtt_sums.setdefault(hop_step["hop"], [0, 0])
+                    rtt_sum[0] += result["rtt"]
+                    rtt_sum[1] += 1
+    return {hop: rtt_sum / count for hop, (rtt_sum, count) in rtt_sums.items()}
+
+
+def parquet_mean_rtt(parquet_path):
+    # only the two columns are read
+    hop_rtt = utils.parquet.pq.read_table(parquet_path, columns=["hop", "rtt"])
+    return {row["hop"]: row["rtt_mean"]
+            for row in hop_rtt.group_by("hop").aggregate([("rtt", "mean")]).to_pylist()}
+
+
+def measure(function, path):
+    start_time = time.perf_counter()
+    function(path)
+    return format(time.perf_counter() - start_time, '.2f') + " s"
+
+
+def main():
+    number_of_hops = 20000
+    if len(sys.argv) > 1:
+        number_of_hops = int(sys.argv[1])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_path = os.path.join(temp_dir, "measurement.json")
+        write_measurement_file(json_path, number_of_hops)
+        export_time = measure(utils.parquet.json2parquet, json_path)
+        parquet_path = utils.parquet.get_parquet_path(json_path)
+        print("hops:         " + str(number_of_hops))
+        print("file size:    " + format(os.path.getsize(json_path) / 1000000, '.1f')
+              + " MB json, " + format(os.path.getsize(parquet_path) / 1000000, '.2f')
+              + " MB parquet")
+        print("export        " + export_time)
+        print("json query    " + measure(json_mean_rtt, json_path))
+        print("parquet query " + measure(parquet_mean_rtt, parquet_path))
+
+
+if __name__ == "__main__":
+    main()
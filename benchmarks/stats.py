@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# the hop stats of utils.stats (numpy, the first time and with the columns
+# cache) and of a loop over the result dicts, on a synthetic measurement
+# file with this many hops
+#
+#   python3 -m benchmarks.stats [number of hops]
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import utils.json_stream
+import utils.stats
+
+HOPS_PER_MEASUREMENT = 30
+RESULTS_PER_HOP = 3
+DESTINATIONS = 200
+
+
+def make_measurements(number_of_hops):
+    random.seed(0)
+    measurements = []
+    measurement_steps = 0
+    while measurement_steps * HOPS_PER_MEASUREMENT < number_of_hops:
+        measurements.append({
+            "dst_addr": "10.1." + str(measurement_steps % DESTINATIONS) + ".1",
+            "result": [{"hop": hop, "result": [
+                {"x": "*"} if random.random() < 0.2 else
+                {"from": "10.0." + str(hop) + "." + str(random.randrange(4)),
+                 "rtt": random.uniform(1, 200), "size": 70,
+                 "ttl": random.choice([254, 253, 63])}
+                for _ in range(RESULTS_PER_HOP)]}
+                for hop in range(1, HOPS_PER_MEASUREMENT + 1)]})
+        measurement_steps += 1
+    return measurements
+
+
+def percentile(sorted_values, q):
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (
+        sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def get_backttl(ttl, hop):
+    if ttl <= 20:
+        return int((hop - ttl) / 2) + 1
+    elif ttl <= 64:
+        return 65 - ttl
+    elif ttl <= 128:
+        return 129 - ttl
+    return 256 - ttl
+
+
+def loop_hop_stats(measurements):
+    hops = {}
+    for measurement in measurements:
+        for try_step in measurement["result"]:
+            hop = hops.setdefault((measurement["dst_addr"], try_step["hop"]), {
+                "probes": 0, "rtts": [], "responders": set(), "backttls": {}})
+            for result in try_step["result"]:
+                hop["probes"] += 1
+                if "from" in result:
+                    hop["rtts"].append(result["rtt"])
+                    hop["responders"].add(result["from"])
+                    backttl = get_backttl(result["ttl"], try_step["hop"])
+                    hop["backttls"][backttl] = hop["backttls"].get(backttl, 0) + 1
+    hop_stats = {}
+    for hop_key, hop in hops.items():
+        rtts = sorted(hop["rtts"])
+        hop_stats[hop_key] = [hop["probes"], 1 - len(rtts) / hop["probes"],
+                              len(hop["responders"])]
+        if rtts:
+            hop_stats[hop_key] += [rtts[0], rtts[-1], sum(rtts) / len(rtts)] + [
+                percentile(rtts, q) for q in utils.stats.RTT_PERCENTILES]
+            backttl_count = max(hop["backttls"].values())
+            hop_stats[hop_key] += [backttl_count / len(rtts)]
+    return hop_stats
+
+
+def measure(make_stats, json_path):
+    start_time = time.perf_counter()
+    make_stats(json_path)
+    return format(time.perf_counter() - start_time, '.2f') + " s"
+
+
+def main():
+    number_of_hops = 300000
+    if len(sys.argv) > 1:
+        number_of_hops = int(sys.argv[1])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_path = os.path.join(temp_dir, "measurement.json")
+        with open(json_path, "w") as json_file:
+            json.dump(make_measurements(number_of_hops), json_file, indent=4)
+        print("hops:         " + str(number_of_hops))
+        print("file size:    " + format(
+            os.path.getsize(json_path) / 1000000, '.1f') + " MB")
+        print("loop          " + measure(lambda json_path: loop_hop_stats(
+            utils.json_stream.iter_json_array(json_path)), json_path))
+        for name in ["numpy", "numpy cached"]:
+            print(name.ljust(14) + measure(lambda json_path: utils.stats.get_hop_stats(
+                utils.stats.load_result_columns([json_path])), json_path))
+
+
+if __name__ == "__main__":
+    main()
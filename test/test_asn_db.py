@@ -0,0 +1,59 @@
+import gzip
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import utils.asn_db
+
+ASN_DB_LINES = [
+    "range_start\trange_end\tAS_number\tcountry_code\tAS_description",
+    "1.0.0.0\t1.0.0.255\t13335\tUS\tCLOUDFLARENET",
+    "10.0.0.0\t10.255.255.255\t0\tNone\tNot routed",
+    "2001:db8::\t2001:db8::ffff\t64501\tDE\tExample",
+]
+
+
+class TestAsnDatabase(unittest.TestCase):
+    def test_most_specific_prefix(self):
+        self.assertEqual(utils.asn_db.flatten_ranges([
+            (0, 255, 1, "NL"), (16, 31, 2, "DE"), (20, 23, 3, "FR"), (300, 400, 4, "")]), [
+            (0, 15, 1, "NL"), (16, 19, 2, "DE"), (20, 23, 3, "FR"), (24, 31, 2, "DE"),
+            (32, 255, 1, "NL"), (300, 400, 4, "")])
+
+    def test_load_ranges_and_prefixes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, "ip2asn.tsv.gz")
+            with gzip.open(db_path, "wt") as db_file:
+                db_file.write("\n".join(ASN_DB_LINES) + "\n")
+                # a prefix in a range, and a line we don't know
+                db_file.write("1.0.0.128/25,AS64500,nl\nbad line\n")
+            asn_db = utils.asn_db.load_asn_db(db_path)
+        self.assertEqual(asn_db.lookup("1.0.0.1"), ("AS13335", "US"))
+        self.assertEqual(asn_db.lookup("1.0.0.200"), ("AS64500", "NL"))
+        self.assertEqual(asn_db.lookup("2001:db8::1"), ("AS64501", "DE"))
+        # not routed, not in the file, and not an IP
+        self.assertEqual(asn_db.lookup_many(["10.0.0.1", "1.0.1.0", "***"]), [None, None, None])
+
+    def test_bulk_lookup(self):
+        random.seed(0)
+        ranges = [(4, first_ip, first_ip + random.randrange(1, 1 << 16),
+                   random.randrange(1, 1000), random.choice(["NL", "DE"]))
+                  for first_ip in range(0, 1 << 32, 1 << 20)]
+        asn_db = utils.asn_db.AsnDatabase(ranges)
+        ips = [".".join(str(random.randrange(256)) for _ in range(4))
+               for _ in range(utils.asn_db.BULK_LOOKUP_SIZE * 2)]
+        # numpy.searchsorted, if numpy is installed, and bisect
+        asn_infos = asn_db.lookup_many(ips + ["::1"])
+        bisect_asn_db = utils.asn_db.AsnDatabase(ranges)
+        self.assertEqual(asn_infos, [bisect_asn_db.lookup(ip) for ip in ips + ["::1"]])
+        self.assertNotEqual(asn_infos.count(None), len(asn_infos))
+
+    def test_lookup_cache_size(self):
+        asn_db = utils.asn_db.AsnDatabase([(4, 0, 255, 64500, "NL")])
+        with mock.patch.object(utils.asn_db, "LOOKUP_CACHE_SIZE", 2):
+            for ip in ["0.0.0.1", "0.0.0.2", "0.0.0.1", "0.0.0.3"]:
+                self.assertEqual(asn_db.lookup(ip), ("AS64500", "NL"))
+        # the least recently used one is dropped
+        self.assertEqual(list(asn_db.lookup_cache.keys()), ["0.0.0.1", "0.0.0.3"])
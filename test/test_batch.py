@@ -0,0 +1,36 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import utils.batch
+
+MEASUREMENT_PATH = os.path.join(
+    os.path.dirname(__file__), "data", "dns-trace.json")
+
+
+class TestVisBatch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for file_name in ["dns-trace-1.json", "dns-trace-2.json"]:
+            shutil.copy(MEASUREMENT_PATH, os.path.join(self.temp_dir.name, file_name))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_directory(self):
+        self.assertEqual(
+            utils.batch.vis_batch(self.temp_dir.name, 2, False, "backttl"), (2, 0))
+        for file_name in ["dns-trace-1.html", "dns-trace-2.html"]:
+            self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, file_name)))
+        # the graphs are newer than the measurement files now
+        self.assertEqual(
+            utils.batch.vis_batch(self.temp_dir.name, 2, False, "backttl"), (0, 0))
+
+    def test_glob_and_outdated_graph(self):
+        measurement_path = os.path.join(self.temp_dir.name, "dns-trace-1.json")
+        utils.batch.vis_batch(measurement_path, 1, False)
+        os.utime(measurement_path, (
+            os.path.getmtime(measurement_path) + 10,) * 2)
+        self.assertEqual(utils.batch.vis_batch(
+            os.path.join(self.temp_dir.name, "dns-trace-*.json"), 2, True), (2, 0))
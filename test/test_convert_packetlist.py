@@ -0,0 +1,40 @@
+import unittest
+
+from scapy.all import DNS, DNSQR, DNSRR, ICMP, IP, TCP, UDP, Raw, raw
+from scapy.layers.inet import IPerror
+
+import utils.convert_packetlist
+
+PUBLIC_IP = "198.51.100.7"
+
+
+class TestPacket2Json(unittest.TestCase):
+    def assertSameAsShow2(self, packet):
+        packet_dict = utils.convert_packetlist.packet2json(packet, PUBLIC_IP)
+        self.assertEqual(
+            packet_dict,
+            utils.convert_packetlist.packet2json_show2(packet, PUBLIC_IP))
+        self.assertEqual(
+            list(packet_dict),
+            list(utils.convert_packetlist.packet2json_show2(packet, PUBLIC_IP)))
+        return packet_dict
+
+    def test_not_built_packet(self):
+        dns_request = IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=3)/UDP(
+            sport=40000, dport=53)/DNS(rd=1, qd=DNSQR(qname="example.com"))
+        packet_dict = self.assertSameAsShow2(dns_request)
+        self.assertEqual(packet_dict["IP"]["src"], "127.1.2.7")
+        self.assertNotEqual(packet_dict["IP"]["chksum"], "None")
+        self.assertIn("|  qname", packet_dict["|###[ DNS Question Record"])
+
+    def test_received_packets(self):
+        http_request = IP(src=PUBLIC_IP, dst="1.1.1.1", flags="DF")/TCP(
+            sport=50000, dport=80, flags="PA")/Raw(b"GET / HTTP/1.1\r\n\r\n")
+        self.assertSameAsShow2(IP(raw(http_request)))
+        self.assertSameAsShow2(IP(raw(
+            IP(src="10.0.0.1", dst=PUBLIC_IP)/ICMP(type=11)/IPerror(
+                raw(http_request)))))
+        self.assertSameAsShow2(IP(raw(
+            IP(src="1.1.1.1", dst=PUBLIC_IP)/UDP(sport=53, dport=40000)/DNS(
+                qr=1, qd=DNSQR(qname="example.com"),
+                an=DNSRR(rrname="example.com", rdata="93.184.216.34")))))
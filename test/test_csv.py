@@ -0,0 +1,58 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+import utils.csv
+
+
+def measurement(dst_addr, hops):
+    return {"dst_addr": dst_addr, "proto": "UDP", "result": [
+        {"hop": hop, "result": [
+            {"from": "10.0." + str(hop) + ".1", "rtt": 1.5, "ttl": 254},
+            {"x": "*"}]}
+        for hop in hops]}
+
+
+class TestJson2Csv(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.measurement_path = os.path.join(self.temp_dir.name, "trace.json")
+        self.csv_path = os.path.join(self.temp_dir.name, "trace.csv")
+        with open(self.measurement_path, "w") as json_file:
+            json.dump([measurement("1.1.1.1", [1, 2, 3]),
+                       measurement("8.8.8.8", [1, 2])], json_file)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_rows(self):
+        with open(self.csv_path, newline='') as csv_file:
+            return list(csv.reader(csv_file))
+
+    def test_sorted_by_hop(self):
+        utils.csv.json2csv(self.measurement_path)
+        rows = self.read_rows()
+        self.assertEqual(rows[0], utils.csv.CSV_COLUMNS)
+        # a blank row after each hop, the file order in each hop
+        self.assertEqual([row[0] + " " + row[3] if row[0] else "" for row in rows[1:]], [
+            "1.1.1.1 1", "8.8.8.8 1", "", "1.1.1.1 2", "8.8.8.8 2", "", "1.1.1.1 3"])
+        # two results of three, the third one is empty
+        self.assertEqual(rows[1][4:13], ["10.0.1.1", "1.5", "254", "*", "*", "*", "", "", ""])
+
+    def test_order_of_file(self):
+        utils.csv.json2csv(self.measurement_path, False)
+        rows = self.read_rows()
+        self.assertEqual([row[0] + " " + row[3] if row[0] else "" for row in rows[1:]], [
+            "1.1.1.1 1", "1.1.1.1 2", "1.1.1.1 3", "", "8.8.8.8 1", "8.8.8.8 2"])
+
+    def test_invalid_json(self):
+        with open(self.measurement_path) as json_file:
+            json_str = json_file.read()
+        # the second measurement is cut
+        with open(self.measurement_path, "w") as json_file:
+            json_file.write(json_str[:-20])
+        utils.csv.json2csv(self.measurement_path)
+        # no half of a csv file
+        self.assertEqual(os.listdir(self.temp_dir.name), ["trace.json"])
@@ -0,0 +1,34 @@
+import socket
+import unittest
+
+import utils.ephemeral_port
+
+
+class TestEphemeralPortPool(unittest.TestCase):
+    def test_ports_are_reserved(self):
+        port_pool = utils.ephemeral_port.EphemeralPortPool("127.0.0.1", "udp")
+        ports = [port_pool.get_port() for _ in range(100)]
+        # no port is handed out again before its flow can be finished
+        self.assertEqual(len(set(ports)), 100)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            with self.assertRaises(OSError):
+                s.bind(("127.0.0.1", ports[0]))
+        port_pool.close()
+
+    def test_ports_are_recycled(self):
+        port_pool = utils.ephemeral_port.EphemeralPortPool(
+            "127.0.0.1", "tcp", reuse_time=0)
+        ports = [port_pool.get_port()
+                 for _ in range(utils.ephemeral_port.PORT_BLOCK_SIZE * 2)]
+        # round-robin over the first block, nothing more is reserved
+        self.assertEqual(len(set(ports)), utils.ephemeral_port.PORT_BLOCK_SIZE)
+        self.assertEqual(ports[:utils.ephemeral_port.PORT_BLOCK_SIZE],
+                         ports[utils.ephemeral_port.PORT_BLOCK_SIZE:])
+        port_pool.close()
+
+    def test_max_size(self):
+        port_pool = utils.ephemeral_port.EphemeralPortPool(
+            "127.0.0.1", "tcp", max_size=10)
+        ports = [port_pool.get_port() for _ in range(30)]
+        self.assertEqual(len(set(ports)), 10)
+        port_pool.close()
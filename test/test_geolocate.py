@@ -0,0 +1,99 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import utils.geolocate
+
+GEOLOCATION = (False, "203.0.113.9", "AS64500", "Example", "NL", "Amsterdam")
+NEW_GEOLOCATION = (False, "203.0.113.10", "AS64501", "Example 2", "DE", "Berlin")
+
+
+class TestGeolocationLookup(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir_env = os.environ.get(utils.geolocate.CACHE_DIR_ENV)
+        os.environ[utils.geolocate.CACHE_DIR_ENV] = self.temp_dir.name
+        self.start_geolocate = utils.geolocate.start_geolocate
+        self.geolocations = []
+        utils.geolocate.start_geolocate = lambda: self.geolocations.pop
+
+    def tearDown(self):
+        utils.geolocate.start_geolocate = self.start_geolocate
+        if self.cache_dir_env is None:
+            del os.environ[utils.geolocate.CACHE_DIR_ENV]
+        else:
+            os.environ[utils.geolocate.CACHE_DIR_ENV] = self.cache_dir_env
+        self.temp_dir.cleanup()
+
+    def test_cached(self):
+        self.geolocations.append(GEOLOCATION)
+        self.assertEqual(utils.geolocate.get_geolocation("eth0 10.0.0.2"), GEOLOCATION)
+        # the second time is from the cache, there is nothing to pop
+        self.assertEqual(utils.geolocate.get_geolocation("eth0 10.0.0.2"), GEOLOCATION)
+        self.geolocations.append(NEW_GEOLOCATION)
+        self.assertEqual(utils.geolocate.get_geolocation("eth1 10.0.1.2"), NEW_GEOLOCATION)
+
+    def test_not_cached_in_background(self):
+        self.geolocations.append(GEOLOCATION)
+        geolocation_lookup = utils.geolocate.GeolocationLookup("eth0 10.0.0.2")
+        self.assertEqual(geolocation_lookup.start(), utils.geolocate.DEFAULT_GEOLOCATION)
+        self.assertEqual(geolocation_lookup.wait(), GEOLOCATION)
+
+    def test_refreshed_in_background(self):
+        utils.geolocate.save_geolocation_cache("eth0 10.0.0.2", GEOLOCATION)
+        self.geolocations.append(NEW_GEOLOCATION)
+        geolocation_lookup = utils.geolocate.GeolocationLookup("eth0 10.0.0.2", cache_ttl=0)
+        self.assertEqual(geolocation_lookup.start(), GEOLOCATION)
+        self.assertEqual(geolocation_lookup.wait(), NEW_GEOLOCATION)
+        cached = utils.geolocate.load_geolocation_cache()["eth0 10.0.0.2"]
+        self.assertEqual(tuple(cached["geolocation"]), NEW_GEOLOCATION)
+        self.assertLessEqual(cached["time"], time.time())
+
+    def test_no_internet(self):
+        utils.geolocate.save_geolocation_cache("eth0 10.0.0.2", GEOLOCATION)
+        self.geolocations.append((True, "127.1.2.7", "AS0", "", "", ""))
+        geolocation_lookup = utils.geolocate.GeolocationLookup("eth0 10.0.0.2", cache_ttl=0)
+        geolocation_lookup.start()
+        # the old one, but we know there is no internet
+        self.assertEqual(geolocation_lookup.wait(), (True,) + GEOLOCATION[1:])
+        cached = utils.geolocate.load_geolocation_cache()["eth0 10.0.0.2"]
+        self.assertEqual(tuple(cached["geolocation"]), GEOLOCATION)
+
+
+@unittest.skipIf(os.name != "posix", "the geolocation process is only on posix")
+class TestPosixRunGeolocate(unittest.TestCase):
+    def setUp(self):
+        self.get_meta_vars = utils.geolocate.get_meta_vars
+        # the child is forked, so it has this one too
+        utils.geolocate.get_meta_vars = lambda: GEOLOCATION
+
+    def tearDown(self):
+        utils.geolocate.get_meta_vars = self.get_meta_vars
+
+    def test_no_polling(self):
+        start_time = time.time()
+        utils.geolocate.posix_run_geolocate()
+        self.assertLess(time.time() - start_time, 1)
+        # the child is joined
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_forked_before_the_refresh_thread(self):
+        forking_threads = []
+        process_start = multiprocessing.Process.start
+
+        def start(process):
+            forking_threads.append(threading.current_thread())
+            process_start(process)
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.dict(
+                os.environ, {utils.geolocate.CACHE_DIR_ENV: temp_dir}), mock.patch.object(
+                multiprocessing.Process, "start", start):
+            utils.geolocate.save_geolocation_cache("eth0 10.0.0.2", NEW_GEOLOCATION)
+            geolocation_lookup = utils.geolocate.GeolocationLookup("eth0 10.0.0.2", cache_ttl=0)
+            geolocation_lookup.start()
+            self.assertEqual(geolocation_lookup.wait(), GEOLOCATION)
+        # the trace has its own threads by the time the refresh thread runs
+        self.assertEqual(forking_threads, [threading.main_thread()])
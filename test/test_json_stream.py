@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+
+import utils.json_stream
+
+
+class TestIterJsonArray(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.temp_dir.name, "test.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_json(self, json_str):
+        with open(self.json_path, "w") as json_file:
+            json_file.write(json_str)
+
+    def test_same_as_json_load(self):
+        measurements = [{"dst_addr": "1.1.1." + str(i), "result": [
+            {"hop": hop, "result": [{"x": "*"}] * i}
+            for hop in range(1, 10)]} for i in range(20)]
+        self.write_json(json.dumps(measurements, indent=4))
+        # a small read size, so the items are split between the reads
+        self.assertEqual(
+            list(utils.json_stream.iter_json_array(self.json_path, read_size=16)),
+            measurements)
+
+    def test_empty_and_broken_files(self):
+        self.write_json(" [ ] ")
+        self.assertEqual(list(utils.json_stream.iter_json_array(self.json_path)), [])
+        self.write_json('[{"hop": 1}, {"hop": ')
+        with self.assertRaises(ValueError):
+            list(utils.json_stream.iter_json_array(self.json_path))
+        self.write_json('{"hop": 1}')
+        with self.assertRaises(ValueError):
+            list(utils.json_stream.iter_json_array(self.json_path))
+
+    def test_split_between_reads(self):
+        # a number split by the read size, and whitespace longer than a read
+        self.write_json(" " * 40 + "[1, 12, 123456789, 1.5e10, true, null, " + " " * 40 + "\"a\"]")
+        for read_size in range(1, 8):
+            self.assertEqual(
+                list(utils.json_stream.iter_json_array(self.json_path, read_size=read_size)),
+                [1, 12, 123456789, 1.5e10, True, None, "a"])
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import utils.asn_db
+import utils.jsonl
+from utils.traceroute_struct import traceroute_data
+
+
+class TestMeasurementWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.jsonl_path = os.path.join(self.temp_dir.name, "test.jsonl")
+        self.measurement = traceroute_data(
+            dst_addr="1.1.1.1", annotation="test", proto="UDP", port=53,
+            timestamp=1, src_addr="192.0.2.1", from_ip="198.51.100.1")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_hops(self, writer, hops):
+        writer.write_measurement(0, self.measurement)
+        for hop in range(1, hops + 1):
+            hop_result = {"from": "10.0.0." + str(hop), "rtt": 1.0, "size": 60,
+                          "ttl": 64, "summary": "", "packets": {}}
+            self.measurement.result.append({"hop": hop, "result": [hop_result]})
+            writer.write_hop(0, hop, hop_result)
+
+    def test_same_as_json_dump(self):
+        writer = utils.jsonl.MeasurementWriter(self.jsonl_path)
+        self.write_hops(writer, 3)
+        writer.close(2, True)
+        data_path = utils.jsonl.jsonl2json(self.jsonl_path, remove_jsonl=True)
+        self.measurement.set_endtime(2)
+        with open(data_path) as json_file:
+            self.assertEqual(json.load(json_file),
+                             json.loads(json.dumps([self.measurement],
+                                        default=lambda o: o.__dict__)))
+        self.assertFalse(os.path.exists(self.jsonl_path))
+
+    def test_interleaved_measurements(self):
+        # the hops of the measurements of a window are written in turns
+        second_measurement = traceroute_data(
+            dst_addr="8.8.8.8", annotation="test", proto="UDP", port=53,
+            timestamp=1, src_addr="192.0.2.1", from_ip="198.51.100.1")
+        writer = utils.jsonl.MeasurementWriter(self.jsonl_path)
+        writer.write_measurement(0, self.measurement)
+        writer.write_measurement(1, second_measurement)
+        for hop in range(1, 4):
+            for measurement_index, measurement in enumerate(
+                    [self.measurement, second_measurement]):
+                hop_result = {"from": "10.0." + str(measurement_index) + "." + str(hop)}
+                measurement.result.append({"hop": hop, "result": [hop_result]})
+                writer.write_hop(measurement_index, hop, hop_result)
+        writer.close(2, True)
+        with open(utils.jsonl.jsonl2json(self.jsonl_path)) as json_file:
+            json_str = json_file.read()
+        for measurement in [self.measurement, second_measurement]:
+            measurement.set_endtime(2)
+        self.assertEqual(json_str, json.dumps(
+            [self.measurement, second_measurement], default=lambda o: o.__dict__, indent=4))
+
+    def test_interrupted_trace(self):
+        writer = utils.jsonl.MeasurementWriter(self.jsonl_path)
+        self.write_hops(writer, 2)
+        # a crash in the middle of writing a line
+        writer._jsonl_file.write('{"type": "hop", "ind')
+        writer._jsonl_file.close()
+        with open(utils.jsonl.jsonl2json(self.jsonl_path)) as json_file:
+            measurements = json.load(json_file)
+        self.assertEqual(len(measurements[0]["result"]), 2)
+        self.assertEqual(measurements[0]["from_ip"], "127.1.2.7")
+        self.assertNotEqual(measurements[0]["endtime"], -1)
+
+    def test_update_and_mask_public_ip(self):
+        writer = utils.jsonl.MeasurementWriter(self.jsonl_path)
+        writer.write_measurement(0, self.measurement)
+        writer.write_hop(0, 1, {"from": "10.0.0.1", "packets": {
+            "sent": {"IP": {"src": "203.0.113.9"}}, "received": []}})
+        # a geolocation that was refreshed after the first hop
+        writer.update_measurement(0, {"asn": "AS64500", "cc": "NL"})
+        writer.close(2, True)
+        with open(utils.jsonl.jsonl2json(self.jsonl_path, public_ip="203.0.113.9")) as json_file:
+            measurement = json.load(json_file)[0]
+        self.assertEqual((measurement["asn"], measurement["cc"]), ("AS64500", "NL"))
+        self.assertEqual(len(measurement["result"]), 1)
+        self.assertEqual(
+            measurement["result"][0]["result"][0]["packets"]["sent"]["IP"]["src"], "127.1.2.7")
+
+    def test_asn_of_hops_at_once(self):
+        asn_db = utils.asn_db.AsnDatabase([(4, 0x0a000000, 0x0a0000ff, 64500, "NL")])
+        writer = utils.jsonl.MeasurementWriter(self.jsonl_path)
+        self.write_hops(writer, 3)
+        writer.close(2, True)
+        with mock.patch.object(asn_db, "lookup_many", wraps=asn_db.lookup_many) as lookup_many:
+            with open(utils.jsonl.jsonl2json(self.jsonl_path, asn_db=asn_db)) as json_file:
+                measurement = json.load(json_file)[0]
+        lookup_many.assert_called_once_with(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        self.assertEqual([(try_step["result"][0]["asn"], try_step["result"][0]["cc"])
+                          for try_step in measurement["result"]], [("AS64500", "NL")] * 3)
@@ -0,0 +1,28 @@
+import unittest
+
+import networkx as nx
+
+import utils.layout
+
+
+class TestHopLayout(unittest.TestCase):
+    def test_hop_columns(self):
+        graph = nx.MultiDiGraph()
+        graph.add_edges_from([
+            ("src", "hop1"), ("hop1", "hop2a"), ("hop1", "hop2b"),
+            ("hop2a", "dst1"), ("hop2b", "dst2"), ("src", "hop1")])
+        # a shorter route to the same node
+        graph.add_edge("src", "dst2")
+        positions = utils.layout.hop_layout(graph)
+        self.assertEqual(positions["src"], (0, 0))
+        self.assertEqual(positions["hop1"][0], utils.layout.HOP_SPACING)
+        self.assertEqual(positions["dst2"][0], utils.layout.HOP_SPACING)
+        self.assertEqual(positions["dst1"][0], 3 * utils.layout.HOP_SPACING)
+        self.assertEqual(
+            positions["hop2a"][1], -positions["hop2b"][1])
+        self.assertEqual(positions, utils.layout.hop_layout(graph))
+
+    def test_loop_without_first_node(self):
+        graph = nx.MultiDiGraph()
+        graph.add_edges_from([("a", "b"), ("b", "a")])
+        self.assertEqual(len(utils.layout.hop_layout(graph)), 2)
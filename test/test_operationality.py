@@ -30,9 +30,9 @@ class TestArguments(unittest.TestCase):
         args = tracevis.get_args([], auto_exit=False)
         expected = {'config_file': None, 'name': None, 'ips': None, 'packet': False, 'packet_input_method': 'hex', 
                     'packet_data': None, 'dns': False, 'dnstcp': False, 'continue': False, 'maxttl': None, 
-                    'timeout': None, 'repeat': None, 'ripe': None, 'ripemids': None, 'file': None, 'csv': False, 
-                    'csvraw': False, 'attach': False, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
-                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None}
+                    'timeout': None, 'adaptive_timeout': False, 'repeat': None, 'quiet_interval': None, 'ripe': None, 'ripemids': None, 'file': None, 'batch': None, 'csv': False, 
+                    'csvraw': False, 'parquet': False, 'parquet_packets': False, 'stats': False, 'attach': False, 'shared_assets': False, 'gzip_assets': False, 'layout': None, 'asn_db': None, 'rdns': False, 'rdns_server': None, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
+                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None, 'window': None, 'async': False, 'workers': None, 'pps': None, 'pcap': False}
         self.assertEqual(args, expected)
         sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
 
@@ -63,9 +63,9 @@ class TestArguments(unittest.TestCase):
         args = tracevis.get_args(['--dns'], auto_exit=False)
         expected = {'config_file': None, 'name': None, 'ips': None, 'packet': False, 'packet_input_method': None, 
                     'packet_data': None, 'dns': True, 'dnstcp': False, 'continue': False, 'maxttl': None, 
-                    'timeout': None, 'repeat': None, 'ripe': None, 'ripemids': None, 'file': None, 'csv': False, 
-                    'csvraw': False, 'attach': False, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
-                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None}
+                    'timeout': None, 'adaptive_timeout': False, 'repeat': None, 'quiet_interval': None, 'ripe': None, 'ripemids': None, 'file': None, 'batch': None, 'csv': False, 
+                    'csvraw': False, 'parquet': False, 'parquet_packets': False, 'stats': False, 'attach': False, 'shared_assets': False, 'gzip_assets': False, 'layout': None, 'asn_db': None, 'rdns': False, 'rdns_server': None, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
+                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None, 'window': None, 'async': False, 'workers': None, 'pps': None, 'pcap': False}
         self.assertEqual(args, expected)
         sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
 
@@ -76,9 +76,9 @@ class TestArguments(unittest.TestCase):
         args = tracevis.get_args(['--packet'], auto_exit=False)
         expected = {'config_file': None, 'name': None, 'ips': None, 'packet': True, 'packet_input_method': 'hex', 
                     'packet_data': None, 'dns': False, 'dnstcp': False, 'continue': False, 'maxttl': None, 
-                    'timeout': None, 'repeat': None, 'ripe': None, 'ripemids': None, 'file': None, 'csv': False, 
-                    'csvraw': False, 'attach': False, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
-                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None}
+                    'timeout': None, 'adaptive_timeout': False, 'repeat': None, 'quiet_interval': None, 'ripe': None, 'ripemids': None, 'file': None, 'batch': None, 'csv': False, 
+                    'csvraw': False, 'parquet': False, 'parquet_packets': False, 'stats': False, 'attach': False, 'shared_assets': False, 'gzip_assets': False, 'layout': None, 'asn_db': None, 'rdns': False, 'rdns_server': None, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
+                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None, 'window': None, 'async': False, 'workers': None, 'pps': None, 'pcap': False}
         self.assertEqual(args, expected)
         sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
 
@@ -89,33 +89,33 @@ class TestArguments(unittest.TestCase):
         args = tracevis.get_args(['--packet', '--packet-input-method', 'hex'], auto_exit=False)
         expected = {'config_file': None, 'name': None, 'ips': None, 'packet': True, 'packet_input_method': 'hex', 
                     'packet_data': None, 'dns': False, 'dnstcp': False, 'continue': False, 'maxttl': None, 
-                    'timeout': None, 'repeat': None, 'ripe': None, 'ripemids': None, 'file': None, 'csv': False, 
-                    'csvraw': False, 'attach': False, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
-                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None}
+                    'timeout': None, 'adaptive_timeout': False, 'repeat': None, 'quiet_interval': None, 'ripe': None, 'ripemids': None, 'file': None, 'batch': None, 'csv': False, 
+                    'csvraw': False, 'parquet': False, 'parquet_packets': False, 'stats': False, 'attach': False, 'shared_assets': False, 'gzip_assets': False, 'layout': None, 'asn_db': None, 'rdns': False, 'rdns_server': None, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
+                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None, 'window': None, 'async': False, 'workers': None, 'pps': None, 'pcap': False}
         self.assertEqual(args, expected)
 
         args = tracevis.get_args(['--packet', '--packet-input-method', 'json'], auto_exit=False)
         expected = {'config_file': None, 'name': None, 'ips': None, 'packet': True, 'packet_input_method': 'json', 
                     'packet_data': None, 'dns': False, 'dnstcp': False, 'continue': False, 'maxttl': None, 
-                    'timeout': None, 'repeat': None, 'ripe': None, 'ripemids': None, 'file': None, 'csv': False, 
-                    'csvraw': False, 'attach': False, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
-                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None}
+                    'timeout': None, 'adaptive_timeout': False, 'repeat': None, 'quiet_interval': None, 'ripe': None, 'ripemids': None, 'file': None, 'batch': None, 'csv': False, 
+                    'csvraw': False, 'parquet': False, 'parquet_packets': False, 'stats': False, 'attach': False, 'shared_assets': False, 'gzip_assets': False, 'layout': None, 'asn_db': None, 'rdns': False, 'rdns_server': None, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
+                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None, 'window': None, 'async': False, 'workers': None, 'pps': None, 'pcap': False}
         self.assertEqual(args, expected)
 
         args = tracevis.get_args(['--packet', '--packet-input-method', 'interactive'], auto_exit=False)
         expected = {'config_file': None, 'name': None, 'ips': None, 'packet': True, 'packet_input_method': 'interactive', 
                     'packet_data': None, 'dns': False, 'dnstcp': False, 'continue': False, 'maxttl': None, 
-                    'timeout': None, 'repeat': None, 'ripe': None, 'ripemids': None, 'file': None, 'csv': False, 
-                    'csvraw': False, 'attach': False, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
-                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None}
+                    'timeout': None, 'adaptive_timeout': False, 'repeat': None, 'quiet_interval': None, 'ripe': None, 'ripemids': None, 'file': None, 'batch': None, 'csv': False, 
+                    'csvraw': False, 'parquet': False, 'parquet_packets': False, 'stats': False, 'attach': False, 'shared_assets': False, 'gzip_assets': False, 'layout': None, 'asn_db': None, 'rdns': False, 'rdns_server': None, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
+                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None, 'window': None, 'async': False, 'workers': None, 'pps': None, 'pcap': False}
         self.assertEqual(args, expected)
 
         args = tracevis.get_args(['--packet', '--packet-input-method', 'json', '--packet-data', 'b64:e30='], auto_exit=False)
         expected = {'config_file': None, 'name': None, 'ips': None, 'packet': True, 'packet_input_method': 'json', 
                 'packet_data': 'b64:e30=', 'dns': False, 'dnstcp': False, 'continue': False, 'maxttl': None, 
-                    'timeout': None, 'repeat': None, 'ripe': None, 'ripemids': None, 'file': None, 'csv': False, 
-                    'csvraw': False, 'attach': False, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
-                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None}
+                    'timeout': None, 'adaptive_timeout': False, 'repeat': None, 'quiet_interval': None, 'ripe': None, 'ripemids': None, 'file': None, 'batch': None, 'csv': False, 
+                    'csvraw': False, 'parquet': False, 'parquet_packets': False, 'stats': False, 'attach': False, 'shared_assets': False, 'gzip_assets': False, 'layout': None, 'asn_db': None, 'rdns': False, 'rdns_server': None, 'label': None, 'domain1': None, 'domain2': None, 'annot1': None, 
+                    'annot2': None, 'rexmit': False, 'paris': False, 'options': 'new', 'iface': None, 'show_ifaces': False, 'port': None, 'window': None, 'async': False, 'workers': None, 'pps': None, 'pcap': False}
         self.assertEqual(args, expected)
         sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
         
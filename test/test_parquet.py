@@ -0,0 +1,102 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from scapy.all import ICMP, IP, UDP, raw
+from scapy.plist import QueryAnswer
+
+import utils.parquet
+import utils.pcap
+
+MEASUREMENT_PATH = os.path.join(
+    os.path.dirname(__file__), "data", "dns-trace.json")
+
+
+@unittest.skipIf(utils.parquet.pa is None, "pyarrow is not installed")
+class TestJson2Parquet(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.measurement_path = os.path.join(self.temp_dir.name, "dns-trace.json")
+        shutil.copy(MEASUREMENT_PATH, self.measurement_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_row_for_each_result(self):
+        result_path, packet_path = utils.parquet.json2parquet(
+            self.measurement_path, packets=True, row_group_size=3)
+        parquet_file = utils.parquet.pq.ParquetFile(result_path)
+        # two measurements, two hops, two repeats
+        self.assertEqual(parquet_file.metadata.num_rows, 8)
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        results = parquet_file.read().to_pylist()
+        self.assertEqual(
+            {key: results[1][key] for key in ["dst_addr", "hop", "repeat", "from_ip", "ttl"]},
+            {"dst_addr": "1.1.1.1", "hop": 1, "repeat": 1, "from_ip": "192.0.2.1", "ttl": 64})
+        packets = utils.parquet.pq.read_table(
+            packet_path, filters=[("layer", "=", "IP"), ("field", "=", "ttl"),
+                                  ("direction", "=", "sent")]).to_pylist()
+        self.assertEqual([packet["value"] for packet in packets if packet["measurement"] == 0],
+                         ["1", "1", "2", "2"])
+
+    def test_packets_in_pcap_file(self):
+        # a --pcap measurement only has the frame numbers of its packets
+        sent_packet = IP(raw(IP(src="198.51.100.7", dst="1.1.1.1", ttl=1)/UDP(
+            sport=40000, dport=53)))
+        time_exceeded = IP(raw(IP(src="192.0.2.1", dst="198.51.100.7", ttl=64)/ICMP(
+            type=11)/raw(sent_packet)[:28]))
+        packet_capture = utils.pcap.PacketCapture(
+            os.path.join(self.temp_dir.name, "trace.pcap"), "198.51.100.7")
+        answered_frames = packet_capture.write_packetlist(
+            [QueryAnswer(sent_packet, time_exceeded)], [])
+        unanswered_frames = packet_capture.write_packetlist([], [sent_packet])
+        packet_capture.close()
+        measurement_path = os.path.join(self.temp_dir.name, "trace.json")
+        with open(measurement_path, "w") as json_file:
+            json.dump([{"dst_addr": "1.1.1.1", "pcap": "trace.pcap", "result": [
+                {"hop": 1, "result": [
+                    {"from": "192.0.2.1", "rtt": 1.0, "size": 56, "ttl": 64,
+                     "packets": answered_frames},
+                    {"x": "*", "packets": unanswered_frames}]}]}], json_file)
+        _, packet_path = utils.parquet.json2parquet(measurement_path, packets=True)
+        packets = utils.parquet.pq.read_table(
+            packet_path, filters=[("layer", "=", "IP"), ("field", "=", "src")]).to_pylist()
+        self.assertEqual([(packet["direction"], packet["value"]) for packet in packets],
+                         [("sent", utils.pcap.MASKED_IP), ("received", "192.0.2.1")])
+
+    def test_probes_not_sent_past_destination(self):
+        measurement_path = os.path.join(self.temp_dir.name, "trace.json")
+        with open(measurement_path, "w") as json_file:
+            json.dump([{"dst_addr": "1.1.1.1", "result": [
+                {"hop": 1, "result": [{"x": "*"}, {"from": "1.1.1.1", "rtt": 1.0}]},
+                {"hop": 2, "result": [{"x": "-"}, {"x": "-"}]}]}], json_file)
+        result_path, = utils.parquet.json2parquet(measurement_path)
+        results = utils.parquet.pq.read_table(result_path).to_pylist()
+        # the lost probe is a row without a responder, the ones not sent are not rows
+        self.assertEqual([(result["hop"], result["repeat"], result["from_ip"])
+                          for result in results], [(1, 0, None), (1, 1, "1.1.1.1")])
+
+    def test_asn_of_each_responder(self):
+        measurement_path = os.path.join(self.temp_dir.name, "trace.json")
+        with open(measurement_path, "w") as json_file:
+            # the ASN of the measurement is the one of our own network
+            json.dump([{"dst_addr": "1.1.1.1", "asn": "AS64500", "cc": "NL", "result": [
+                {"hop": 1, "result": [{"from": "192.0.2.1", "rtt": 1.0}, {"x": "*"}]},
+                {"hop": 2, "result": [{"from": "1.1.1.1", "rtt": 2.0,
+                                       "asn": "AS13335", "cc": "US"}]}]}], json_file)
+        result_path, = utils.parquet.json2parquet(measurement_path)
+        results = utils.parquet.pq.read_table(result_path).to_pylist()
+        self.assertEqual([(result["asn"], result["cc"]) for result in results],
+                         [(None, None), (None, None), ("AS13335", "US")])
+
+    def test_invalid_json(self):
+        with open(self.measurement_path) as json_file:
+            json_str = json_file.read()
+        with open(self.measurement_path, "w") as json_file:
+            json_file.write(json_str[:-20])
+        with self.assertRaises(ValueError):
+            utils.parquet.json2parquet(self.measurement_path)
+        # no half of a parquet file
+        self.assertEqual(os.listdir(self.temp_dir.name), ["dns-trace.json"])
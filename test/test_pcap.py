@@ -0,0 +1,63 @@
+import os
+import socket
+import tempfile
+import unittest
+
+from scapy.all import DNS, DNSQR, ICMP, IP, UDP, raw
+from scapy.plist import QueryAnswer
+
+import utils.convert_packetlist
+import utils.pcap
+
+PUBLIC_IP = "198.51.100.7"
+
+
+class TestPacketCapture(unittest.TestCase):
+    def test_same_as_packetlist2json(self):
+        dns_request = IP(raw(IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=3)/UDP(
+            sport=40000, dport=53)/DNS(rd=1, qd=DNSQR(qname="example.com"))))
+        time_exceeded = IP(raw(IP(src="10.0.0.1", dst=PUBLIC_IP)/ICMP(
+            type=11)/raw(dns_request)[:28]))
+        answered = [QueryAnswer(dns_request, time_exceeded)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pcap_path = os.path.join(temp_dir, "test.pcap")
+            packet_capture = utils.pcap.PacketCapture(pcap_path, PUBLIC_IP)
+            unanswered_frames = packet_capture.write_packetlist([], [dns_request])
+            answered_frames = packet_capture.write_packetlist(answered, [])
+            packet_capture.close()
+            self.assertEqual(unanswered_frames, {'sent': 0, 'received': []})
+            self.assertEqual(answered_frames, {'sent': 1, 'received': [2]})
+            pcap_reader = utils.pcap.PacketCaptureReader(pcap_path)
+            packetlist = pcap_reader.packetlist2json(answered_frames)
+            pcap_reader.close()
+        self.assertEqual(
+            packetlist,
+            utils.convert_packetlist.packetlist2json(answered, [], PUBLIC_IP))
+        self.assertEqual(packetlist["received"][0]["IP"]["dst"], "127.1.2.7")
+        self.assertEqual(packetlist["received"][0]["IP in ICMP"]["src"], "127.1.2.7")
+
+    def test_mask_refreshed_public_ip(self):
+        # the public IP was refreshed during the trace, after these packets were written
+        new_public_ip = "203.0.113.9"
+        dns_request = IP(raw(IP(src=new_public_ip, dst="1.1.1.1", ttl=3)/UDP(
+            sport=40000, dport=53)/DNS(rd=1, qd=DNSQR(qname="example.com"))))
+        time_exceeded = IP(raw(IP(src="10.0.0.1", dst=new_public_ip)/ICMP(
+            type=11)/raw(dns_request)[:28]))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pcap_path = os.path.join(temp_dir, "test.pcap")
+            packet_capture = utils.pcap.PacketCapture(pcap_path, PUBLIC_IP)
+            answered_frames = packet_capture.write_packetlist(
+                [QueryAnswer(dns_request, time_exceeded)], [])
+            packet_capture.close()
+            pcap_size = os.path.getsize(pcap_path)
+            utils.pcap.mask_pcap_file(pcap_path, new_public_ip)
+            self.assertEqual(os.listdir(temp_dir), ["test.pcap"])
+            self.assertEqual(os.path.getsize(pcap_path), pcap_size)
+            with open(pcap_path, "rb") as pcap_file:
+                self.assertNotIn(socket.inet_aton(new_public_ip), pcap_file.read())
+            pcap_reader = utils.pcap.PacketCaptureReader(pcap_path)
+            packetlist = pcap_reader.packetlist2json(answered_frames)
+            pcap_reader.close()
+        self.assertEqual(packetlist["sent"]["IP"]["src"], "127.1.2.7")
+        self.assertEqual(packetlist["received"][0]["IP"]["dst"], "127.1.2.7")
+        self.assertEqual(packetlist["received"][0]["IP in ICMP"]["src"], "127.1.2.7")
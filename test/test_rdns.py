@@ -0,0 +1,144 @@
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from scapy.all import DNS, DNSRR
+
+import utils.geolocate
+import utils.rdns
+
+NAMES = {"192.0.2.1": "router1.example.net", "192.0.2.2": "router2.example.net"}
+NO_ANSWER_IP = "192.0.2.99"
+
+
+class StubDNSServer:
+    """ PTR answers of NAMES, NXDOMAIN for the others, and nothing for NO_ANSWER_IP """
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.number_of_queries = 0
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.server_socket.bind(("127.0.0.1", 0))
+        self.address = "127.0.0.1:" + str(self.server_socket.getsockname()[1])
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        while True:
+            try:
+                query_bytes, client_address = self.server_socket.recvfrom(4096)
+            except OSError:
+                return
+            self.number_of_queries += 1
+            # answered later in another thread, so the queries are not in a row
+            threading.Timer(self.delay, self.answer, (query_bytes, client_address)).start()
+
+    def answer(self, query_bytes, client_address):
+        query = DNS(query_bytes)
+        qname = query.qd.qname.decode()
+        ip = ".".join(reversed(qname.split(".in-addr.arpa")[0].split(".")))
+        if ip == NO_ANSWER_IP:
+            return
+        response = DNS(id=query.id, qr=1, rd=1, ra=1, qd=query.qd, rcode=3)
+        if ip in NAMES.keys():
+            response = DNS(id=query.id, qr=1, rd=1, ra=1, qd=query.qd, an=DNSRR(
+                rrname=qname, type="PTR", rdata=NAMES[ip] + "."))
+        self.server_socket.sendto(bytes(response), client_address)
+
+    def close(self):
+        self.server_socket.close()
+
+
+class TestParseDnsServer(unittest.TestCase):
+    def test_ipv4_and_ipv6(self):
+        for dns_server, host_and_port in [
+                ("192.0.2.53", ("192.0.2.53", 53)),
+                ("192.0.2.53:5353", ("192.0.2.53", 5353)),
+                ("2001:db8::53", ("2001:db8::53", 53)),
+                ("[2001:db8::53]", ("2001:db8::53", 53)),
+                ("[2001:db8::53]:5353", ("2001:db8::53", 5353))]:
+            self.assertEqual(utils.rdns.parse_dns_server(dns_server), host_and_port)
+        with self.assertRaises(ValueError):
+            utils.rdns.parse_dns_server("[2001:db8::53]5353")
+
+
+class TestReverseResolver(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir_env = os.environ.get(utils.geolocate.CACHE_DIR_ENV)
+        os.environ[utils.geolocate.CACHE_DIR_ENV] = self.temp_dir.name
+
+    def tearDown(self):
+        if self.cache_dir_env is None:
+            del os.environ[utils.geolocate.CACHE_DIR_ENV]
+        else:
+            os.environ[utils.geolocate.CACHE_DIR_ENV] = self.cache_dir_env
+        self.temp_dir.cleanup()
+
+    def test_names_and_cache(self):
+        dns_server = StubDNSServer()
+        ips = ["192.0.2.1", "192.0.2.2", "192.0.2.3", NO_ANSWER_IP, "192.0.2.1"]
+        names = utils.rdns.ReverseResolver(dns_server.address, timeout=0.5).resolve_many(ips)
+        self.assertEqual(names, {"192.0.2.1": "router1.example.net",
+                                 "192.0.2.2": "router2.example.net",
+                                 "192.0.2.3": None, NO_ANSWER_IP: None})
+        self.assertEqual(dns_server.number_of_queries, 4)
+        # the next run has them from the disk, only the one without an answer is asked again
+        names = utils.rdns.ReverseResolver(dns_server.address, timeout=0.5).resolve_many(ips)
+        self.assertEqual(names["192.0.2.1"], "router1.example.net")
+        self.assertEqual(dns_server.number_of_queries, 5)
+        dns_server.close()
+
+    def test_concurrent_queries(self):
+        dns_server = StubDNSServer(delay=0.2)
+        ips = ["198.51.100." + str(host) for host in range(1, 101)]
+        start_time = time.time()
+        names = utils.rdns.ReverseResolver(dns_server.address, workers=50).resolve_many(ips)
+        # 20 seconds one by one
+        self.assertLess(time.time() - start_time, 2)
+        self.assertEqual(list(names.values()), [None] * 100)
+        dns_server.close()
+
+    def test_system_resolver_timeout(self):
+        no_answer = threading.Event()
+        lookup_threads = []
+
+        def gethostbyaddr(ip):
+            lookup_threads.append(threading.current_thread())
+            if ip == NO_ANSWER_IP:
+                no_answer.wait()
+            return NAMES[ip], [], [ip]
+        start_time = time.time()
+        with mock.patch.object(socket, "gethostbyaddr", gethostbyaddr):
+            reverse_resolver = utils.rdns.ReverseResolver(timeout=0.2)
+            names = reverse_resolver.resolve_many(["192.0.2.1", NO_ANSWER_IP])
+            # the lookup that is still running does not keep the process running
+            self.assertTrue(all(lookup_thread.daemon for lookup_thread in lookup_threads))
+            no_answer.set()
+        self.assertLess(time.time() - start_time, 1)
+        self.assertEqual(names, {"192.0.2.1": "router1.example.net", NO_ANSWER_IP: None})
+        # asked again next time
+        self.assertNotIn(NO_ANSWER_IP, reverse_resolver.cache.keys())
+
+    def test_names_of_other_processes_are_kept(self):
+        dns_server = StubDNSServer()
+        # both loaded the cache before the other one saved it
+        first_resolver = utils.rdns.ReverseResolver(dns_server.address, timeout=0.5)
+        second_resolver = utils.rdns.ReverseResolver(dns_server.address, timeout=0.5)
+        first_resolver.resolve_many(["192.0.2.1"])
+        second_resolver.resolve_many(["192.0.2.2"])
+        self.assertEqual(sorted(utils.rdns.ReverseResolver().cache.keys()),
+                         ["192.0.2.1", "192.0.2.2"])
+        dns_server.close()
+
+    def test_least_recently_used_are_dropped(self):
+        reverse_resolver = utils.rdns.ReverseResolver(cache_size=2)
+        for ip in ["192.0.2.1", "192.0.2.2", "192.0.2.3"]:
+            reverse_resolver.cache[ip] = [time.time(), None]
+        reverse_resolver.cache.move_to_end("192.0.2.1")
+        reverse_resolver.save_cache()
+        self.assertEqual(list(utils.rdns.ReverseResolver().cache.keys()),
+                         ["192.0.2.3", "192.0.2.1"])
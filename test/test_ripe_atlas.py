@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import utils.geolocate
+import utils.ripe_atlas
+
+PROBE_ID = "1000"
+
+
+class StubAtlasHandler(BaseHTTPRequestHandler):
+    """ /api/v2/measurements/<ID>/latest/ of the RIPE Atlas API, keep-alive """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.paths.append(self.path)
+            server.client_ports.add(self.client_address[1])
+            too_many = server.too_many_requests > 0
+            server.too_many_requests -= 1
+        time.sleep(server.delay)
+        measurement_id = self.path.split('/')[4]
+        status = 200
+        results = [{"msm_id": int(measurement_id), "prb_id": int(PROBE_ID),
+                    "timestamp": int(time.time()), "dst_addr": "192.0.2.1", "result": []}]
+        if too_many:
+            status = 429
+            results = {"error": "too many requests"}
+        elif measurement_id == "404":
+            status = 404
+            results = {"error": "not found"}
+        elif measurement_id == "5999":
+            results = []
+        body = json.dumps(results).encode()
+        self.send_response(status)
+        if too_many:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDownloadFromAtlas(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir_env = os.environ.get(utils.geolocate.CACHE_DIR_ENV)
+        os.environ[utils.geolocate.CACHE_DIR_ENV] = self.temp_dir.name
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubAtlasHandler)
+        self.server.lock = threading.Lock()
+        self.server.paths = []
+        self.server.client_ports = set()
+        self.server.too_many_requests = 0
+        self.server.delay = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = "http://127.0.0.1:" + str(self.server.server_address[1]) + "/api/v2/"
+        self.output_dir = os.path.join(self.temp_dir.name, "output") + os.sep
+        os.makedirs(self.output_dir)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.cache_dir_env is None:
+            del os.environ[utils.geolocate.CACHE_DIR_ENV]
+        else:
+            os.environ[utils.geolocate.CACHE_DIR_ENV] = self.cache_dir_env
+        self.temp_dir.cleanup()
+
+    def test_download_and_cache(self):
+        was_successful, measurement_path = utils.ripe_atlas.download_from_atlas(
+            PROBE_ID, self.output_dir, measurement_ids=["5011", "404", "5013", "5011"],
+            base_url=self.base_url)
+        self.assertTrue(was_successful)
+        with open(measurement_path) as json_file:
+            self.assertEqual([measurement["msm_id"] for measurement in json.load(json_file)],
+                             [5011, 5013])
+        self.assertEqual(sorted(self.server.paths), [
+            "/api/v2/measurements/404/latest/?format=json&probe_ids=1000",
+            "/api/v2/measurements/5011/latest/?format=json&probe_ids=1000",
+            "/api/v2/measurements/5013/latest/?format=json&probe_ids=1000"])
+        # again for the same probe, only the one that failed is asked
+        utils.ripe_atlas.download_from_atlas(
+            PROBE_ID, self.output_dir, measurement_ids=["5011", "404", "5013"],
+            base_url=self.base_url)
+        self.assertEqual(len(self.server.paths), 4)
+
+    def test_no_results(self):
+        # no sys.exit, the caller decides
+        self.assertEqual(utils.ripe_atlas.download_from_atlas(
+            PROBE_ID, self.output_dir, measurement_ids=["5999", "../5011"],
+            base_url=self.base_url), (False, None))
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_retry_after_too_many_requests(self):
+        self.server.too_many_requests = 2
+        atlas_client = utils.ripe_atlas.AtlasClient(self.base_url, request_interval=0)
+        self.assertEqual(atlas_client.download_latest(5011, PROBE_ID)["msm_id"], 5011)
+        self.assertEqual(len(self.server.paths), 3)
+        atlas_client.close()
+
+    def test_concurrent_keep_alive(self):
+        self.server.delay = 0.2
+        measurement_ids = [str(measurement_id) for measurement_id in range(5001, 5009)]
+        atlas_client = utils.ripe_atlas.AtlasClient(
+            self.base_url, workers=4, request_interval=0.01)
+        start_time = time.time()
+        results = atlas_client.download_many(measurement_ids, PROBE_ID)
+        # 1.6 seconds one by one
+        self.assertLess(time.time() - start_time, 1.2)
+        self.assertEqual([result["msm_id"] for result in results],
+                         list(map(int, measurement_ids)))
+        # a connection for each worker, not for each request
+        self.assertLessEqual(len(self.server.client_ports), 4)
+        atlas_client.close()
@@ -0,0 +1,129 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import utils.geolocate
+import utils.json_stream
+import utils.stats
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def hop_result(hop, rtt, ttl):
+    if rtt is None:
+        return {"x": "*"}
+    return {"from": "10.0." + str(hop) + ".1", "rtt": rtt, "size": 70, "ttl": ttl}
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestHopStats(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_dir_env = mock.patch.dict(
+            os.environ, {utils.geolocate.CACHE_DIR_ENV: self.cache_dir.name})
+        self.cache_dir_env.start()
+
+    def tearDown(self):
+        self.cache_dir_env.stop()
+        self.cache_dir.cleanup()
+        self.temp_dir.cleanup()
+
+    def get_hop_stats(self, *all_measurements):
+        measurement_paths = []
+        for file_number, measurements in enumerate(all_measurements):
+            measurement_paths.append(os.path.join(
+                self.temp_dir.name, str(file_number) + ".json"))
+            with open(measurement_paths[-1], "w") as measurement_file:
+                json.dump(measurements, measurement_file)
+        return utils.stats.get_hop_stats(
+            utils.stats.load_result_columns(measurement_paths))
+
+    def test_loss_and_backttl(self):
+        hop_stats = self.get_hop_stats([{"dst_addr": "1.1.1.1", "annotation": "a", "result": [
+            {"hop": 1, "result": [
+                hop_result(1, 1.0, 64), hop_result(1, None, 0), hop_result(1, 3.0, 64)]},
+            {"hop": 2, "result": [
+                hop_result(2, 2.0, 254), hop_result(2, 4.0, 253), hop_result(2, 6.0, 254)]}]}],
+            # the same destination in another file
+            [{"dst_addr": "1.1.1.1", "annotation": "b", "result": [
+                {"hop": 1, "result": [hop_result(1, None, 0)] * 3}]}])
+        rows = list(utils.stats.stats_rows(hop_stats))
+        self.assertEqual([row[:7] for row in rows], [
+            ["1.1.1.1", "a", "1", "3", "2", "0.333", "1"],
+            ["1.1.1.1", "a", "2", "3", "3", "0.000", "1"],
+            ["1.1.1.1", "b", "1", "3", "0", "1.000", "0"]])
+        self.assertEqual(hop_stats["rtt_p50"][1], 4.0)
+        self.assertEqual(list(hop_stats["backttl"]), [1, 2, utils.stats.NO_RESPONSE])
+        self.assertAlmostEqual(hop_stats["backttl_stability"][1], 2 / 3)
+        self.assertEqual(rows[2][7:], ["*"] * 8)
+
+    def test_probes_not_sent_past_destination(self):
+        # the destination answered at hop 2, the other probes of it were not sent
+        hop_stats = self.get_hop_stats([{"dst_addr": "1.1.1.1", "result": [
+            {"hop": 1, "result": [hop_result(1, 1.0, 64), hop_result(1, None, 0)]},
+            {"hop": 2, "result": [hop_result(2, 2.0, 60), {"x": "-"}]},
+            {"hop": 3, "result": [{"x": "-"}, {"x": "-"}]}]}])
+        rows = list(utils.stats.stats_rows(hop_stats))
+        self.assertEqual([row[2:7] for row in rows], [
+            ["1", "2", "1", "0.500", "1"],
+            ["2", "1", "1", "0.000", "1"]])
+
+    def test_backttl_of_minus_one(self):
+        # (1 - 6) / 2 + 1, not a hop without responses
+        hop_stats = self.get_hop_stats([{"dst_addr": "1.1.1.1", "result": [
+            {"hop": 1, "result": [hop_result(1, 1.0, 6)]},
+            {"hop": 2, "result": [hop_result(2, None, 0)]}]}])
+        self.assertEqual([row[13] for row in utils.stats.stats_rows(hop_stats)], ["-1", "*"])
+
+    def test_same_as_numpy_percentile(self):
+        random.seed(7)
+        measurements = []
+        rtts = {}
+        for measurement_steps in range(20):
+            measurement = {"dst_addr": "1.1.1." + str(measurement_steps % 4), "result": []}
+            for hop in range(1, 6):
+                hop_rtts = [random.choice([None, random.uniform(1, 100)]) for _ in range(3)]
+                measurement["result"].append({"hop": hop, "result": [
+                    hop_result(hop, rtt, 60) for rtt in hop_rtts]})
+                rtts.setdefault((measurement["dst_addr"], hop), []).extend(
+                    rtt for rtt in hop_rtts if rtt is not None)
+            measurements.append(measurement)
+        # in two files, with the same IPs in both
+        hop_stats = self.get_hop_stats(measurements[:10], measurements[10:])
+        for row_number, destination in enumerate(hop_stats["destination"]):
+            hop_rtts = rtts[(destination, hop_stats["hop"][row_number])]
+            for percentile in utils.stats.RTT_PERCENTILES:
+                self.assertAlmostEqual(
+                    hop_stats["rtt_p" + str(percentile)][row_number],
+                    np.percentile(hop_rtts, percentile))
+            self.assertAlmostEqual(hop_stats["rtt_mean"][row_number], np.mean(hop_rtts))
+
+    def test_columns_cache(self):
+        measurement_path = os.path.join(self.temp_dir.name, "measurement.json")
+        with open(measurement_path, "w") as measurement_file:
+            json.dump([{"dst_addr": "1.1.1.1", "result": [
+                {"hop": 1, "result": [hop_result(1, 1.0, 64)]}]}], measurement_file)
+        utils.stats.load_result_columns([measurement_path])
+        # in the cache dir, not next to the measurement file
+        self.assertTrue(os.path.exists(utils.stats.get_columns_cache_path(measurement_path)))
+        self.assertEqual(os.listdir(self.temp_dir.name), ["measurement.json"])
+        # only the cache is read, while the file is not changed
+        with mock.patch.object(utils.json_stream, "iter_json_array", side_effect=ValueError):
+            result_columns = utils.stats.load_result_columns([measurement_path])
+        self.assertEqual(result_columns["destinations"], [("1.1.1.1", "-")])
+        self.assertEqual(list(result_columns["rtt"]), [1.0])
+        # a changed file with the old modification time is read again
+        old_mtime = os.path.getmtime(measurement_path)
+        with open(measurement_path, "w") as measurement_file:
+            json.dump([{"dst_addr": "8.8.8.8", "result": [
+                {"hop": 1, "result": [hop_result(1, 2.0, 64)]}]}], measurement_file)
+        os.utime(measurement_path, (old_mtime, old_mtime))
+        result_columns = utils.stats.load_result_columns([measurement_path])
+        self.assertEqual(result_columns["destinations"], [("8.8.8.8", "-")])
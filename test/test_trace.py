@@ -0,0 +1,193 @@
+import asyncio
+import random
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from scapy.all import ICMP, IP, UDP, Raw, raw
+
+import utils.ephemeral_port
+import utils.trace
+import utils.transport
+from test.test_transport import FakeL3Socket, time_exceeded
+
+
+class TestRTTEstimator(unittest.TestCase):
+    def test_unknown_path_uses_max_timeout(self):
+        estimator = utils.trace.RTTEstimator()
+        self.assertEqual(estimator.timeout("1.1.1.1", 1, 3), 3)
+
+    def test_timeout_follows_rtt(self):
+        estimator = utils.trace.RTTEstimator(min_timeout=0)
+        for _ in range(20):
+            estimator.add_rtt("1.1.1.1", 5, 40.0)
+        self.assertAlmostEqual(
+            estimator.timeout("1.1.1.1", 5, 3), 0.04 + utils.trace.RTT_GRANULARITY, places=2)
+        # a hop without samples uses the estimate of its destination
+        self.assertLess(estimator.timeout("1.1.1.1", 6, 3), 3)
+        self.assertEqual(estimator.timeout("8.8.8.8", 5, 3), 3)
+
+    def test_timeout_bounds_and_backoff(self):
+        estimator = utils.trace.RTTEstimator()
+        estimator.add_rtt("1.1.1.1", 1, 1.0)
+        self.assertEqual(estimator.timeout("1.1.1.1", 1, 3),
+                         utils.trace.ADAPTIVE_MIN_TIMEOUT)
+        estimator.add_rtt("1.1.1.1", 2, 5000.0)
+        self.assertEqual(estimator.timeout("1.1.1.1", 2, 3), 3)
+        first_timeout = estimator.timeout("1.1.1.1", 1, 3)
+        estimator.add_timeout("1.1.1.1", 1)
+        self.assertEqual(estimator.timeout("1.1.1.1", 1, 3), first_timeout * 2)
+
+
+class TestTraceTTLWindow(unittest.TestCase):
+    # the destination is this many hops away
+    DESTINATION_HOPS = {"192.0.2.10": 3, "192.0.2.20": 2}
+
+    def setUp(self):
+        self.session = utils.trace.TraceSession()
+        # the port pools bind to it
+        self.session.source_ip_address = "127.0.0.1"
+        self.random = random.Random(7)
+
+    def tearDown(self):
+        self.session.close_port_pools()
+
+    def responder(self, sent_packet):
+        # each packet has its own routers, so a mixed up reply is seen
+        if sent_packet.ttl >= self.DESTINATION_HOPS[sent_packet.dst]:
+            reply = IP(raw(IP(src=sent_packet.dst, dst=sent_packet.src)/ICMP(
+                type=3, code=3)/raw(sent_packet)[:28]))
+        else:
+            reply = time_exceeded(sent_packet, "10." + str(sent_packet[UDP].dport % 256)
+                                  + "." + str(sent_packet.ttl) + ".1")
+        # in a shuffled order
+        return [(self.random.uniform(0, 0.05), reply)]
+
+    def trace_window(self, request_packets, request_ips, first_ttl, last_ttl):
+        self.session.have_2_packet = len(request_packets) == 2
+        self.session.initialize_json_first_nodes(
+            request_ips, "a", "b", "UDP", "UDP", 53, 443, 30, 30, 0,
+            "198.51.100.7", "AS64496", "", "", "")
+        previous_node_ids = self.session.initialize_first_nodes_json(request_ips)
+        l3_socket = FakeL3Socket(self.responder)
+        with utils.transport.ProbeTransport(l3_socket=l3_socket) as probe_transport:
+            self.session.probe_transport = probe_transport
+            self.session.trace_ttl_window(
+                request_packets, request_ips, previous_node_ids, first_ttl, last_ttl,
+                timeout=2, continue_to_max_ttl=False)
+        self.session.probe_transport = None
+        return l3_socket.sent_packets
+
+    def get_hops(self, access_block_steps, ip_steps):
+        return [[result.get("from", result.get("x")) for result in hop["result"]]
+                for hop in self.session.measurement_data[access_block_steps][ip_steps].result]
+
+    def test_hops_in_order_with_shuffled_replies(self):
+        request_packets = [IP()/UDP(dport=53)/Raw(b"a"), IP()/UDP(dport=443)/Raw(b"b")]
+        request_ips = ["192.0.2.10", "192.0.2.20"]
+        sent_packets = self.trace_window(request_packets, request_ips, 1, 4)
+        # all the probes of the window are sent at once
+        self.assertEqual(len(sent_packets), 16)
+        # the two packets have the same destination and TTL, the IP id of
+        # the probe_key tells their replies apart
+        self.assertEqual(self.get_hops(0, 0), [
+            ["10.53.1.1"], ["10.53.2.1"], ["192.0.2.10"], ["-"]])
+        self.assertEqual(self.get_hops(1, 0), [
+            ["10.187.1.1"], ["10.187.2.1"], ["192.0.2.10"], ["-"]])
+        # the probes sent past the destination are not hops
+        self.assertEqual(self.get_hops(0, 1), [
+            ["10.53.1.1"], ["192.0.2.20"], ["-"], ["-"]])
+        self.assertEqual(self.get_hops(1, 1), [
+            ["10.187.1.1"], ["192.0.2.20"], ["-"], ["-"]])
+
+    def test_next_window_skips_reached_destinations(self):
+        request_packets = [IP()/UDP(dport=53)/Raw(b"a")]
+        request_ips = ["192.0.2.10", "192.0.2.20"]
+        self.session.have_2_packet = False
+        self.session.initialize_json_first_nodes(
+            request_ips, "a", "", "UDP", "", 53, -1, 30, -1, 0,
+            "198.51.100.7", "AS64496", "", "", "")
+        previous_node_ids = self.session.initialize_first_nodes_json(request_ips)
+        l3_socket = FakeL3Socket(self.responder)
+        with utils.transport.ProbeTransport(l3_socket=l3_socket) as probe_transport:
+            self.session.probe_transport = probe_transport
+            for first_ttl in [1, 3]:
+                self.session.trace_ttl_window(
+                    request_packets, request_ips, previous_node_ids, first_ttl,
+                    first_ttl + 1, timeout=2, continue_to_max_ttl=False)
+        self.session.probe_transport = None
+        # 192.0.2.20 was reached in the first window, so only 192.0.2.10 is probed again
+        self.assertEqual(sorted((sent_packet.dst, sent_packet.ttl)
+                                for sent_packet in l3_socket.sent_packets[4:]),
+                         [("192.0.2.10", 3), ("192.0.2.10", 4)])
+        self.assertEqual(self.get_hops(0, 0), [
+            ["10.53.1.1"], ["10.53.2.1"], ["192.0.2.10"], ["-"]])
+        self.assertEqual(self.get_hops(0, 1), [
+            ["10.53.1.1"], ["192.0.2.20"], ["-"], ["-"]])
+
+
+class TestTraceDestinationsAsync(unittest.TestCase):
+    # (hops to the destination, delay of each reply)
+    DESTINATIONS = {"192.0.2.10": (3, 0), "192.0.2.20": (2, 0.3)}
+
+    def setUp(self):
+        self.session = utils.trace.TraceSession()
+        self.session.source_ip_address = "127.0.0.1"
+
+    def tearDown(self):
+        self.session.close_port_pools()
+
+    def responder(self, sent_packet):
+        destination_hops, delay = self.DESTINATIONS[sent_packet.dst]
+        if sent_packet.ttl >= destination_hops:
+            return [(delay, IP(raw(IP(src=sent_packet.dst, dst=sent_packet.src)/ICMP(
+                type=3, code=3)/raw(sent_packet)[:28])))]
+        return [(delay, time_exceeded(sent_packet, "10.0." + str(sent_packet.ttl) + ".1"))]
+
+    def test_fast_destination_does_not_wait_for_slow_one(self):
+        request_ips = ["192.0.2.20", "192.0.2.10"]
+        self.session.have_2_packet = False
+        self.session.initialize_json_first_nodes(
+            request_ips, "a", "", "UDP", "", 53, -1, 30, -1, 0,
+            "198.51.100.7", "AS64496", "", "", "")
+        hop_times = []
+        add_hop = self.session.add_hop
+
+        def timed_add_hop(access_block_steps, ip_steps, hop, *hop_info):
+            hop_times.append((time.monotonic(), request_ips[ip_steps], hop))
+            add_hop(access_block_steps, ip_steps, hop, *hop_info)
+        self.session.add_hop = timed_add_hop
+
+        async def trace_in_running_loop():
+            with utils.transport.ProbeTransport(
+                    l3_socket=FakeL3Socket(self.responder)) as probe_transport:
+                self.session.probe_transport = probe_transport
+                return await self.session.trace_destinations_async(
+                    [IP()/UDP(dport=53)/Raw(b"a")], request_ips, 4, 2, 1,
+                    [False], False, False, False)
+        with mock.patch.object(utils.trace, "SLEEP_TIME", 0):
+            self.assertTrue(asyncio.run(trace_in_running_loop()))
+        fast_hops = [hop_time for hop_time in hop_times if hop_time[1] == "192.0.2.10"]
+        slow_hops = [hop_time for hop_time in hop_times if hop_time[1] == "192.0.2.20"]
+        # all the hops of the fast one are done before the first reply of the slow one
+        self.assertEqual([hop for _, _, hop in fast_hops], [1, 2, 3, 4])
+        self.assertLess(fast_hops[-1][0], slow_hops[0][0])
+        self.assertEqual([[result.get("from", result.get("x")) for result in hop["result"]]
+                          for hop in self.session.measurement_data[0][0].result],
+                         [["10.0.1.1"], ["192.0.2.20"], ["-"], ["-"]])
+
+    def test_one_port_pool_for_all_threads(self):
+        created_pools = []
+
+        class SlowPortPool(utils.ephemeral_port.EphemeralPortPool):
+            def __init__(self, *args, **kwargs):
+                # the other threads ask for a port meanwhile
+                time.sleep(0.05)
+                created_pools.append(self)
+                super().__init__(*args, **kwargs)
+        with mock.patch.object(utils.ephemeral_port, "EphemeralPortPool", SlowPortPool):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                ports = list(executor.map(self.session.get_source_port, ["udp"] * 8))
+        self.assertEqual(len(created_pools), 1)
+        self.assertEqual(len(set(ports)), 8)
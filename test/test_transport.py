@@ -0,0 +1,137 @@
+import queue
+import threading
+import time
+import unittest
+
+from scapy.all import ICMP, IP, TCP, UDP, raw
+
+import utils.transport
+
+PUBLIC_IP = "198.51.100.7"
+
+
+def time_exceeded(sent_packet, router_ip):
+    # a router quotes the IP header and the first 8 bytes of our packet
+    return IP(raw(IP(src=router_ip, dst=sent_packet.src)/ICMP(type=11)/raw(sent_packet)[:28]))
+
+
+class FakeL3Socket:
+    """ The send socket of an interface of scapy's L3PacketSocket, with no root """
+
+    def __init__(self, responder=None):
+        # responder(sent packet) -> [(delay, received packet)]
+        self.responder = responder
+        self.received_packets = queue.Queue()
+        self.sent_packets = []
+        self.recv_error = None
+        self.send_socks = {"eth0": self}
+
+    def add_interface(self, iface):
+        self.send_socks[iface] = FakeL3Socket()
+        return self.send_socks[iface]
+
+    def select(self, sockets, remain=None):
+        deadline = time.monotonic() + remain
+        while time.monotonic() < deadline:
+            ready_sockets = [sock for sock in self.send_socks.values()
+                             if sock.recv_error is not None or not sock.received_packets.empty()]
+            if ready_sockets:
+                return ready_sockets
+            time.sleep(0.001)
+        return []
+
+    def recv(self):
+        if self.recv_error is not None:
+            raise self.recv_error
+        return self.received_packets.get_nowait()
+
+    def send(self, packet):
+        packet.sent_time = time.time()
+        self.sent_packets.append(packet)
+        if self.responder is not None:
+            for delay, received_packet in self.responder(packet):
+                threading.Timer(delay, self.deliver, (received_packet,)).start()
+
+    def deliver(self, received_packet):
+        received_packet.time = time.time()
+        self.received_packets.put(received_packet)
+
+    def close(self):
+        pass
+
+
+class TestFlowKey(unittest.TestCase):
+    def test_quoted_headers_give_the_key_of_the_probe(self):
+        for probe in [
+                IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=3)/UDP(sport=40000, dport=53),
+                IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=3)/TCP(sport=40001, dport=443),
+                IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=3)/ICMP(id=7, seq=9)]:
+            probe = IP(raw(probe))
+            self.assertEqual(
+                utils.transport.reply_flow_key(time_exceeded(probe, "10.0.0.1")),
+                utils.transport.flow_key(probe))
+        self.assertEqual(
+            utils.transport.flow_key(IP(raw(
+                IP(src=PUBLIC_IP, dst="1.1.1.1")/UDP(sport=40000, dport=53)))),
+            ("1.1.1.1", 17, 40000, 53))
+
+    def test_reply_of_the_destination(self):
+        probe = IP(raw(IP(src=PUBLIC_IP, dst="1.1.1.1")/TCP(sport=40001, dport=443)))
+        reply = IP(raw(IP(src="1.1.1.1", dst=PUBLIC_IP)/TCP(
+            sport=443, dport=40001, flags="SA")))
+        self.assertEqual(utils.transport.reply_flow_key(reply),
+                         utils.transport.flow_key(probe))
+        # not an IP packet
+        self.assertIsNone(utils.transport.reply_flow_key(UDP(sport=53, dport=40001)))
+
+
+class TestProbeTransport(unittest.TestCase):
+    def test_dispatch_to_its_own_probe(self):
+        # two probes of the same flow, told apart by answers() (the TTL and
+        # IP id in the quoted header)
+        probes = [IP(raw(IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=ttl, id=100 + ttl)/UDP(
+            sport=40000, dport=53))) for ttl in [1, 2]]
+
+        def responder(sent_packet):
+            # the second hop answers first
+            return [(0.05 if sent_packet.ttl == 1 else 0,
+                     time_exceeded(sent_packet, "10.0.0." + str(sent_packet.ttl)))]
+        with utils.transport.ProbeTransport(
+                l3_socket=FakeL3Socket(responder)) as probe_transport:
+            answered, unanswered = probe_transport.sr(probes, timeout=2)
+        self.assertEqual(len(unanswered), 0)
+        self.assertEqual(sorted((sent.ttl, received.src) for sent, received in answered),
+                         [(1, "10.0.0.1"), (2, "10.0.0.2")])
+
+    def test_unrelated_reply_is_dropped(self):
+        probe = IP(raw(IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=1)/UDP(sport=40000, dport=53)))
+        other_probe = IP(raw(IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=1)/UDP(
+            sport=40002, dport=53)))
+        with utils.transport.ProbeTransport(l3_socket=FakeL3Socket(
+                lambda sent_packet: [(0, time_exceeded(other_probe, "10.0.0.1"))])
+        ) as probe_transport:
+            answered, unanswered = probe_transport.sr([probe], timeout=0.2)
+        self.assertEqual((len(answered), len(unanswered)), (0, 1))
+
+    def test_reply_on_another_interface(self):
+        l3_socket = FakeL3Socket()
+        other_socket = l3_socket.add_interface("eth1")
+        l3_socket.responder = lambda sent_packet: []
+        probe = IP(raw(IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=1)/UDP(sport=40000, dport=53)))
+        threading.Timer(0.05, other_socket.deliver,
+                        (time_exceeded(probe, "10.0.0.1"),)).start()
+        with utils.transport.ProbeTransport(l3_socket=l3_socket) as probe_transport:
+            answered, _ = probe_transport.sr([probe], timeout=2)
+        self.assertEqual(answered[0][1].src, "10.0.0.1")
+
+    def test_receive_error_fails_the_probes(self):
+        l3_socket = FakeL3Socket()
+        probe = IP(raw(IP(src=PUBLIC_IP, dst="1.1.1.1", ttl=1)/UDP(sport=40000, dport=53)))
+        probe_transport = utils.transport.ProbeTransport(l3_socket=l3_socket)
+        threading.Timer(
+            0.05, setattr, (l3_socket, "recv_error", OSError("network is down"))).start()
+        start_time = time.monotonic()
+        with self.assertRaises(OSError):
+            probe_transport.sr([probe], timeout=5)
+        self.assertLess(time.monotonic() - start_time, 1)
+        probe_transport.close()
@@ -0,0 +1,111 @@
+import ipaddress
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import utils.asn_db
+import utils.vis
+
+MEASUREMENT_PATH = os.path.join(
+    os.path.dirname(__file__), "data", "dns-trace.json")
+
+
+def edge_tooltip(elapsed_ms, repeat_step):
+    return dict(
+        current_request_color="HotPink", current_ttl_str="1", backttl="1",
+        request_ip="1.1.1.1", elapsed_ms=elapsed_ms, packet_size=70,
+        repeat_step=repeat_step, device_os_name="Linux", response_packet=None,
+        annotation="-")
+
+
+class TestAggregatedEdges(unittest.TestCase):
+    def test_same_edge_of_all_repeats(self):
+        graph_builder = utils.vis.GraphBuilder()
+        for repeat_step, elapsed_ms in [("1", 10.0), ("2", 30.0), ("3", 20.0)]:
+            graph_builder.visualize(
+                "src", "hop1", "10.0.0.1", "Linux", "purple",
+                edge_tooltip(elapsed_ms, repeat_step), "HotPink", "", "dot", 0)
+        # the same nodes in another measurement is another edge
+        graph_builder.visualize(
+            "src", "hop1", "10.0.0.1", "Linux", "purple",
+            edge_tooltip("*", "1"), "Red", "", "dot", 1)
+        graph_builder.add_aggregated_edges("rtt")
+        edges = list(graph_builder.multi_directed_graph.edges(data=True))
+        self.assertEqual(len(edges), 2)
+        self.assertEqual(edges[0][2]["label"], "20.000")
+        edge_tooltips = utils.vis.get_edge_tooltips(
+            [edge_data["tooltip"] for _, _, edge_data in edges])
+        columns = edge_tooltips["columns"]
+        self.assertEqual(columns["count"], [3, 1])
+        self.assertEqual(columns["rtt"], [20.0, None])
+        self.assertEqual(columns["rtt_min"], [10.0, None])
+        self.assertEqual(columns["rtt_max"], [30.0, None])
+        self.assertEqual(edge_tooltips["strings"][columns["repeat"][0]], "1, 2, 3")
+        # both measurements are to the same IP
+        self.assertEqual(edge_tooltips["requests"], [("HotPink", "1.1.1.1", "-")])
+
+
+class TestGraphBuilder(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.measurement_path = os.path.join(self.temp_dir.name, "dns-trace.json")
+        shutil.copy(MEASUREMENT_PATH, self.measurement_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_graph_of_measurement_file(self):
+        graph_builder = utils.vis.GraphBuilder()
+        graph_builder.vis(self.measurement_path, False, "backttl")
+        graph = graph_builder.multi_directed_graph
+        # the source, the first hop and the two destinations
+        self.assertEqual(graph.number_of_nodes(), 4)
+        # two hops of two measurements, the repeats are merged
+        self.assertEqual(graph.number_of_edges(), 4)
+        self.assertTrue(os.path.exists(
+            os.path.join(self.temp_dir.name, "dns-trace.html")))
+
+    def test_graphs_are_not_mixed(self):
+        first_graph_builder = utils.vis.GraphBuilder()
+        first_graph_builder.vis(self.measurement_path, False, "backttl")
+        second_graph_builder = utils.vis.GraphBuilder()
+        second_graph_builder.vis(self.measurement_path, False, "backttl")
+        self.assertEqual(
+            list(first_graph_builder.multi_directed_graph.edges(data=True)),
+            list(second_graph_builder.multi_directed_graph.edges(data=True)))
+
+    def test_as_boundaries(self):
+        asn_db = utils.asn_db.AsnDatabase([
+            (4, int(ipaddress.IPv4Address("192.0.2.0")),
+             int(ipaddress.IPv4Address("192.0.2.255")), 64500, "NL"),
+            (4, int(ipaddress.IPv4Address("1.1.1.0")),
+             int(ipaddress.IPv4Address("1.1.1.255")), 13335, "US")])
+        graph_builder = utils.vis.GraphBuilder(asn_db=asn_db)
+        with mock.patch.object(asn_db, "lookup", side_effect=asn_db.lookup) as lookup:
+            graph_builder.vis(self.measurement_path, False, "backttl")
+        # each hop IP is looked up once, before the graph is made
+        self.assertEqual(lookup.call_count, len(set(
+            call_args[0][0] for call_args in lookup.call_args_list)))
+        graph = graph_builder.multi_directed_graph
+        # 8.8.8.8 is not in the database, so only the edge to 1.1.1.1
+        self.assertEqual(
+            [graph.nodes[current_node_id]["label"]
+             for _, current_node_id, edge_data in graph.edges(data=True)
+             if edge_data.get("dashes")], ["1.1.1.1"])
+
+    def test_shared_assets(self):
+        utils.vis.vis(self.measurement_path, False, "backttl", shared_assets=True,
+                      gzip_assets=True)
+        shared_assets_dir = os.path.join(
+            self.temp_dir.name, utils.vis.SHARED_ASSETS_DIR_NAME)
+        self.assertEqual(sorted(os.listdir(shared_assets_dir)), [
+            "vis-network.min.js", "vis-network.min.js.gz", "vis.css", "vis.css.gz"])
+        with open(os.path.join(self.temp_dir.name, "dns-trace.html")) as graph_file:
+            graph_html = graph_file.read()
+        self.assertIn('src="tracevis_assets/vis-network.min.js"', graph_html)
+        # the edge tooltips are made on hover, by the script of edge_tooltips.js.jinja
+        self.assertEqual(graph_html.count("function edgeTooltipTitle"), 1)
+        self.assertNotIn('"title"', graph_html.split("var edgesData = ")[1].split(";")[0])
+        self.assertLess(len(graph_html), 50000)
@@ -9,12 +9,21 @@ import sys
 import textwrap
 from copy import deepcopy
 
+import utils.asn_db
+import utils.batch
 import utils.csv
 import utils.dns
 import utils.iface
+import utils.jsonl
+import utils.layout
 import utils.packet_input
+import utils.parquet
+import utils.rdns
 import utils.ripe_atlas
+import utils.shard
+import utils.stats
 import utils.trace
+import utils.transport
 import utils.vis
 
 TIMEOUT = 1
@@ -89,7 +98,8 @@ def get_args(sys_args, auto_exit=True):
     parser.add_argument('-n', '--name', action='store',
                         help="prefix for the graph file name")
     parser.add_argument('-i', '--ips', type=str,
-                        help="add comma-separated IPs (up to 6 for two packet and up to 12 for one packet)")
+                        help="add comma-separated IPs (up to 6 for two packet and up to 12 for one packet,\n\
+or any number with --workers)")
     parser.add_argument('-p', '--packet', action='store_true',
                         help="receive one or two packets from the IP layer via the terminal input and trace route with")
     parser.add_argument('--packet-input-method', dest='packet_input_method', choices=['json', 'hex', 'interactive'], default="hex",
@@ -109,20 +119,63 @@ def get_args(sys_args, auto_exit=True):
                         help="set max TTL (up to 255, default: 50)")
     parser.add_argument('-t', '--timeout', type=int,
                         help="set timeout in seconds for each request (default: 1 second)")
+    parser.add_argument('--adaptive-timeout', dest='adaptive_timeout', action='store_true',
+                        help="wait for each hop only as long as its RTT needs (up to the timeout)")
     parser.add_argument('-r', '--repeat', type=int,
                         help="set the number of repetitions of each request (default: 3 steps)")
+    parser.add_argument('--quiet-interval', dest='quiet_interval', type=float,
+                        help="stop waiting for more responses when there is none in this many seconds\n\
+after the expected one (TCP handshake, default: 0.5 second)")
+    parser.add_argument('-w', '--window', type=int,
+                        help="send the requests of this many TTL steps for all IPs at once (default: one by one)")
+    parser.add_argument('--async', action='store_true',
+                        help="trace each IP in its own coroutine, so IPs that reached the endpoint do not wait for the others")
+    parser.add_argument('--workers', type=int,
+                        help="split the IPs in groups of 12 and trace them in this many processes\n\
+(or visualize the files of --batch in this many processes, default: number of CPUs)")
+    parser.add_argument('--pps', type=float,
+                        help="max packets per second, for all the workers together")
+    parser.add_argument('--pcap', action='store_true',
+                        help="save the packets to a pcap file next to the measurement, instead of in the json file")
     parser.add_argument('-R', '--ripe', type=str,
                         help="download the latest traceroute measuremets of a RIPE Atlas probe via ID and visualize")
     parser.add_argument('-I', '--ripemids', type=str,
                         help="add comma-separated RIPE Atlas measurement IDs (up to 12)")
     parser.add_argument('-f', '--file', type=str, action='append', nargs='+',
-                        help="open a measurement file and visualize")
+                        help="open a measurement file (.json, or .jsonl of an interrupted trace) and visualize")
+    parser.add_argument('--batch', type=str,
+                        help="visualize all the measurement files of a directory or glob pattern (e.g. 'data/*.json'),\n\
+skipping the ones whose HTML file is newer than the json file")
     parser.add_argument('--csv', action='store_true',
                         help="create a sorted csv file instead of visualization")
     parser.add_argument('--csvraw', action='store_true',
                         help="create a raw csv file instead of visualization")
+    parser.add_argument('--parquet', action='store_true',
+                        help="create a parquet file with a row for each result instead of visualization (needs pyarrow)")
+    parser.add_argument('--parquet-packets', dest='parquet_packets', action='store_true',
+                        help="same as --parquet, and also a parquet file with the packet headers of the results")
+    parser.add_argument('--stats', action='store_true',
+                        help="print RTT percentiles, loss and back-TTL stability of each hop of the files\n\
+and save them to a csv file, instead of visualization (needs numpy)")
     parser.add_argument('-a', '--attach', action='store_true',
                         help="attach VisJS javascript and CSS to the HTML file (work offline)")
+    parser.add_argument('--shared-assets', dest='shared_assets', action='store_true',
+                        help="write VisJS javascript and CSS once to a tracevis_assets directory next to the HTML files\n\
+and link them from the HTML files (work offline, smaller files than --attach)")
+    parser.add_argument('--gzip-assets', dest='gzip_assets', action='store_true',
+                        help="same as --shared-assets, and also write gzip-compressed copies of them for web servers")
+    parser.add_argument('--layout', type=str, choices=utils.layout.LAYOUTS,
+                        help=textwrap.dedent("""place the nodes before saving the graph and turn off the physics (for big graphs)
+- hops: a column for each hop
+- spring: networkx spring layout (needs numpy)\n\n"""))
+    parser.add_argument('--asn-db', dest='asn_db', type=str,
+                        help="add the ASN and country of each hop from a local csv/tsv file of prefixes or IP ranges\n\
+(e.g. ip2asn-v4.tsv of iptoasn.com, or prefix,asn,country lines; .gz too) and mark the edges between ASes")
+    parser.add_argument('--rdns', action='store_true',
+                        help="add the reverse DNS (PTR) names of the hops to the graph, all of them at once after the trace\n\
+(cached in TRACEVIS_CACHE_DIR or ~/.cache/tracevis)")
+    parser.add_argument('--rdns-server', dest='rdns_server', type=str,
+                        help="same as --rdns, and ask this DNS server (IP, IP:port or [IPv6]:port) instead of the system resolver")
     parser.add_argument('-l', '--label', type=str,
                         help="set edge label: none, rtt, backttl. (default: backttl)")
     parser.add_argument('--domain1', type=str,
@@ -173,6 +226,11 @@ def main(args):
     timeout = TIMEOUT
     repeat_requests = REPEAT_REQUESTS
     attach_jscss = False
+    shared_assets = False
+    gzip_assets = False
+    layout = None
+    asn_db = None
+    reverse_resolver = None
     request_ips = []
     packet_1 = None
     annotation_1 = ""
@@ -190,6 +248,13 @@ def main(args):
     trace_with_retransmission = False
     iface = None
     dst_port = -1
+    ttl_window = 0
+    use_asyncio = False
+    quiet_interval = utils.trace.QUIET_INTERVAL
+    workers = 1
+    packet_rate_limiter = None
+    adaptive_timeout = False
+    save_pcap = False
     output_dir = os.getenv('TRACEVIS_OUTPUT_DIR', DEFAULT_OUTPUT_DIR)
     if not os.path.exists(output_dir):
         os.mkdir(output_dir)
@@ -211,6 +276,25 @@ def main(args):
         repeat_requests = args["repeat"]
     if args.get("attach"):
         attach_jscss = True
+    if args.get("shared_assets"):
+        shared_assets = True
+    if args.get("gzip_assets"):
+        shared_assets = True
+        gzip_assets = True
+    if args.get("layout"):
+        layout = args["layout"]
+    if args.get("asn_db"):
+        try:
+            asn_db = utils.asn_db.load_asn_db(args["asn_db"])
+        except OSError as e:
+            print(f"Error!\n{e!s}")
+            sys.exit(1)
+    if args.get("rdns") or args.get("rdns_server"):
+        try:
+            reverse_resolver = utils.rdns.ReverseResolver(args.get("rdns_server"))
+        except ValueError as e:
+            print(f"Error!\n{e!s}")
+            sys.exit(1)
     if args.get("annot1"):
         annotation_1 = args["annot1"]
     if args.get("annot2"):
@@ -223,6 +307,20 @@ def main(args):
         trace_with_retransmission = True
     if args.get("port"):
         dst_port = args["port"]
+    if args.get("window"):
+        ttl_window = args["window"]
+    if args.get("async"):
+        use_asyncio = True
+    if args.get("adaptive_timeout"):
+        adaptive_timeout = True
+    if args.get("workers"):
+        workers = args["workers"]
+    if args.get("pps"):
+        packet_rate_limiter = utils.transport.PacketRateLimiter(args["pps"])
+    if args.get("pcap"):
+        save_pcap = True
+    if args.get("quiet_interval") is not None:
+        quiet_interval = args["quiet_interval"]
     if args.get("options"):
         trace_options = args["options"].replace(' ', '').split(',')
         if "new" in trace_options and "rexmit" in trace_options:
@@ -280,16 +378,28 @@ def main(args):
             if args.get("packet") or args.get("rexmit"):
                 with input_packet as ctx:
                     packet_1, packet_2, do_tcph1, do_tcph2 = ctx
-            was_successful, measurement_path, no_internet = utils.trace.trace_route(
-                ip_list=request_ips, request_packet_1=packet_1, output_dir=output_dir,
+            trace_args = dict(
+                request_packet_1=packet_1, output_dir=output_dir,
                 max_ttl=max_ttl, timeout=timeout, repeat_requests=repeat_requests,
-                request_packet_2=packet_2, name_prefix=name_prefix,
+                request_packet_2=packet_2,
                 annotation_1=annotation_1, annotation_2=annotation_2,
                 continue_to_max_ttl=continue_to_max_ttl,
                 do_tcph1=do_tcph1, do_tcph2=do_tcph2,
                 trace_retransmission=trace_retransmission,
                 trace_with_retransmission=trace_with_retransmission, iface=iface,
-                dst_port=dst_port)
+                dst_port=dst_port, ttl_window=ttl_window,
+                use_asyncio=use_asyncio, quiet_interval=quiet_interval,
+                adaptive_timeout=adaptive_timeout, pcap=save_pcap, asn_db=asn_db)
+            if workers > 1 and len(request_ips) > utils.shard.SHARD_SIZE:
+                was_successful, shard_paths, no_internet = utils.shard.trace_route_sharded(
+                    ip_list=request_ips, workers=workers, name_prefix=name_prefix,
+                    packet_rate_limiter=packet_rate_limiter, **trace_args)
+                if was_successful:
+                    measurement_path = combine_json_files([shard_paths])
+            else:
+                was_successful, measurement_path, no_internet = utils.trace.trace_route(
+                    ip_list=request_ips, name_prefix=name_prefix,
+                    packet_rate_limiter=packet_rate_limiter, **trace_args)
         except Exception as e:
             print(f"Error!\n{e!s}")
             sys.exit(2)
@@ -303,6 +413,8 @@ def main(args):
         was_successful, measurement_path = utils.ripe_atlas.download_from_atlas(
             probe_id=args["ripe"], output_dir=output_dir, name_prefix=name_prefix,
             measurement_ids=measurement_ids)
+        if not was_successful:
+            sys.exit(1)
     if args.get("file"):
         try:
             # -f filename*.json
@@ -311,26 +423,61 @@ def main(args):
             # -f filename1.json -f filename2.json
             #       [['filename1.json'],['filename2.json']]
             #
-            if len(args["file"]) > 1 or len(args["file"][0]) > 1:
+            # a .jsonl file of an interrupted trace is finalised first
+            args["file"] = [
+                [utils.jsonl.jsonl2json(file_name) if file_name.endswith(".jsonl")
+                 else file_name for file_name in file_list]
+                for file_list in args["file"]]
+            if args.get("stats"):
+                # the files are read one by one, so they are not combined
+                measurement_paths = [
+                    file_name for file_list in args["file"] for file_name in file_list]
+            elif len(args["file"]) > 1 or len(args["file"][0]) > 1:
                 measurement_path = combine_json_files(args["file"])
             else:
                 measurement_path = args["file"][0][0]
         except Exception as e:
             print(f"Error!\n{e!s}")
             sys.exit(1)
-        if args.get("csv"):
+        if args.get("stats"):
+            try:
+                utils.stats.json2stats(measurement_paths)
+            except RuntimeError as e:
+                # numpy is not installed
+                print(f"Error!\n{e!s}")
+                sys.exit(1)
+        elif args.get("csv"):
             utils.csv.json2csv(measurement_path)
         elif args.get("csvraw"):
             utils.csv.json2csv(measurement_path, False)
+        elif args.get("parquet") or args.get("parquet_packets"):
+            try:
+                utils.parquet.json2parquet(
+                    measurement_path, packets=bool(args.get("parquet_packets")))
+            except (RuntimeError, ValueError, KeyError, OSError) as e:
+                # pyarrow is not installed, or a bad measurement or pcap file
+                print(f"Error!\n{e!s}")
+                sys.exit(1)
         else:
             was_successful = True
+    if args.get("batch"):
+        batch_workers = os.cpu_count()
+        if args.get("workers"):
+            batch_workers = args["workers"]
+        utils.batch.vis_batch(
+            batch_path=args["batch"], workers=batch_workers,
+            attach_jscss=attach_jscss, edge_lable=edge_lable,
+            shared_assets=shared_assets, gzip_assets=gzip_assets, layout=layout,
+            asn_db=asn_db, reverse_resolver=reverse_resolver)
     if was_successful:
         if not args.get("file"):
             config_dump_file_name = f"{os.path.splitext(measurement_path)[0]}.conf"
             dump_args_to_file(config_dump_file_name, args, input_packet)
         if utils.vis.vis(
                 measurement_path=measurement_path, attach_jscss=attach_jscss,
-                edge_lable=edge_lable):
+                edge_lable=edge_lable, shared_assets=shared_assets,
+                gzip_assets=gzip_assets, layout=layout, asn_db=asn_db,
+                reverse_resolver=reverse_resolver):
             print("finished.")
 
 
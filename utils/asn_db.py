@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+import gzip
+import ipaddress
+import socket
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BULK_LOOKUP_SIZE = 1000  # IPs, fewer are looked up one by one
+LOOKUP_CACHE_SIZE = 100000  # IPs, the least recently used ones are dropped
+
+
+def parse_asn(asn_str):
+    asn_str = asn_str.strip()
+    if asn_str.upper().startswith("AS"):
+        asn_str = asn_str[2:]
+    return int(asn_str)
+
+
+def parse_ip(ip_str):
+    # much faster than ipaddress, for the millions of lines of a dump
+    try:
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, ip_str), "big")
+    except OSError:
+        try:
+            return 6, int.from_bytes(socket.inet_pton(socket.AF_INET6, ip_str), "big")
+        except OSError:
+            raise ValueError("not an IP address: " + ip_str) from None
+
+
+def parse_asn_line(line):
+    """ (IP version, first IP, last IP, ASN, country) of a line of a prefix or range dump """
+    fields = line.split('\t') if '\t' in line else line.split(',')
+    fields = [field.strip() for field in fields]
+    if '/' in fields[0]:
+        # prefix,asn[,country], like a RIB dump
+        network_ip, prefix_length = fields[0].split('/')
+        version, first_ip = parse_ip(network_ip)
+        host_bits = (32 if version == 4 else 128) - int(prefix_length)
+        if host_bits < 0:
+            raise ValueError("prefix is too long: " + fields[0])
+        first_ip = first_ip >> host_bits << host_bits
+        last_ip = first_ip | ((1 << host_bits) - 1)
+        asn = parse_asn(fields[1])
+        country_code = fields[2] if len(fields) > 2 else ""
+    else:
+        # first ip,last ip,asn[,country[,name]], like ip2asn of iptoasn.com
+        version, first_ip = parse_ip(fields[0])
+        last_version, last_ip = parse_ip(fields[1])
+        if version != last_version:
+            raise ValueError("first and last IP are not of the same version")
+        asn = parse_asn(fields[2])
+        country_code = fields[3] if len(fields) > 3 else ""
+    if country_code == "None":
+        country_code = ""
+    return version, first_ip, last_ip, asn, country_code.upper()
+
+
+def flatten_ranges(ranges):
+    """ Overlapping ranges to ranges that don't overlap, the most specific one wins """
+    # the bigger range first, so a more specific one is always on top of it
+    ranges = sorted(ranges, key=lambda asn_range: (asn_range[0], -asn_range[1]))
+    flat_ranges = []
+    open_ranges = []
+    next_ip = 0
+
+    def add_flat_range(first_ip, last_ip, asn, country_code):
+        if first_ip > last_ip:
+            return
+        if (flat_ranges and flat_ranges[-1][1] == first_ip - 1
+                and flat_ranges[-1][2:] == (asn, country_code)):
+            flat_ranges[-1] = (flat_ranges[-1][0], last_ip, asn, country_code)
+        else:
+            flat_ranges.append((first_ip, last_ip, asn, country_code))
+
+    def close_ranges(until_ip):
+        nonlocal next_ip
+        while open_ranges and open_ranges[-1][1] < until_ip:
+            first_ip, last_ip, asn, country_code = open_ranges.pop()
+            add_flat_range(max(next_ip, first_ip), last_ip, asn, country_code)
+            next_ip = max(next_ip, last_ip + 1)
+
+    for asn_range in ranges:
+        close_ranges(asn_range[0])
+        if open_ranges:
+            # the part of the outer range before this one
+            add_flat_range(next_ip, asn_range[0] - 1, *open_ranges[-1][2:])
+        open_ranges.append(asn_range)
+        next_ip = max(next_ip, asn_range[0])
+    close_ranges(float("inf"))
+    return flat_ranges
+
+
+class AsnTable:
+    """ Ranges of one IP version that don't overlap, in sorted arrays for bisect """
+
+    def __init__(self, flat_ranges, typecode, asn_info_indexes):
+        self.first_ips = array(typecode) if typecode else []
+        self.last_ips = array(typecode) if typecode else []
+        # the index of ("AS<number>", country) in AsnDatabase.asn_infos
+        self.info_indexes = array('I')
+        for first_ip, last_ip, asn, country_code in flat_ranges:
+            self.first_ips.append(first_ip)
+            self.last_ips.append(last_ip)
+            self.info_indexes.append(asn_info_indexes.setdefault(
+                ("AS" + str(asn), country_code), len(asn_info_indexes)))
+
+    def __len__(self):
+        return len(self.info_indexes)
+
+    def find(self, ip_int):
+        range_index = bisect_right(self.first_ips, ip_int) - 1
+        if range_index >= 0 and ip_int <= self.last_ips[range_index]:
+            return self.info_indexes[range_index]
+        return None
+
+
+class AsnDatabase:
+    """ IP to ASN and country, offline, from a prefix or range dump """
+
+    def __init__(self, ranges=()):
+        v4_ranges = []
+        v6_ranges = []
+        for version, first_ip, last_ip, asn, country_code in ranges:
+            (v4_ranges if version == 4 else v6_ranges).append(
+                (first_ip, last_ip, asn, country_code))
+        asn_info_indexes = {}
+        # IPv6 addresses don't fit in an array, bisect works on lists too
+        self.v4_table = AsnTable(flatten_ranges(v4_ranges), 'I', asn_info_indexes)
+        self.v6_table = AsnTable(flatten_ranges(v6_ranges), None, asn_info_indexes)
+        # the same tuple for all the ranges of an AS, and None for no range
+        self.asn_infos = list(asn_info_indexes.keys()) + [None]
+        self.lookup_cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.v4_table) + len(self.v6_table)
+
+    def lookup(self, ip):
+        """ ("AS<number>", country code) of an IP, or None """
+        if ip in self.lookup_cache:
+            self.lookup_cache.move_to_end(ip)
+            return self.lookup_cache[ip]
+        try:
+            if ip.count('.') == 3:
+                # much faster than ipaddress, which is only needed for IPv6
+                table = self.v4_table
+                ip_int = int.from_bytes(socket.inet_aton(ip), "big")
+            else:
+                table = self.v6_table
+                ip_int = int(ipaddress.IPv6Address(ip))
+        except (OSError, ValueError):
+            return None
+        info_index = table.find(ip_int)
+        asn_info = None
+        if info_index is not None:
+            asn_info = self.asn_infos[info_index]
+        self.lookup_cache[ip] = asn_info
+        if len(self.lookup_cache) > LOOKUP_CACHE_SIZE:
+            self.lookup_cache.popitem(last=False)
+        return asn_info
+
+    def lookup_v4_bulk(self, ips):
+        # all the IPs at once with numpy.searchsorted, on the same memory as
+        # the arrays; they are not cached, there can be millions of them
+        ip_ints = np.frombuffer(b"".join(map(socket.inet_aton, ips)), dtype=">u4")
+        first_ips = np.frombuffer(self.v4_table.first_ips, dtype=np.uint32)
+        last_ips = np.frombuffer(self.v4_table.last_ips, dtype=np.uint32)
+        info_indexes = np.frombuffer(self.v4_table.info_indexes, dtype=np.uint32)
+        if len(first_ips) == 0:
+            return dict.fromkeys(ips)
+        range_indexes = (np.searchsorted(first_ips, ip_ints, side="right") - 1).clip(min=0)
+        found = (ip_ints >= first_ips[range_indexes]) & (ip_ints <= last_ips[range_indexes])
+        ip_info_indexes = np.where(found, info_indexes[range_indexes], len(self.asn_infos) - 1)
+        return dict(zip(ips, map(self.asn_infos.__getitem__, ip_info_indexes.tolist())))
+
+    def lookup_many(self, ips):
+        """ The lookup of each IP; the same IPs are looked up once """
+        unique_ips = list(dict.fromkeys(ips))
+        asn_infos = {}
+        if np is not None and len(unique_ips) >= BULK_LOOKUP_SIZE:
+            try:
+                asn_infos = self.lookup_v4_bulk(
+                    [ip for ip in unique_ips if ip.count('.') == 3])
+            except OSError:
+                pass  # one of them is not an IP, so one by one
+        if len(asn_infos) != len(unique_ips):
+            for ip in unique_ips:
+                if ip not in asn_infos:
+                    asn_infos[ip] = self.lookup(ip)
+        return list(map(asn_infos.__getitem__, ips))
+
+    def lookup_map(self, ips):
+        """ {IP: lookup of it}, for all the hops of a measurement at once """
+        return dict(zip(ips, self.lookup_many(ips)))
+
+
+def load_asn_db(db_path):
+    """ An AsnDatabase from a csv or tsv file (or .gz) with a prefix or range in each line """
+    open_db = gzip.open if db_path.endswith(".gz") else open
+    ranges = []
+    with open_db(db_path, "rt") as db_file:
+        for line in db_file:
+            if not line.strip() or line.startswith('#'):
+                continue
+            try:
+                version, first_ip, last_ip, asn, country_code = parse_asn_line(line)
+            except (ValueError, IndexError):
+                continue  # the header, or a line we don't know
+            # AS0 is "not routed" in the dumps
+            if asn != 0:
+                ranges.append((version, first_ip, last_ip, asn, country_code))
+    asn_db = AsnDatabase(ranges)
+    print("· - · · · loaded " + str(len(asn_db)) + " ASN ranges from "
+          + db_path + " · - · · ·")
+    return asn_db
+
+
+def annotate_result(result, asn_infos):
+    """ Add the ASN and country of the responder to a hop result, from lookup_map() """
+    if "from" in result.keys():
+        asn_info = asn_infos.get(result["from"])
+        if asn_info is not None:
+            result["asn"], result["cc"] = asn_info
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import glob
+import os
+from multiprocessing import Pool
+
+import utils.vis
+
+worker_template_env = None
+worker_asn_db = None
+worker_reverse_resolver = None
+
+
+def initialize_worker(asn_db, reverse_resolver):
+    global worker_template_env
+    global worker_asn_db
+    global worker_reverse_resolver
+    # the offline template is big, so each worker compiles it only once
+    worker_template_env = utils.vis.load_templates()
+    # and the ASN database is sent to each worker once, not with each file
+    worker_asn_db = asn_db
+    worker_reverse_resolver = reverse_resolver
+
+
+def find_measurement_files(batch_path):
+    if os.path.isdir(batch_path):
+        batch_path = os.path.join(batch_path, "*.json")
+    return sorted(glob.glob(batch_path))
+
+
+def is_graph_up_to_date(measurement_path):
+    graph_path = utils.vis.get_graph_path(measurement_path)
+    return (os.path.exists(graph_path) and
+            os.path.getmtime(graph_path) >= os.path.getmtime(measurement_path))
+
+
+def vis_file(measurement_path, attach_jscss, edge_lable, shared_assets, gzip_assets, layout):
+    try:
+        utils.vis.GraphBuilder(
+            worker_template_env, worker_asn_db, worker_reverse_resolver).vis(
+            measurement_path, attach_jscss, edge_lable, shared_assets, gzip_assets, layout)
+        return True
+    except Exception as e:
+        # one bad file should not stop the others
+        print("Error: " + measurement_path + ": " + str(e))
+        return False
+
+
+def vis_batch(batch_path, workers: int, attach_jscss, edge_lable: str = "none",
+              shared_assets=False, gzip_assets=False, layout=None, asn_db=None,
+              reverse_resolver=None):
+    measurement_paths = find_measurement_files(batch_path)
+    outdated_paths = [
+        measurement_path for measurement_path in measurement_paths
+        if not is_graph_up_to_date(measurement_path)]
+    print("· - · · · visualizing " + str(len(outdated_paths)) + " of "
+          + str(len(measurement_paths)) + " measurement files with "
+          + str(workers) + " workers · - · · ·")
+    if len(outdated_paths) == 0:
+        return 0, 0
+    with Pool(processes=workers, initializer=initialize_worker,
+              initargs=(asn_db, reverse_resolver)) as pool:
+        file_results = pool.starmap(vis_file, [
+            (measurement_path, attach_jscss, edge_lable, shared_assets, gzip_assets, layout)
+            for measurement_path in outdated_paths])
+    number_of_failed = file_results.count(False)
+    print("· · · - · -     · · · - · -     · · · - · -     · · · - · -")
+    print("visualized: " + str(len(outdated_paths) - number_of_failed)
+          + ", failed: " + str(number_of_failed) + ", up to date: "
+          + str(len(measurement_paths) - len(outdated_paths)))
+    return len(outdated_paths) - number_of_failed, number_of_failed
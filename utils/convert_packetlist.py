@@ -2,9 +2,108 @@
 
 from base64 import b64encode
 
+from scapy.all import Packet, raw
+from scapy.fields import ConditionalField
+
+SHOW_INDENT = 3  # == the default indent of show2()
+
+
+def is_dissected(packet_obj):
+    # a packet we received (or sent after building it) has the bytes of
+    # every layer in its cache, so building it again changes nothing
+    layer = packet_obj
+    while isinstance(layer, Packet) and layer.name != "NoPayload":
+        if layer.raw_packet_cache is None:
+            return False
+        layer = layer.payload
+    return True
+
+
+def add_show2_line(packet_dict, layer, line, packet_obj, public_ip):
+    # the same parsing as packet2json_show2(), for the rare values which
+    # have more than one line in show2()
+    if '###' in line:
+        layer = line.strip('#[] ')
+        packet_dict[layer] = {}
+    elif '=' in line:
+        key, val = line.split('=', 1)
+        val = val.replace(public_ip, '127.1.2.7')
+        if layer in ['Raw', 'payload'] and key.strip() == 'load':
+            packet_dict[layer][key.strip()] = b64encode(
+                packet_obj[layer].load).decode()
+        else:
+            packet_dict[layer][key.strip()] = val.strip()
+    return layer
+
+
+def add_layer_fields(
+        packet_dict, layer, this_layer, packet_obj, public_ip, lvl, label_lvl):
+    # walks the fields in the same order as show2(), so each layer and
+    # field gets the same key as with parsing the text of show2()
+    layer = (label_lvl + "###[ " + this_layer.name + " ]###").strip('#[] ')
+    packet_dict[layer] = {}
+    fields = this_layer.fields_desc.copy()
+    while fields:
+        field = fields.pop(0)
+        if isinstance(field, ConditionalField) and not field._evalcond(this_layer):
+            continue
+        field_key = field.name
+        if label_lvl:
+            # fields of a packet in a field are shown as "|  name = ..."
+            field_key = (label_lvl + lvl + "  " + field.name).strip()
+        if hasattr(field, "fields"):  # Field has subfields
+            packet_dict[layer][field_key] = ""
+            lvl += " " * SHOW_INDENT * this_layer.show_indent
+            for i, sub_field in enumerate(
+                    x for x in field.fields if hasattr(this_layer, x.name)):
+                fields.insert(i, sub_field)
+            continue
+        field_value = this_layer.getfieldval(field.name)
+        if isinstance(field_value, Packet) or (
+                field.islist and field.holds_packets and isinstance(field_value, list)):
+            if isinstance(field_value, Packet):
+                field_value = [field_value]
+            for sub_packet in field_value:
+                layer = add_layer_fields(
+                    packet_dict, layer, sub_packet, packet_obj, public_ip,
+                    "", label_lvl + lvl + "   |")
+            continue
+        repr_value = field.i2repr(this_layer, field_value)
+        if not isinstance(repr_value, str):
+            repr_value = str(repr_value)
+        if '###' in repr_value or '\n' in repr_value:
+            value_lines = repr_value.split('\n')
+            layer = add_show2_line(
+                packet_dict, layer, field_key + " = " + value_lines[0],
+                packet_obj, public_ip)
+            for value_line in value_lines[1:]:
+                layer = add_show2_line(
+                    packet_dict, layer, value_line, packet_obj, public_ip)
+        elif layer in ['Raw', 'payload'] and field_key == 'load':
+            packet_dict[layer][field_key] = b64encode(
+                packet_obj[layer].load).decode()
+        else:
+            packet_dict[layer][field_key] = repr_value.replace(
+                public_ip, '127.1.2.7').strip()
+    if this_layer.payload:
+        layer = add_layer_fields(
+            packet_dict, layer, this_layer.payload, packet_obj, public_ip,
+            lvl + " " * SHOW_INDENT * this_layer.show_indent, label_lvl)
+    return layer
+
 
-# this function source: https://stackoverflow.com/a/64410921
 def packet2json(packet_obj, public_ip):
+    packet_dict = {}
+    this_packet = packet_obj
+    if not is_dissected(packet_obj):
+        # like show2(), so automatic fields (len, chksum, ...) are calculated
+        this_packet = packet_obj.__class__(raw(packet_obj))
+    add_layer_fields(packet_dict, '', this_packet, packet_obj, public_ip, "", "")
+    return packet_dict
+
+
+# this function source: https://stackoverflow.com/a/64410921
+def packet2json_show2(packet_obj, public_ip):
     packet_dict = {}
     layer = ''
     for line in packet_obj.show2(dump=True).split('\n'):
@@ -36,3 +135,15 @@ def packetlist2json(answered, unanswered, public_ip):
             packetlist["received"].append(
                 packet2json(packet_obj=receivedp, public_ip=public_ip))
     return packetlist
+
+
+def mask_public_ip(packet_json, public_ip):
+    # the same as packet2json, for packets that are already in json
+    if isinstance(packet_json, dict):
+        return {key: mask_public_ip(value, public_ip)
+                for key, value in packet_json.items()}
+    if isinstance(packet_json, list):
+        return [mask_public_ip(value, public_ip) for value in packet_json]
+    if isinstance(packet_json, str):
+        return packet_json.replace(public_ip, '127.1.2.7')
+    return packet_json
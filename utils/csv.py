@@ -1,121 +1,131 @@
 #!/usr/bin/env python3
-import json
+import csv
 import os.path
+import shutil
+import tempfile
 
-csv_header_all = ""
-csv_blank_row = ""
-csv_prepared_row = ""
+import utils.json_stream
 
+REPEAT_COLUMNS = 3  # Results of each hop, the default repeat of a trace
+CSV_COLUMNS = (
+    ["destination_address", "protocol", "annotation", "hop"]
+    + [name + "_" + str(repeat_step)
+       for repeat_step in range(1, REPEAT_COLUMNS + 1)
+       for name in ["response_from", "rtt", "ttl"]]
+    + ["summary_" + str(repeat_step) for repeat_step in range(1, REPEAT_COLUMNS + 1)]
+)
+HOP_COLUMN = CSV_COLUMNS.index("hop")
+BLANK_ROW = [""] * len(CSV_COLUMNS)
 
-def prepare_csv_variables(keys):
-    global csv_header_all
-    global csv_blank_row
-    global csv_prepared_row
-    for item in keys:
-        csv_header_all += item + ','
-        csv_blank_row += ','
-        csv_prepared_row += "{" + item + "},"
-    csv_header_all += '\n'
-    csv_blank_row += '\n'
-    csv_prepared_row += '\n'
 
+def new_csv_writer(csv_file):
+    return csv.writer(csv_file, lineterminator='\n')
 
-def parse_json(file_name: str) -> list:
-    data = []
-    with open(file_name, "r") as jsonfile:
-        json_str = jsonfile.read()
-    try:
-        json_data = json.loads(json_str)
-    except:
-        print("JSON format is not valid!")
-        return ""
-    for measurement in json_data:
-        dst_addr = measurement["dst_addr"]
-        proto = measurement["proto"]
-        if "annotation" in measurement.keys():
-            annot = measurement["annotation"]
-        else:
-            annot = "-"
-        for hop_row in measurement["result"]:
-            hop = hop_row["hop"]
-            res_from = []
-            rtt = []
-            ttl = []
-            summary = []
+
+def hop_row(dst_addr, proto, annot, hop_step):
+    res_from = []
+    rtt = []
+    ttl = []
+    summary = []
+    skip_next = False
+    for result in hop_step["result"]:
+        if skip_next:
             skip_next = False
-            for result in hop_row["result"]:
-                if skip_next:
-                    skip_next = False
-                    continue
-                if "late" in result.keys():
-                    skip_next = True
-                if 'x' in result.keys():
-                    res_from.append(result["x"])
-                    rtt.append(result["x"])
-                    ttl.append(result["x"])
-                    summary.append("-")
-                else:
-                    res_from.append(result["from"])
-                    if "rtt" in result.keys():
-                        rtt.append(result["rtt"])
-                    else:
-                        rtt.append("*")
-                    ttl.append(result["ttl"])
-                    if "summary" in result.keys():
-                        summary.append(result["summary"])
-                    else:
-                        summary.append("-")
-            data.append({
-                "destination_address": dst_addr,
-                "protocol": proto,
-                "annotation": annot,
-                "hop": hop,
-                "response_from_1": res_from[0],
-                "rtt_1": rtt[0],
-                "ttl_1": ttl[0],
-                "response_from_2": res_from[1],
-                "rtt_2": rtt[1],
-                "ttl_2": ttl[1],
-                "response_from_3": res_from[2],
-                "rtt_3": rtt[2],
-                "ttl_3": ttl[2],
-                "summary_1": summary[0],
-                "summary_2": summary[1],
-                "summary_3": summary[2],
-            })
-    return data
+            continue
+        if "late" in result.keys():
+            skip_next = True
+        if 'x' in result.keys():
+            res_from.append(result["x"])
+            rtt.append(result["x"])
+            ttl.append(result["x"])
+            summary.append("-")
+        else:
+            res_from.append(result["from"])
+            rtt.append(result.get("rtt", "*"))
+            ttl.append(result["ttl"])
+            summary.append(result.get("summary", "-"))
+    # a trace with fewer repeats has empty cells
+    for column in [res_from, rtt, ttl, summary]:
+        column += [""] * (REPEAT_COLUMNS - len(column))
+    row = [dst_addr, proto, annot, hop_step["hop"]]
+    for repeat_step in range(REPEAT_COLUMNS):
+        row += [res_from[repeat_step], rtt[repeat_step], ttl[repeat_step]]
+    return row + summary[:REPEAT_COLUMNS]
+
+
+def iter_hop_rows(file_name: str):
+    """ Yield a csv row for each hop of each measurement, in the order of the file """
+    for measurement in utils.json_stream.iter_json_array(file_name):
+        dst_addr = measurement["dst_addr"]
+        proto = measurement.get("proto", "-")
+        annot = measurement.get("annotation", "-")
+        for hop_step in measurement["result"]:
+            yield hop_row(dst_addr, proto, annot, hop_step)
 
 
-def data_to_csv(data: list, sort_it: bool) -> str:
-    global csv_header_all
-    global csv_blank_row
-    global csv_prepared_row
-    csv_str = csv_header_all
+def write_rows(csv_file, rows):
+    # a blank row after each measurement
+    csv_writer = new_csv_writer(csv_file)
+    csv_writer.writerow(CSV_COLUMNS)
     last_hop = 1
-    for row in data:
-        if sort_it:
-            if row["hop"] > last_hop:
-                csv_str += csv_blank_row
-        else:
-            if row["hop"] < last_hop:
-                csv_str += csv_blank_row
-        csv_str += csv_prepared_row.format_map(row)
-        last_hop = row["hop"]
-    return csv_str
+    for row in rows:
+        if row[HOP_COLUMN] < last_hop:
+            csv_writer.writerow(BLANK_ROW)
+        csv_writer.writerow(row)
+        last_hop = row[HOP_COLUMN]
+
+
+def write_sorted_rows(csv_file, rows, temp_dir):
+    # bucket sort by hop, with a temporary csv file for each hop, so only
+    # one row is in memory; the rows of a hop stay in the order of the file
+    hop_files = {}
+    try:
+        for row in rows:
+            hop = row[HOP_COLUMN]
+            if hop not in hop_files.keys():
+                hop_files[hop] = open(
+                    os.path.join(temp_dir, str(hop) + ".csv"), "w+", newline='')
+            new_csv_writer(hop_files[hop]).writerow(row)
+        # a blank row after each hop
+        csv_writer = new_csv_writer(csv_file)
+        csv_writer.writerow(CSV_COLUMNS)
+        last_hop = 1
+        for hop in sorted(hop_files.keys()):
+            if hop > last_hop:
+                csv_writer.writerow(BLANK_ROW)
+            csv_file.flush()
+            hop_files[hop].seek(0)
+            shutil.copyfileobj(hop_files[hop], csv_file)
+            last_hop = hop
+    finally:
+        for hop_file in hop_files.values():
+            hop_file.close()
 
 
 def json2csv(file_name: str, sort_it: bool = True):
-    if os.path.isfile(file_name):
-        new_file_name = file_name.replace(".json", ".csv")
-        data = parse_json(file_name)
-        prepare_csv_variables(data[0].keys())
-        with open(new_file_name, "w") as csvfile:
-            if sort_it:
-                data = sorted(data, key=lambda d: d['hop'])
-            csv = data_to_csv(data, sort_it)
-            if csv != "":  # todo (xhdix): it will never be empty. we shold do better
-                print("saving measurement in csv...")
-                csvfile.write(csv)
-                print("saved: " + new_file_name)
-    else:
+    if not os.path.isfile(file_name):
         print("error: " + file_name + " does not exist!")
+        return
+    new_file_name = file_name.replace(".json", ".csv")
+    print("saving measurement in csv...")
+    # written next to the csv file and renamed, so a bad json file does
+    # not leave half of a csv file
+    temp_file, temp_path = tempfile.mkstemp(
+        suffix=".csv", dir=os.path.dirname(os.path.abspath(new_file_name)))
+    try:
+        with os.fdopen(temp_file, "w", newline='') as csvfile:
+            if sort_it:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    write_sorted_rows(csvfile, iter_hop_rows(file_name), temp_dir)
+            else:
+                write_rows(csvfile, iter_hop_rows(file_name))
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, new_file_name)
+    except (ValueError, KeyError):
+        os.remove(temp_path)
+        print("JSON format is not valid!")
+        return
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    print("saved: " + new_file_name)
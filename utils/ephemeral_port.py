@@ -1,7 +1,93 @@
 #!/usr/bin/env python3
 
+import collections
 import contextlib
 import socket
+import threading
+import time
+
+PORT_BLOCK_SIZE = 64
+MAX_PORT_POOL_SIZE = 512  # sockets, so we stay under the usual limit of 1024 files
+PORT_REUSE_TIME = 10  # Seconds
+
+
+class EphemeralPortPool:
+    """ Ports reserved once with bound sockets, and handed out round-robin """
+
+    def __init__(self, user_source_ip_address: str, proto: str = "tcp",
+                 reuse_time: float = PORT_REUSE_TIME,
+                 max_size: int = MAX_PORT_POOL_SIZE):
+        self.user_source_ip_address = user_source_ip_address
+        self.proto = proto
+        self.reuse_time = reuse_time
+        self.max_size = max_size
+        self._sockets = []
+        # (port, last time it was handed out), the least recently used first
+        self._ports = collections.deque()
+        self._lock = threading.Lock()
+
+    def _reserve_block(self):
+        socketkind = socket.SOCK_STREAM
+        ipproto = socket.IPPROTO_TCP
+        if self.proto == "udp":
+            socketkind = socket.SOCK_DGRAM
+            ipproto = socket.IPPROTO_UDP
+        for _ in range(min(PORT_BLOCK_SIZE, self.max_size - len(self._sockets))):
+            s = socket.socket(socket.AF_INET, socketkind, ipproto)
+            try:
+                s.bind((self.user_source_ip_address, 0))
+            except:
+                s.close()
+                print("An error occurred when trying to bind to:" + str(self.user_source_ip_address))
+                print("It seems that the specified network interface is not connected to the network.")
+                print("Please make sure you are connected to the network or choose a correct iface.")
+                raise
+            if self.proto == "udp":
+                # the answers are read from the raw socket, not from this one
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1)
+            self._sockets.append(s)
+            self._ports.appendleft((s.getsockname()[1], 0))
+
+    def get_port(self):
+        with self._lock:
+            time_now = time.monotonic()
+            if len(self._ports) == 0 or (
+                    time_now - self._ports[0][1] < self.reuse_time):
+                # the flow of the oldest port may not be finished yet
+                self._reserve_block()
+            port, _ = self._ports.popleft()
+            self._ports.append((port, time_now))
+            return port
+
+    def close(self):
+        with self._lock:
+            for s in self._sockets:
+                s.close()
+            self._sockets = []
+            self._ports.clear()
+
+
+port_pools = {}
+port_pools_lock = threading.Lock()
+
+
+def get_port(user_source_ip_address: str, proto: str = "tcp"):
+    # one pool per source address and protocol, for the callers that don't
+    # keep their own (utils.trace.TraceSession does)
+    with port_pools_lock:
+        if (user_source_ip_address, proto) not in port_pools.keys():
+            port_pools[(user_source_ip_address, proto)] = EphemeralPortPool(
+                user_source_ip_address, proto)
+        port_pool = port_pools[(user_source_ip_address, proto)]
+    return port_pool.get_port()
+
+
+def close_port_pools():
+    with port_pools_lock:
+        for port_pool in port_pools.values():
+            port_pool.close()
+        port_pools.clear()
+
 
 # ephemeral_port_reserve() function is based on https://github.com/Yelp/ephemeral-port-reserve
 
@@ -4,12 +4,20 @@ import ctypes
 import json
 import os
 import platform
+import tempfile
 import time
-from multiprocessing import Process, RawArray, Value
+from multiprocessing import Event, Process, RawArray, Value
+from threading import Event as ThreadEvent
 from threading import Thread
 from urllib.request import Request, urlopen
 
 OS_NAME = platform.system()
+CACHE_DIR_ENV = "TRACEVIS_CACHE_DIR"
+GEOLOCATION_CACHE_NAME = "geolocation.json"
+GEOLOCATION_CACHE_TTL = 6 * 60 * 60  # Seconds
+PROCESS_JOIN_TIMEOUT = 1  # Seconds
+# no_internet, public_ip, network_asn, network_name, country_code, city
+DEFAULT_GEOLOCATION = (True, '127.1.2.7', 'AS0', '', '', '')
 
 
 def get_meta_json():
@@ -67,10 +75,24 @@ def get_meta_vars():
     return no_internet, public_ip, network_asn, network_name, country_code, city
 
 
-def posix_run_geolocate():
-    def get_meta(no_internet, public_ip, network_asn, network_name, country_code, city):
-        drop_privileges()
-        no_internet.value, public_ip.value, network_asn.value, network_name.value, country_code.value, city.value = get_meta_vars()
+def start_posix_geolocate():
+    """ Fork the geolocation process now, and return a function that waits for it """
+    def get_meta(no_internet, public_ip, network_asn, network_name, country_code, city, done):
+        try:
+            drop_privileges()
+            no_internet.value, public_ip.value, network_asn.value, network_name.value, country_code.value, city.value = get_meta_vars()
+        finally:
+            done.set()
+
+    def wait_geolocate():
+        # returns as soon as the child is done, not on the next second
+        done.wait(max(deadline - time.monotonic(), 0))
+        p.join(PROCESS_JOIN_TIMEOUT)
+        if p.is_alive():
+            # no answer in time, so it is not left behind
+            p.terminate()
+            p.join()
+        return no_internet.value, public_ip.value, network_asn.value, network_name.value, country_code.value, city.value
 
     user_meta_info_timeout = 10   # Seconds
     no_internet = Value(ctypes.c_bool, True)
@@ -81,20 +103,30 @@ def posix_run_geolocate():
     network_name = RawArray(ctypes.c_wchar, 100)
     country_code = RawArray(ctypes.c_wchar, 100)
     city = RawArray(ctypes.c_wchar, 100)
+    done = Event()
     p = Process(target=get_meta, daemon=True, args=(
-        no_internet, public_ip, network_asn, network_name, country_code, city))
+        no_internet, public_ip, network_asn, network_name, country_code, city, done))
     p.start()
-    user_meta_info_start_time = time.time()
-    while (time.time() - user_meta_info_start_time < user_meta_info_timeout) and no_internet.value:
-        time.sleep(1)
+    deadline = time.monotonic() + user_meta_info_timeout
+    return wait_geolocate
 
-    return no_internet.value, public_ip.value, network_asn.value, network_name.value, country_code.value, city.value
 
+def posix_run_geolocate():
+    return start_posix_geolocate()()
 
-def windows_run_geolocate():
+
+def start_windows_geolocate():
+    """ Start the geolocation thread now, and return a function that waits for it """
     def get_meta():
         nonlocal no_internet, public_ip, network_asn, network_name, country_code, city
-        no_internet, public_ip, network_asn, network_name, country_code, city = get_meta_vars()
+        try:
+            no_internet, public_ip, network_asn, network_name, country_code, city = get_meta_vars()
+        finally:
+            done.set()
+
+    def wait_geolocate():
+        done.wait(max(deadline - time.monotonic(), 0))
+        return no_internet, public_ip, network_asn, network_name, country_code, city
 
     user_meta_info_timeout = 10   # Seconds
     no_internet = True
@@ -103,22 +135,109 @@ def windows_run_geolocate():
     network_name = ''
     country_code = ''
     city = ''
-    user_meta_info_start_time = 0
+    done = ThreadEvent()
     p = Thread(target=get_meta, daemon=True)
     p.start()
-    user_meta_info_start_time = time.time()
-    while (time.time() - user_meta_info_start_time < user_meta_info_timeout) and no_internet:
-        time.sleep(1)
+    deadline = time.monotonic() + user_meta_info_timeout
+    return wait_geolocate
 
-    return no_internet, public_ip, network_asn, network_name, country_code, city
 
+def windows_run_geolocate():
+    return start_windows_geolocate()()
 
-def run_geolocate():
+
+def start_geolocate():
     # threat windows and other posix systems differently
     # windows get suspicious when we spawn an independent Process
     # so we need to use thread for that
     # in other posix systems we need dropping privilege and as
     # this is not possible in python threads we stick to process for those systems
     if os.name == "posix":
-        return posix_run_geolocate()
-    return windows_run_geolocate()
+        return start_posix_geolocate()
+    return start_windows_geolocate()
+
+
+def run_geolocate():
+    return start_geolocate()()
+
+
+def get_cache_dir():
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    return os.path.join(os.path.expanduser("~"), ".cache", "tracevis")
+
+
+def get_cache_key(iface, source_ip):
+    # the public IP, ASN, etc. change with the network we send from
+    return str(iface) + " " + str(source_ip)
+
+
+def load_geolocation_cache():
+    try:
+        with open(os.path.join(get_cache_dir(), GEOLOCATION_CACHE_NAME)) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_geolocation_cache(cache_key, geolocation):
+    geolocation_cache = load_geolocation_cache()
+    geolocation_cache[cache_key] = {"time": time.time(), "geolocation": list(geolocation)}
+    try:
+        os.makedirs(get_cache_dir(), exist_ok=True)
+        # only readable by us (mkstemp), it has the public IP
+        temp_file, temp_path = tempfile.mkstemp(suffix=".json", dir=get_cache_dir())
+        with os.fdopen(temp_file, "w") as cache_file:
+            json.dump(geolocation_cache, cache_file)
+        os.replace(temp_path, os.path.join(get_cache_dir(), GEOLOCATION_CACHE_NAME))
+    except OSError as e:
+        print(f"Notice: geolocation is not cached\n{e!s}")
+
+
+class GeolocationLookup:
+    """ The geolocation of a network, from the disk cache or refreshed in the background """
+
+    def __init__(self, cache_key, cache_ttl=GEOLOCATION_CACHE_TTL):
+        self.cache_key = cache_key
+        self.cache_ttl = cache_ttl
+        self.geolocation = None
+        self.refresh_thread = None
+
+    def refresh(self, wait_geolocate):
+        geolocation = wait_geolocate()
+        if not geolocation[0]:
+            save_geolocation_cache(self.cache_key, geolocation)
+            self.geolocation = geolocation
+        else:
+            # with no internet, the old one is better than the defaults
+            self.geolocation = (True,) + tuple(self.geolocation[1:])
+
+    def start(self):
+        """ The geolocation to start with; a missing or expired one is looked up in background """
+        cached = load_geolocation_cache().get(self.cache_key)
+        if cached is None:
+            # the defaults until wait()
+            self.geolocation = DEFAULT_GEOLOCATION
+        else:
+            self.geolocation = tuple(cached["geolocation"])
+        if cached is None or time.time() - cached["time"] >= self.cache_ttl:
+            print("· - · · · looking up IP, ASN, country, etc in background · - · · · ")
+            # forked here, before the trace starts its threads; the thread
+            # only waits for the process
+            self.refresh_thread = Thread(
+                target=self.refresh, args=(start_geolocate(),), daemon=True)
+            self.refresh_thread.start()
+        return self.geolocation
+
+    def wait(self):
+        """ The latest geolocation, after the background refresh """
+        if self.refresh_thread is not None:
+            self.refresh_thread.join()
+            self.refresh_thread = None
+        return self.geolocation
+
+
+def get_geolocation(cache_key):
+    geolocation_lookup = GeolocationLookup(cache_key)
+    geolocation_lookup.start()
+    return geolocation_lookup.wait()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+import json
+
+READ_SIZE = 1 << 16  # Characters
+
+
+def iter_json_array(json_path, read_size=READ_SIZE):
+    """ Yield the items of a json array file one by one, without loading all of it """
+    decoder = json.JSONDecoder()
+    with open(json_path) as json_file:
+        buffer = json_file.read(read_size).lstrip()
+        while buffer == "":
+            # the whitespace before the array can be longer than a read
+            more_data = json_file.read(read_size)
+            if more_data == "":
+                break
+            buffer = more_data.lstrip()
+        if not buffer.startswith('['):
+            raise ValueError("JSON array is expected in " + json_path)
+        position = 1
+        next_read_size = read_size
+        biggest_item_size = 0
+        end_of_file = False
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            try:
+                if position == len(buffer):
+                    raise ValueError("need more data")
+                item, item_end = decoder.raw_decode(buffer, position)
+                # a number at the end of the buffer, like 1 of 12, may go
+                # on in the next read; the item is complete before , or ]
+                delimiter = item_end
+                while delimiter < len(buffer) and buffer[delimiter] in ' \t\r\n':
+                    delimiter += 1
+                if delimiter == len(buffer) and not end_of_file:
+                    raise ValueError("need more data")
+            except ValueError:
+                if end_of_file:
+                    raise ValueError("JSON array is not complete in " + json_path)
+                # the item is not complete yet; the next read is bigger, so
+                # a big item is not decoded again and again
+                more_data = json_file.read(next_read_size)
+                end_of_file = len(more_data) < next_read_size
+                buffer = buffer[position:] + more_data
+                position = 0
+                next_read_size *= 2
+                continue
+            # read a few items at once, so most of them are decoded only once
+            biggest_item_size = max(biggest_item_size, item_end - position)
+            next_read_size = max(read_size, biggest_item_size * 4)
+            position = item_end
+            yield item
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+import json
+import os
+import textwrap
+from copy import copy
+
+import utils.asn_db
+import utils.convert_packetlist
+import utils.json_stream
+from utils.traceroute_struct import traceroute_data
+
+
+class MeasurementWriter:
+    """ Append each hop result to a JSON Lines file as soon as we have it """
+
+    def __init__(self, data_path):
+        self.data_path = data_path
+        self._jsonl_file = open(data_path, "w")
+
+    def _write(self, record):
+        self._jsonl_file.write(json.dumps(
+            record, default=lambda o: o.__dict__) + "\n")
+        # so a crash loses at most the hop we were tracing
+        self._jsonl_file.flush()
+
+    def write_measurement(self, measurement_index, measurement):
+        measurement_header = copy(measurement)
+        measurement_header.result = []
+        # the public IP of the probe is never written, as in the final file
+        measurement_header.set_endtime(-1)
+        self._write({"type": "measurement", "index": measurement_index,
+                     "measurement": measurement_header.__dict__})
+
+    def write_hop(self, measurement_index, hop, hop_result):
+        self._write({"type": "hop", "index": measurement_index,
+                     "hop": hop, "result": hop_result})
+
+    def update_measurement(self, measurement_index, fields):
+        # the results that are already written are kept
+        self._write({"type": "update", "index": measurement_index, "fields": fields})
+
+    def close(self, endtime, continue_to_max_ttl):
+        self._write({"type": "end", "endtime": endtime,
+                     "continue_to_max_ttl": continue_to_max_ttl})
+        self._jsonl_file.close()
+
+
+def index_jsonl(jsonl_path):
+    """ The offsets of the lines of each measurement, so they can be read one at a time """
+    measurement_offsets = {}
+    hop_ips = {}
+    endtime = -1
+    continue_to_max_ttl = False
+    offset = 0
+    with open(jsonl_path, "rb") as jsonl_file:
+        for line in jsonl_file:
+            line_offset = offset
+            offset += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # the last line of an interrupted run may be incomplete
+                print("Notice: skipping broken line in " + jsonl_path)
+                continue
+            if record["type"] == "end":
+                endtime = record["endtime"]
+                continue_to_max_ttl = record["continue_to_max_ttl"]
+                continue
+            measurement_offsets.setdefault(record["index"], []).append(line_offset)
+            if record["type"] == "hop" and "from" in record["result"].keys():
+                hop_ips[record["result"]["from"]] = None
+    if endtime == -1:
+        # the run was interrupted, so the last write is the best we have
+        endtime = int(os.path.getmtime(jsonl_path))
+    return measurement_offsets, list(hop_ips.keys()), endtime, continue_to_max_ttl
+
+
+def read_measurement(jsonl_file, line_offsets):
+    measurement = None
+    for line_offset in line_offsets:
+        jsonl_file.seek(line_offset)
+        record = json.loads(jsonl_file.readline())
+        if record["type"] == "measurement":
+            measurement = traceroute_data.__new__(traceroute_data)
+            measurement.__dict__.update(record["measurement"])
+        elif record["type"] == "hop":
+            result = measurement.result
+            while len(result) < record["hop"]:
+                result.append({"hop": len(result) + 1, "result": []})
+            result[record["hop"] - 1]["result"].append(record["result"])
+        elif record["type"] == "update":
+            measurement.__dict__.update(record["fields"])
+    return measurement
+
+
+def mask_public_ip(measurement, public_ip):
+    for try_step in measurement.result:
+        for result in try_step["result"]:
+            if "packets" in result.keys():
+                result["packets"] = utils.convert_packetlist.mask_public_ip(
+                    result["packets"], public_ip)
+
+
+def get_hop_ips(measurement_path):
+    """ The IPs of all the hops of a measurement file, once each """
+    hop_ips = {}
+    for measurement in utils.json_stream.iter_json_array(measurement_path):
+        for try_step in measurement["result"]:
+            for result in try_step["result"]:
+                if "from" in result.keys():
+                    hop_ips[result["from"]] = None
+    return list(hop_ips.keys())
+
+
+def jsonl2json(jsonl_path, remove_jsonl=False, public_ip=None, asn_db=None):
+    measurement_offsets, hop_ips, endtime, continue_to_max_ttl = index_jsonl(jsonl_path)
+    asn_infos = {}
+    if asn_db is not None:
+        # the ASN and country of each hop, from an utils.asn_db.AsnDatabase
+        asn_infos = asn_db.lookup_map(hop_ips)
+    data_path = os.path.splitext(jsonl_path)[0] + ".json"
+    # one measurement at a time, so the whole run is never in memory; the
+    # same file as json.dumps(measurements, indent=4)
+    with open(jsonl_path, "rb") as jsonl_file, open(data_path, "w") as jsonfile:
+        jsonfile.write("[")
+        for measurement_step, index in enumerate(sorted(measurement_offsets)):
+            measurement = read_measurement(jsonl_file, measurement_offsets[index])
+            measurement.set_endtime(endtime)
+            # a public IP that was found after the packets were saved
+            if public_ip is not None:
+                mask_public_ip(measurement, public_ip)
+            if asn_db is not None:
+                for try_step in measurement.result:
+                    for result in try_step["result"]:
+                        utils.asn_db.annotate_result(result, asn_infos)
+            if not continue_to_max_ttl:
+                measurement.clean_extra_result()
+            jsonfile.write(("," if measurement_step != 0 else "") + "\n")
+            jsonfile.write(textwrap.indent(json.dumps(
+                measurement, default=lambda o: o.__dict__, indent=4), " " * 4))
+        jsonfile.write("\n]" if measurement_offsets else "]")
+    if remove_jsonl:
+        os.remove(jsonl_path)
+    print("saved: " + data_path)
+    return data_path
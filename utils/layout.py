@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import networkx as nx
+
+LAYOUTS = ["hops", "spring"]
+HOP_SPACING = 250  # Pixels
+NODE_SPACING = 120  # Pixels
+SPRING_SCALE = 1000  # Pixels
+
+
+def get_node_depths(graph):
+    # each edge is one TTL step, so the depth of a node is its first hop
+    depths = {}
+    next_nodes = [node_id for node_id, in_degree in graph.in_degree() if in_degree == 0]
+    depth = 0
+    while next_nodes:
+        current_nodes = []
+        for node_id in next_nodes:
+            if node_id not in depths.keys():
+                depths[node_id] = depth
+                current_nodes.append(node_id)
+        next_nodes = [successor for node_id in current_nodes
+                      for successor in graph.successors(node_id)]
+        depth += 1
+    # only reachable in a loop, which has no first node
+    for node_id in graph.nodes():
+        if node_id not in depths.keys():
+            depths[node_id] = depth
+    return depths
+
+
+def hop_layout(graph):
+    """ A column for each hop, the nodes of a column in the order of their previous hops """
+    depths = get_node_depths(graph)
+    hops = {}
+    for node_id in graph.nodes():
+        hops.setdefault(depths[node_id], []).append(node_id)
+    positions = {}
+    node_orders = {}
+    for depth in sorted(hops.keys()):
+        def previous_hops_order(node_id):
+            previous_orders = [
+                node_orders[predecessor] for predecessor in graph.predecessors(node_id)
+                if predecessor in node_orders.keys() and depths[predecessor] < depth]
+            if len(previous_orders) == 0:
+                return 0
+            return sum(previous_orders) / len(previous_orders)
+        # sorted() is stable, so the same graph has the same layout every time
+        hop_nodes = sorted(hops[depth], key=previous_hops_order)
+        for node_order, node_id in enumerate(hop_nodes):
+            node_orders[node_id] = node_order - (len(hop_nodes) - 1) / 2
+            positions[node_id] = (
+                depth * HOP_SPACING, node_orders[node_id] * NODE_SPACING)
+    return positions
+
+
+def spring_layout(graph):
+    try:
+        spring_positions = nx.spring_layout(graph, seed=0, scale=SPRING_SCALE)
+    except ImportError:
+        raise RuntimeError(
+            "spring layout needs numpy (pip install numpy), or use the hops layout") from None
+    return {node_id: (float(x), float(y))
+            for node_id, (x, y) in spring_positions.items()}
+
+
+def get_node_positions(graph, layout):
+    if layout == "hops":
+        return hop_layout(graph)
+    elif layout == "spring":
+        return spring_layout(graph)
+    raise ValueError("unknown layout: " + str(layout))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+
+import utils.json_stream
+import utils.pcap
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+ROW_GROUP_SIZE = 100000  # Rows, in memory at once
+PACKETS_SUFFIX = "_packets"
+
+
+def get_result_schema():
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("measurement", pa.int32()), ("timestamp", pa.int64()),
+        ("dst_addr", category), ("proto", category), ("annotation", category),
+        ("hop", pa.int32()), ("repeat", pa.int32()), ("from_ip", category),
+        ("asn", category), ("cc", category),
+        ("rtt", pa.float64()), ("ttl", pa.int32()), ("size", pa.int32()),
+    ])
+
+
+def get_packet_schema():
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("measurement", pa.int32()), ("hop", pa.int32()), ("repeat", pa.int32()),
+        ("direction", category), ("packet", pa.int32()), ("layer", category),
+        ("field", category), ("value", pa.string()),
+    ])
+
+
+class ColumnWriter:
+    """ Rows in lists of columns, written to a parquet file a row group at a time """
+
+    def __init__(self, parquet_path, schema, row_group_size=ROW_GROUP_SIZE):
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.columns = {name: [] for name in schema.names}
+        self.number_of_rows = 0
+        self.parquet_writer = pq.ParquetWriter(parquet_path, schema)
+
+    def add_row(self, *values):
+        for column, value in zip(self.columns.values(), values):
+            column.append(value)
+        self.number_of_rows += 1
+        if self.number_of_rows >= self.row_group_size:
+            self.write_row_group()
+
+    def write_row_group(self):
+        if self.number_of_rows == 0:
+            return
+        self.parquet_writer.write_table(
+            pa.table(self.columns, schema=self.schema))
+        for column in self.columns.values():
+            column.clear()
+        self.number_of_rows = 0
+
+    def close(self):
+        self.write_row_group()
+        self.parquet_writer.close()
+
+
+def add_packet_rows(packet_writer, measurement_step, hop, repeat_step, packets):
+    # no sent packet is [], as in utils.convert_packetlist
+    sent_packets = [packets["sent"]] if packets.get("sent") else []
+    for direction, direction_packets in [
+            ("sent", sent_packets), ("received", packets.get("received", []))]:
+        for packet_step, packet in enumerate(direction_packets):
+            for layer, fields in packet.items():
+                for field, value in fields.items():
+                    packet_writer.add_row(
+                        measurement_step, hop, repeat_step, direction,
+                        packet_step, layer, field, str(value))
+
+
+def add_measurement_rows(result_writer, packet_writer, measurement_step, measurement,
+                         pcap_reader=None):
+    """ A row for each result of each hop; the same results as utils.csv """
+    measurement_values = (
+        measurement_step, measurement.get("timestamp"), measurement["dst_addr"],
+        measurement.get("proto", "-"), measurement.get("annotation", "-"))
+    for hop_step in measurement["result"]:
+        hop = hop_step["hop"]
+        repeat_step = 0
+        skip_next = False
+        for result in hop_step["result"]:
+            if skip_next:
+                skip_next = False
+                continue
+            if "late" in result.keys():
+                skip_next = True
+            if result.get('x') == '-':
+                # not sent, the destination was reached before this hop;
+                # only '*' is a probe without a response
+                repeat_step += 1
+                continue
+            if 'x' in result.keys():
+                result_writer.add_row(
+                    *measurement_values, hop, repeat_step, None, None, None, None, None,
+                    None)
+            else:
+                # the ASN of the responder, from --asn-db, not of the measurement
+                result_writer.add_row(
+                    *measurement_values, hop, repeat_step, result["from"],
+                    result.get("asn"), result.get("cc"), result.get("rtt"),
+                    result.get("ttl"), result.get("size"))
+                if packet_writer is not None and "packets" in result.keys():
+                    packets = result["packets"]
+                    if pcap_reader is not None:
+                        # frame numbers of the pcap file, as in utils.vis
+                        packets = pcap_reader.packetlist2json(packets)
+                    add_packet_rows(packet_writer, measurement_step, hop,
+                                    repeat_step, packets)
+            repeat_step += 1
+
+
+def get_parquet_path(measurement_path, suffix=""):
+    return os.path.splitext(measurement_path)[0] + suffix + ".parquet"
+
+
+def json2parquet(measurement_path: str, packets: bool = False,
+                 row_group_size: int = ROW_GROUP_SIZE):
+    if pa is None:
+        raise RuntimeError("parquet export needs pyarrow (pip install pyarrow)")
+    if not os.path.isfile(measurement_path):
+        print("error: " + measurement_path + " does not exist!")
+        return None
+    parquet_paths = [get_parquet_path(measurement_path)]
+    schemas = [get_result_schema()]
+    if packets:
+        parquet_paths.append(get_parquet_path(measurement_path, PACKETS_SUFFIX))
+        schemas.append(get_packet_schema())
+    print("saving measurement in parquet...")
+    # written next to the parquet files and renamed, so a bad json file
+    # does not leave half of a parquet file
+    temp_paths = []
+    column_writers = []
+    pcap_readers = {}
+    try:
+        for parquet_path, schema in zip(parquet_paths, schemas):
+            temp_file, temp_path = tempfile.mkstemp(
+                suffix=".parquet", dir=os.path.dirname(os.path.abspath(parquet_path)))
+            os.close(temp_file)
+            temp_paths.append(temp_path)
+            column_writers.append(ColumnWriter(temp_path, schema, row_group_size))
+        packet_writer = column_writers[1] if packets else None
+        for measurement_step, measurement in enumerate(
+                utils.json_stream.iter_json_array(measurement_path)):
+            pcap_reader = None
+            if packets and "pcap" in measurement.keys():
+                # the packets are in a pcap file next to the measurement file
+                if measurement["pcap"] not in pcap_readers.keys():
+                    pcap_readers[measurement["pcap"]] = utils.pcap.PacketCaptureReader(
+                        os.path.join(os.path.dirname(measurement_path), measurement["pcap"]))
+                pcap_reader = pcap_readers[measurement["pcap"]]
+            add_measurement_rows(
+                column_writers[0], packet_writer, measurement_step, measurement, pcap_reader)
+        for column_writer in column_writers:
+            column_writer.close()
+        for temp_path, parquet_path in zip(temp_paths, parquet_paths):
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, parquet_path)
+    except BaseException:
+        for column_writer in column_writers:
+            column_writer.parquet_writer.close()
+        for temp_path in temp_paths:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+    finally:
+        for pcap_reader in pcap_readers.values():
+            pcap_reader.close()
+    for parquet_path in parquet_paths:
+        print("saved: " + parquet_path)
+    return parquet_paths
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+import os
+import socket
+import struct
+import tempfile
+
+from scapy.all import IP, RawPcapWriter
+from scapy.data import DLT_RAW_ALT
+
+import utils.convert_packetlist
+from utils.transport import ICMP_ERROR_TYPES
+
+MASKED_IP = '127.1.2.7'
+PCAP_HEADER_SIZE = 24
+PCAP_RECORD_HEADER_SIZE = 16
+
+
+def mask_public_ip(packet_bytes, public_ip):
+    # the same masking as in the json file, but only in the IP headers, so
+    # the checksums are still the ones we sent and received
+    try:
+        public_ip_bytes = socket.inet_aton(public_ip)
+    except OSError:
+        return packet_bytes
+    masked_ip_bytes = socket.inet_aton(MASKED_IP)
+    packet_bytes = bytearray(packet_bytes)
+    ip_header_offsets = [0]
+    header_length = (packet_bytes[0] & 0x0f) * 4
+    if packet_bytes[9] == 1 and len(packet_bytes) >= header_length + 28 and (
+            packet_bytes[header_length] in ICMP_ERROR_TYPES):
+        # the IP header quoted by the router
+        ip_header_offsets.append(header_length + 8)
+    for ip_header_offset in ip_header_offsets:
+        for address_offset in [12, 16]:
+            offset = ip_header_offset + address_offset
+            if packet_bytes[offset:offset + 4] == public_ip_bytes:
+                packet_bytes[offset:offset + 4] = masked_ip_bytes
+    return bytes(packet_bytes)
+
+
+def read_pcap_endian(pcap_file, pcap_path):
+    magic = pcap_file.read(4)
+    if magic == b"\xd4\xc3\xb2\xa1":
+        return "<"
+    if magic == b"\xa1\xb2\xc3\xd4":
+        return ">"
+    raise ValueError("not a pcap file: " + pcap_path)
+
+
+def mask_pcap_file(pcap_path, public_ip):
+    """ Mask another public IP in a saved pcap file, like one refreshed during the trace """
+    pcap_dir = os.path.dirname(os.path.abspath(pcap_path))
+    temp_file, temp_path = tempfile.mkstemp(suffix=".pcap", dir=pcap_dir)
+    try:
+        with open(pcap_path, "rb") as pcap_file, os.fdopen(temp_file, "wb") as masked_file:
+            endian = read_pcap_endian(pcap_file, pcap_path)
+            pcap_file.seek(0)
+            masked_file.write(pcap_file.read(PCAP_HEADER_SIZE))
+            while True:
+                record_header = pcap_file.read(PCAP_RECORD_HEADER_SIZE)
+                if len(record_header) < PCAP_RECORD_HEADER_SIZE:
+                    break
+                _, _, captured_length, _ = struct.unpack(endian + "IIII", record_header)
+                masked_file.write(record_header)
+                masked_file.write(mask_public_ip(pcap_file.read(captured_length), public_ip))
+        os.chmod(temp_path, os.stat(pcap_path).st_mode & 0o777)
+        os.replace(temp_path, pcap_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+class PacketCapture:
+    """ Write the packets of each hop to a pcap file and keep their frame numbers """
+
+    def __init__(self, pcap_path, public_ip):
+        self.pcap_path = pcap_path
+        self.public_ip = public_ip
+        self.frame_count = 0
+        self._writer = RawPcapWriter(pcap_path, linktype=DLT_RAW_ALT, sync=True)
+        self._writer._write_header(None)
+
+    def write_packet(self, packet):
+        packet_time = float(packet.sent_time or packet.time)
+        self._writer.write_packet(
+            mask_public_ip(bytes(packet), self.public_ip),
+            sec=int(packet_time), usec=int(round((packet_time % 1) * 1000000)))
+        self.frame_count += 1
+        return self.frame_count - 1
+
+    def write_packetlist(self, answered, unanswered):
+        # the same packets as packetlist2json(), but only their frame numbers
+        packetlist = {'sent': [], 'received': []}
+        if len(answered) == 0:
+            if len(unanswered) != 0:
+                packetlist["sent"] = self.write_packet(unanswered[0])
+        else:
+            for sentp, receivedp in answered:
+                if packetlist["sent"] == []:
+                    packetlist["sent"] = self.write_packet(sentp)
+                packetlist["received"].append(self.write_packet(receivedp))
+        return packetlist
+
+    def close(self):
+        self._writer.close()
+
+
+class PacketCaptureReader:
+    """ Read and decode the packets of a pcap file only when they are needed """
+
+    def __init__(self, pcap_path):
+        self._pcap_file = open(pcap_path, "rb")
+        self._endian = read_pcap_endian(self._pcap_file, pcap_path)
+        self._frame_offsets = []
+        offset = PCAP_HEADER_SIZE
+        while True:
+            self._pcap_file.seek(offset)
+            record_header = self._pcap_file.read(PCAP_RECORD_HEADER_SIZE)
+            if len(record_header) < PCAP_RECORD_HEADER_SIZE:
+                break
+            _, _, captured_length, _ = struct.unpack(
+                self._endian + "IIII", record_header)
+            self._frame_offsets.append(
+                (offset + PCAP_RECORD_HEADER_SIZE, captured_length))
+            offset += PCAP_RECORD_HEADER_SIZE + captured_length
+
+    def packet2json(self, frame_number):
+        offset, captured_length = self._frame_offsets[frame_number]
+        self._pcap_file.seek(offset)
+        return utils.convert_packetlist.packet2json(
+            IP(self._pcap_file.read(captured_length)), MASKED_IP)
+
+    def packetlist2json(self, packetlist):
+        if packetlist["sent"] == []:
+            sent = []
+        else:
+            sent = self.packet2json(packetlist["sent"])
+        return {'sent': sent,
+                'received': [self.packet2json(frame_number)
+                             for frame_number in packetlist["received"]]}
+
+    def close(self):
+        self._pcap_file.close()
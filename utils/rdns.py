@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+import ipaddress
+import json
+import math
+import os
+import queue
+import random
+import socket
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from scapy.all import DNS, DNSQR
+
+import utils.geolocate
+
+RDNS_WORKERS = 64  # Queries at once
+RDNS_TIMEOUT = 2  # Seconds, for each query
+RDNS_CACHE_TTL = 24 * 60 * 60  # Seconds
+RDNS_CACHE_SIZE = 100000  # Names, the least recently used ones are dropped
+RDNS_CACHE_NAME = "rdns.json"
+DNS_PORT = 53
+PTR_TYPE = 12
+
+
+def parse_dns_server(dns_server):
+    # 192.0.2.53, 192.0.2.53:5353, 2001:db8::53, [2001:db8::53] or [2001:db8::53]:5353
+    if dns_server.startswith('['):
+        host, _, port = dns_server[1:].partition(']')
+        if port == "":
+            return host, DNS_PORT
+        if not port.startswith(':'):
+            raise ValueError("not a DNS server: " + dns_server)
+        return host, int(port[1:])
+    if dns_server.count(':') == 1:
+        host, port = dns_server.split(':')
+        return host, int(port)
+    # no port with more than one ':', it is an IPv6 address
+    return dns_server, DNS_PORT
+
+
+def query_ptr(ip, dns_server, timeout=RDNS_TIMEOUT):
+    """ The PTR name of an IP from a DNS server, or None; socket.timeout if no answer """
+    host, port = parse_dns_server(dns_server)
+    query_id = random.randrange(1 << 16)
+    query = DNS(id=query_id, rd=1, qd=DNSQR(
+        qname=ipaddress.ip_address(ip).reverse_pointer, qtype="PTR"))
+    with socket.socket(socket.getaddrinfo(host, port)[0][0], socket.SOCK_DGRAM) as s:
+        s.settimeout(timeout)
+        s.connect((host, port))
+        s.send(bytes(query))
+        deadline = time.monotonic() + timeout
+        while True:
+            s.settimeout(max(deadline - time.monotonic(), 0.001))
+            response = DNS(s.recv(4096))
+            # a late answer of another query is not ours
+            if response.id == query_id and response.qr == 1:
+                break
+    if response.rcode != 0:
+        return None
+    for answer_index in range(response.ancount):
+        answer = response.an[answer_index]
+        if answer.type == PTR_TYPE:
+            return answer.rdata.decode(errors="replace").rstrip('.')
+    return None
+
+
+def query_system_ptr(ip):
+    # no timeout of its own, ReverseResolver.resolve_many does not wait for it
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except socket.herror:
+        return None  # no name
+
+
+def get_rdns_cache_path():
+    return os.path.join(utils.geolocate.get_cache_dir(), RDNS_CACHE_NAME)
+
+
+class ReverseResolver:
+    """ PTR names of many IPs at once, with a cache that is kept on disk """
+
+    def __init__(self, dns_server=None, workers=RDNS_WORKERS, timeout=RDNS_TIMEOUT,
+                 cache_ttl=RDNS_CACHE_TTL, cache_size=RDNS_CACHE_SIZE):
+        # the resolver of the system, if there is no DNS server
+        self.dns_server = dns_server
+        if dns_server is not None:
+            # a bad one is an error now, not a query without an answer later
+            parse_dns_server(dns_server)
+        self.workers = workers
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # ip -> [time, name]; None is cached too, the IP has no name
+        self.cache = OrderedDict()
+        self.load_cache()
+
+    def read_cache_file(self):
+        try:
+            with open(get_rdns_cache_path()) as cache_file:
+                cached_names = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        return {ip: [resolved_time, name]
+                for ip, (resolved_time, name) in cached_names.items()
+                if time.time() - resolved_time < self.cache_ttl}
+
+    def load_cache(self):
+        self.cache.update(self.read_cache_file())
+
+    def save_cache(self):
+        # the names that other processes (like the workers of --batch) saved
+        # since we loaded the file are kept; the newer name of an IP wins
+        merged_cache = OrderedDict(self.read_cache_file())
+        for ip, (resolved_time, name) in self.cache.items():
+            if ip not in merged_cache or resolved_time >= merged_cache[ip][0]:
+                merged_cache[ip] = [resolved_time, name]
+            merged_cache.move_to_end(ip)
+        self.cache = merged_cache
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        try:
+            os.makedirs(utils.geolocate.get_cache_dir(), exist_ok=True)
+            temp_file, temp_path = tempfile.mkstemp(
+                suffix=".json", dir=utils.geolocate.get_cache_dir())
+            with os.fdopen(temp_file, "w") as cache_file:
+                json.dump(self.cache, cache_file)
+            os.replace(temp_path, get_rdns_cache_path())
+        except OSError as e:
+            print(f"Notice: reverse DNS names are not cached\n{e!s}")
+
+    def resolve(self, ip):
+        try:
+            if self.dns_server is None:
+                return ip, query_system_ptr(ip), True
+            return ip, query_ptr(ip, self.dns_server, self.timeout), True
+        except (OSError, ValueError):
+            # no answer in time, so it is asked again next time
+            return ip, None, False
+
+    def resolve_many(self, ips):
+        """ {ip: PTR name or None} of all the IPs; only the ones not in the cache are asked """
+        names = {}
+        new_ips = []
+        for ip in dict.fromkeys(ips):
+            if ip in self.cache and time.time() - self.cache[ip][0] < self.cache_ttl:
+                self.cache.move_to_end(ip)
+                names[ip] = self.cache[ip][1]
+            else:
+                new_ips.append(ip)
+        if len(new_ips) != 0:
+            print("· - · · · resolving the names of " + str(len(new_ips)) + " IPs · - · · ·")
+            ip_queue = queue.Queue()
+            for ip in new_ips:
+                ip_queue.put(ip)
+            answers = queue.Queue()
+
+            def resolve_queued():
+                while True:
+                    try:
+                        ip = ip_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    answers.put(self.resolve(ip))
+            for _ in range(min(self.workers, len(new_ips))):
+                # daemon threads, a lookup of the system resolver that never
+                # returns does not keep the process running
+                threading.Thread(target=resolve_queued, daemon=True).start()
+            # a timeout for each query, and the workers ask them in batches
+            deadline = time.monotonic() + self.timeout * math.ceil(len(new_ips) / self.workers)
+            for _ in new_ips:
+                try:
+                    ip, name, was_answered = answers.get(
+                        timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                names[ip] = name
+                if was_answered:
+                    self.cache[ip] = [time.time(), name]
+                    self.cache.move_to_end(ip)
+            # the queries without an answer in time are not cached, and the
+            # ones that are not asked yet are dropped
+            while True:
+                try:
+                    ip_queue.get_nowait()
+                except queue.Empty:
+                    break
+            self.save_cache()
+        return {ip: names.get(ip) for ip in dict.fromkeys(ips)}
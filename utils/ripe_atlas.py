@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 
+import glob
+import http.client
 import json
-import sys
-import urllib.request
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from time import sleep
+
+import utils.geolocate
 
 MEASUREMENT_IDS = [
     5011,  # c.root-servers.net
@@ -17,58 +24,225 @@ MEASUREMENT_IDS = [
     5005,  # topology4.dyndns.atlas.ripe.net
     5151  # topology4.dyndns.atlas.ripe.net
 ]
+ATLAS_API_URL = "https://atlas.ripe.net/api/v2/"
+ATLAS_WORKERS = 4  # Requests at once
+ATLAS_REQUEST_INTERVAL = 0.5  # Seconds between two requests, for all the workers together
+ATLAS_RETRIES = 3  # For each request, after a network error or "too many requests"
+ATLAS_TIMEOUT = 30  # Seconds
+# a newer result than this is still the latest one; the built-in
+# traceroutes run every 30 minutes
+ATLAS_CACHE_TTL = 30 * 60  # Seconds
+ATLAS_CACHE_DIR_NAME = "ripe-atlas"
+
+
+class RateLimiter:
+    """ At most one request in each interval, for all the threads """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_time = 0
+
+    def wait(self):
+        with self.lock:
+            wait_time = self.next_time - time.monotonic()
+            self.next_time = max(self.next_time, time.monotonic()) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def get_atlas_cache_dir():
+    return os.path.join(utils.geolocate.get_cache_dir(), ATLAS_CACHE_DIR_NAME)
+
+
+def get_cached_result_paths(measurement_id, probe_id):
+    cache_paths = glob.glob(os.path.join(
+        glob.escape(get_atlas_cache_dir()), f"{measurement_id}-{probe_id}-*.json"))
+    # the newest one last
+    return sorted(cache_paths, key=lambda cache_path: int(
+        os.path.splitext(cache_path)[0].rsplit('-', 1)[1]))
+
+
+def load_cached_result(measurement_id, probe_id):
+    """ The newest cached result of a probe in a measurement, or None """
+    for cache_path in reversed(get_cached_result_paths(measurement_id, probe_id)):
+        try:
+            with open(cache_path, encoding='utf-8') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def save_cached_result(measurement_id, probe_id, result):
+    # by (measurement ID, probe ID, timestamp), the older ones are not needed
+    timestamp = int(result.get("timestamp", 0))
+    cache_path = os.path.join(
+        get_atlas_cache_dir(), f"{measurement_id}-{probe_id}-{timestamp}.json")
+    try:
+        os.makedirs(get_atlas_cache_dir(), exist_ok=True)
+        temp_file, temp_path = tempfile.mkstemp(suffix=".json", dir=get_atlas_cache_dir())
+        with os.fdopen(temp_file, 'w', encoding='utf-8') as cache_file:
+            json.dump(result, cache_file, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+        for old_cache_path in get_cached_result_paths(measurement_id, probe_id):
+            if old_cache_path != cache_path:
+                os.remove(old_cache_path)
+    except OSError as e:
+        print(f"Notice: measurement ID {measurement_id} is not cached\n{e!s}")
+
+
+class AtlasClient:
+    """ Results of the RIPE Atlas API, over a keep-alive connection for each worker """
+
+    def __init__(self, base_url=ATLAS_API_URL, workers=ATLAS_WORKERS,
+                 request_interval=ATLAS_REQUEST_INTERVAL, retries=ATLAS_RETRIES,
+                 timeout=ATLAS_TIMEOUT, cache_ttl=ATLAS_CACHE_TTL):
+        url = urllib.parse.urlsplit(base_url)
+        self.scheme = url.scheme
+        self.netloc = url.netloc
+        self.base_path = url.path.rstrip('/') + '/'
+        self.workers = workers
+        self.retries = retries
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.rate_limiter = RateLimiter(request_interval)
+        self.thread_data = threading.local()
+        self.connections = []
+        self.connections_lock = threading.Lock()
+
+    def get_connection(self):
+        connection = getattr(self.thread_data, "connection", None)
+        if connection is None:
+            if self.scheme == "https":
+                connection = http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+            else:
+                connection = http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+            self.thread_data.connection = connection
+            with self.connections_lock:
+                self.connections.append(connection)
+        return connection
+
+    def drop_connection(self):
+        # the server closed it, the next request opens a new one
+        self.thread_data.connection.close()
+        self.thread_data.connection = None
+
+    def get_json(self, path):
+        """ The JSON of a path of the API; OSError if it is not there after the retries """
+        for retry_step in range(self.retries + 1):
+            self.rate_limiter.wait()
+            connection = self.get_connection()
+            try:
+                connection.request("GET", self.base_path + path, headers={
+                    "Accept": "application/json", "User-Agent": "tracevis"})
+                response = connection.getresponse()
+                response_body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                self.drop_connection()
+                if retry_step == self.retries:
+                    raise OSError(str(e)) from e
+                continue
+            if response.status == 200:
+                return json.loads(response_body.decode())
+            if response.status not in (429, 502, 503, 504) or retry_step == self.retries:
+                raise OSError(f"HTTP {response.status} {response.reason}")
+            # too many requests, or the server is busy
+            retry_after = response.getheader("Retry-After", "")
+            if retry_after.isdigit():
+                time.sleep(int(retry_after))
+            else:
+                time.sleep(self.rate_limiter.interval * 2 ** retry_step)
+        return None
+
+    def download_latest(self, measurement_id, probe_id):
+        """ The latest result of a probe in a measurement, from the cache if it is new """
+        if not str(measurement_id).isdigit() or not str(probe_id).isdigit():
+            # they are in the URL and in the name of the cache file
+            print("not a RIPE Atlas ID: " + str(measurement_id) + ", probe " + str(probe_id))
+            return None
+        cached_result = load_cached_result(measurement_id, probe_id)
+        if (cached_result is not None
+                and time.time() - cached_result.get("timestamp", 0) < self.cache_ttl):
+            print("measurement ID " + str(measurement_id) + " is in the cache.")
+            return cached_result
+        try:
+            downloaded_data = self.get_json(
+                "measurements/" + str(measurement_id)
+                + "/latest/?format=json&probe_ids=" + str(probe_id))
+        except (OSError, ValueError) as e:
+            if cached_result is not None:
+                print("failed to download measurement ID: " + str(measurement_id)
+                      + ", using the cached one (" + str(e) + ")")
+                return cached_result
+            print("failed to download measurement ID: " + str(measurement_id)
+                  + " (" + str(e) + ")")
+            return None
+        if not downloaded_data:
+            print("no result of probe " + str(probe_id)
+                  + " in measurement ID: " + str(measurement_id))
+            return None
+        save_cached_result(measurement_id, probe_id, downloaded_data[0])
+        print("downloading measurement ID " + str(measurement_id) + " finished.")
+        return downloaded_data[0]
+
+    def download_many(self, measurement_ids, probe_id):
+        """ The latest results of a probe in the measurements, in their order; None if failed """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(
+                lambda measurement_id: self.download_latest(measurement_id, probe_id),
+                measurement_ids))
+
+    def close(self):
+        with self.connections_lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections.clear()
 
 
 def download_from_atlas(
         probe_id, output_dir: str, name_prefix: str = "",
-        measurement_ids: str = ""):
+        measurement_ids: str = "", base_url: str = ATLAS_API_URL):
     all_measurements = []
     measurement_name = ""
     was_successful = False
     if measurement_ids == "":
         measurement_ids = MEASUREMENT_IDS
+    # the same measurement is downloaded once
+    measurement_ids = list(dict.fromkeys(str(measurement_id) for measurement_id in measurement_ids))
     if name_prefix != "":
         measurement_name = name_prefix + "-ripe-atlas-" + str(probe_id) + "-tracevis-" \
             + datetime.utcnow().strftime("%Y%m%d-%H%M")
     else:
         measurement_name = "ripe-atlas-" + str(probe_id) + "-tracevis-" \
             + datetime.utcnow().strftime("%Y%m%d-%H%M")
-    if probe_id != "":
-        print(
-            " ********************************************************************** ")
-        print(
-            "downloading data from probe ID: " + str(probe_id))
-        print(" · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
-        for measurement_id in measurement_ids:
-            print(
-                "downloading measurement ID: " + str(measurement_id))
-            requset_url = ("https://atlas.ripe.net/api/v2/measurements/"
-                           + str(measurement_id)
-                           + "/latest/?format=json&probe_ids="
-                           + str(probe_id)
-                           )
-            with urllib.request.urlopen(requset_url) as url:
-                downloaded_data = json.loads(url.read().decode())
-            if downloaded_data is not None:
-                all_measurements.append(downloaded_data[0])
-                print(
-                    "downloading measurement ID " + str(measurement_id) + " finished.")
-            else:
-                print("failed to download measurement ID: "
-                      + str(measurement_id))
-            sleep(3)
-            print(" · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
-        print(
-            " ********************************************************************** ")
-        if len(all_measurements) < 1:
-            sys.exit(1)
-        measurement_path = output_dir + measurement_name + ".json"
-        print("saving json file... to: " + measurement_path)
-        with open((measurement_path), 'w', encoding='utf-8') as json_file:
-            json.dump(all_measurements, json_file,
-                      ensure_ascii=False, indent=4)
-        print("saved: " + measurement_path)
-        was_successful = True
-        print(
-            " ********************************************************************** ")
-        return was_successful, measurement_path
+    if probe_id == "":
+        return was_successful, None
+    print(
+        " ********************************************************************** ")
+    print(
+        "downloading data from probe ID: " + str(probe_id))
+    print("downloading measurement IDs: " + ", ".join(measurement_ids))
+    print(" · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
+    atlas_client = AtlasClient(base_url)
+    try:
+        for downloaded_result in atlas_client.download_many(measurement_ids, probe_id):
+            if downloaded_result is not None:
+                all_measurements.append(downloaded_result)
+    finally:
+        atlas_client.close()
+    print(
+        " ********************************************************************** ")
+    if len(all_measurements) < 1:
+        print("no measurement is downloaded from probe ID: " + str(probe_id))
+        return was_successful, None
+    measurement_path = output_dir + measurement_name + ".json"
+    print("saving json file... to: " + measurement_path)
+    with open((measurement_path), 'w', encoding='utf-8') as json_file:
+        json.dump(all_measurements, json_file,
+                  ensure_ascii=False, indent=4)
+    print("saved: " + measurement_path)
+    was_successful = True
+    print(
+        " ********************************************************************** ")
+    return was_successful, measurement_path
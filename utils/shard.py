@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+from multiprocessing import Pool
+
+import utils.geolocate
+import utils.trace
+
+SHARD_SIZE = 12  # == len(utils.vis.REQUEST_COLORS)
+
+worker_rate_limiter = None
+
+
+def split_request_ips(request_ips, shard_size):
+    shards = []
+    ip_steps = 0
+    while ip_steps < len(request_ips):
+        shards.append(request_ips[ip_steps:ip_steps + shard_size])
+        ip_steps += shard_size
+    return shards
+
+
+def initialize_worker(packet_rate_limiter):
+    global worker_rate_limiter
+    worker_rate_limiter = packet_rate_limiter
+
+
+def trace_shard(shard_number, request_ips, name_prefix, trace_args):
+    if name_prefix:
+        name_prefix += "-shard" + str(shard_number)
+    else:
+        name_prefix = "shard" + str(shard_number)
+    try:
+        return utils.trace.trace_route(
+            ip_list=request_ips, name_prefix=name_prefix,
+            packet_rate_limiter=worker_rate_limiter, **trace_args)
+    except SystemExit:
+        # trace_route exits on errors, which would leave the pool waiting
+        print("Error: shard " + str(shard_number) + " failed")
+        return False, "", True
+
+
+def trace_route_sharded(
+        ip_list, workers: int, name_prefix: str = "",
+        shard_size: int = SHARD_SIZE, packet_rate_limiter=None, **trace_args):
+    shards = split_request_ips(ip_list, shard_size)
+    # the workers can't start the geolocation process of their own, and
+    # all the shards should have the same one anyway
+    if trace_args.get("geolocation") is None:
+        trace_args["geolocation"] = utils.geolocate.get_geolocation(
+            utils.trace.TraceSession(trace_args.get("iface")).geolocation_cache_key())
+    print("· - · · · tracing " + str(len(ip_list)) + " IPs in "
+          + str(len(shards)) + " shards with " + str(workers) + " workers · - · · ·")
+    # a new process for each shard, so the measurement data of one shard
+    # is never mixed with the next one
+    with Pool(processes=workers, initializer=initialize_worker,
+              initargs=(packet_rate_limiter,), maxtasksperchild=1) as pool:
+        shard_results = pool.starmap(trace_shard, [
+            (shard_number + 1, request_ips, name_prefix, trace_args)
+            for shard_number, request_ips in enumerate(shards)])
+    was_successful = False
+    no_internet = False
+    shard_paths = []
+    for shard_was_successful, shard_path, shard_no_internet in shard_results:
+        if shard_was_successful:
+            was_successful = True
+            shard_paths.append(shard_path)
+        no_internet = no_internet or shard_no_internet
+    return was_successful, shard_paths, no_internet
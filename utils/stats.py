@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+import csv
+import hashlib
+import os
+import tempfile
+from array import array
+from itertools import repeat
+
+import utils.geolocate
+import utils.json_stream
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RTT_PERCENTILES = [50, 90, 99]
+NO_RESPONSE = -1
+NAN = float("nan")
+# in the cache dir, so the json file is read only once
+COLUMNS_CACHE_DIR_NAME = "stats-columns"
+COLUMN_TYPES = [
+    ("destination", "int32"), ("hop", "int32"), ("repeat", "int32"),
+    ("from_ip", "int32"), ("rtt", "float64"), ("ttl", "int32"), ("size", "int32")
+]
+STATS_COLUMNS = [
+    "destination", "annotation", "hop", "probes", "responses", "loss", "responders",
+    "rtt_min", "rtt_p50", "rtt_p90", "rtt_p99", "rtt_max", "rtt_mean",
+    "backttl", "backttl_stability"
+]
+
+
+class ResultColumns:
+    """ One row for each probe of a measurement file, in numpy arrays """
+
+    def __init__(self):
+        self.destinations = {}
+        self.from_ips = {}
+        self.destination = array('i')
+        self.hop = array('i')
+        self.repeat = array('i')
+        self.from_ip = array('i')
+        self.rtt = array('d')
+        self.ttl = array('i')
+        self.size = array('i')
+
+    def add_measurement(self, measurement):
+        # the two packets of a dns or packet trace are two destinations
+        destination = self.destinations.setdefault(
+            (measurement["dst_addr"], measurement.get("annotation", "-")),
+            len(self.destinations))
+        from_ips = self.from_ips
+        # bound once, they are called for each result
+        from_ip_append = self.from_ip.append
+        rtt_append = self.rtt.append
+        ttl_append = self.ttl.append
+        size_append = self.size.append
+        for try_step in measurement["result"]:
+            results = try_step["result"]
+            number_of_results = 0
+            skip_next = False
+            for result in results:
+                # a probe that was not sent, the destination was reached before
+                if result.get('x') == '-':
+                    continue
+                # the next one is the same response, as in utils.vis
+                if skip_next:
+                    skip_next = False
+                    continue
+                if "late" in result:
+                    skip_next = True
+                if 'x' in result:
+                    # '*', no response
+                    from_ip_append(NO_RESPONSE)
+                    rtt_append(NAN)
+                    ttl_append(NO_RESPONSE)
+                    size_append(NO_RESPONSE)
+                else:
+                    from_ip = result["from"]
+                    if from_ip not in from_ips:
+                        from_ips[from_ip] = len(from_ips)
+                    from_ip_append(from_ips[from_ip])
+                    rtt_append(result.get("rtt", NAN))
+                    ttl_append(result["ttl"])
+                    size_append(result["size"])
+                number_of_results += 1
+            self.destination.extend(repeat(destination, number_of_results))
+            self.hop.extend(repeat(try_step["hop"], number_of_results))
+            self.repeat.extend(range(number_of_results))
+
+    def to_numpy(self):
+        # no copy, the arrays share the memory of the array('i')/array('d')
+        file_columns = {name: np.frombuffer(getattr(self, name), dtype=dtype)
+                        for name, dtype in COLUMN_TYPES}
+        file_columns["dst_addrs"] = np.array(
+            [dst_addr for dst_addr, _ in self.destinations.keys()], dtype=str)
+        file_columns["annotations"] = np.array(
+            [annotation for _, annotation in self.destinations.keys()], dtype=str)
+        file_columns["from_ips"] = np.array(list(self.from_ips.keys()), dtype=str)
+        return file_columns
+
+
+def get_columns_cache_path(measurement_path):
+    # a file for each measurement file, by its full path
+    path_hash = hashlib.sha256(os.path.abspath(measurement_path).encode()).hexdigest()
+    return os.path.join(
+        utils.geolocate.get_cache_dir(), COLUMNS_CACHE_DIR_NAME, path_hash[:32] + ".npz")
+
+
+def load_file_columns(measurement_path):
+    """ The columns of a measurement file, from the cache if the file is not changed """
+    cache_path = get_columns_cache_path(measurement_path)
+    measurement_stat = os.stat(measurement_path)
+    # the same modification time and size as the file the cache was made of
+    file_version = np.array([measurement_stat.st_mtime_ns, measurement_stat.st_size],
+                            dtype=np.int64)
+    try:
+        with np.load(cache_path) as cached_columns:
+            if np.array_equal(cached_columns["file_version"], file_version):
+                return {name: cached_columns[name] for name in cached_columns.files
+                        if name != "file_version"}
+    except (OSError, ValueError, KeyError):
+        pass  # not cached yet, or a broken cache file
+    result_columns = ResultColumns()
+    for measurement in utils.json_stream.iter_json_array(measurement_path):
+        result_columns.add_measurement(measurement)
+    file_columns = result_columns.to_numpy()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_file, temp_path = tempfile.mkstemp(suffix=".npz", dir=os.path.dirname(cache_path))
+        with os.fdopen(temp_file, "wb") as f:
+            np.savez(f, file_version=file_version, **file_columns)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # the stats are made anyway, only the next time is slower
+    return file_columns
+
+
+def load_result_columns(measurement_paths):
+    destinations = {}
+    from_ips = {}
+    all_columns = {name: [] for name, _ in COLUMN_TYPES}
+    for measurement_path in measurement_paths:
+        file_columns = load_file_columns(measurement_path)
+        # the indexes of a file to the indexes of all the files
+        destination_indexes = np.array([
+            destinations.setdefault(destination, len(destinations)) for destination in zip(
+                file_columns["dst_addrs"].tolist(), file_columns["annotations"].tolist())],
+            dtype=np.int32)
+        # and NO_RESPONSE (-1) is the last one, so it stays NO_RESPONSE
+        from_ip_indexes = np.array([
+            from_ips.setdefault(from_ip, len(from_ips))
+            for from_ip in file_columns["from_ips"].tolist()] + [NO_RESPONSE],
+            dtype=np.int32)
+        for name, _ in COLUMN_TYPES:
+            all_columns[name].append(file_columns[name])
+        all_columns["destination"][-1] = destination_indexes[file_columns["destination"]]
+        all_columns["from_ip"][-1] = from_ip_indexes[file_columns["from_ip"]]
+    result_columns = {name: np.concatenate(all_columns[name]).astype(dtype)
+                      if all_columns[name] else np.zeros(0, dtype=dtype)
+                      for name, dtype in COLUMN_TYPES}
+    result_columns["destinations"] = list(destinations.keys())
+    result_columns["from_ips"] = list(from_ips.keys())
+    return result_columns
+
+
+def get_backttl(ttl, hop):
+    # the same as utils.vis.parse_ttl, for all the responses at once
+    return np.select(
+        [ttl <= 20, ttl <= 64, ttl <= 128],
+        [np.trunc((hop - ttl) / 2).astype(np.int32) + 1, 65 - ttl, 129 - ttl],
+        256 - ttl)
+
+
+def group_percentiles(sorted_values, group_starts, group_sizes, percentile):
+    # linear interpolation, like numpy.percentile, in each group of the
+    # sorted values; nan for the empty groups
+    if len(sorted_values) == 0:
+        return np.full(len(group_sizes), np.nan)
+    position = (group_sizes - 1).clip(min=0) * (percentile / 100)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    last_value = len(sorted_values) - 1
+    lower_value = sorted_values[(group_starts + lower).clip(max=last_value)]
+    upper_value = sorted_values[(group_starts + upper).clip(max=last_value)]
+    values = lower_value + (upper_value - lower_value) * (position - lower)
+    return np.where(group_sizes > 0, values, np.nan)
+
+
+def get_hop_stats(columns):
+    """ The stats of each hop of each destination, in columns """
+    number_of_hops = int(columns["hop"].max(initial=0)) + 1
+    group_keys, group = np.unique(
+        columns["destination"].astype(np.int64) * number_of_hops + columns["hop"],
+        return_inverse=True)
+    group = group.reshape(-1)
+    number_of_groups = len(group_keys)
+    probes = np.bincount(group, minlength=number_of_groups)
+    responded = columns["from_ip"] != NO_RESPONSE
+    responses = np.bincount(group[responded], minlength=number_of_groups)
+    # (group, from ip) pairs in one int64, which sorts much faster than rows
+    number_of_from_ips = max(len(columns["from_ips"]), 1)
+    responder_keys = np.unique(
+        group[responded] * number_of_from_ips + columns["from_ip"][responded])
+    responders = np.bincount(
+        responder_keys // number_of_from_ips, minlength=number_of_groups)
+    # rtt, only of the responses that have one
+    has_rtt = ~np.isnan(columns["rtt"])
+    # sorted by rtt and then by group, with a stable sort; much faster than lexsort
+    rtt = columns["rtt"][has_rtt]
+    rtt_order = np.argsort(rtt)
+    rtt_order = rtt_order[np.argsort(group[has_rtt][rtt_order], kind='stable')]
+    sorted_rtt = rtt[rtt_order]
+    rtt_sizes = np.bincount(group[has_rtt], minlength=number_of_groups)
+    rtt_starts = np.concatenate([[0], np.cumsum(rtt_sizes)[:-1]]).astype(np.int64)
+    destinations = columns["destinations"]
+    hop_stats = {
+        "destination": [destinations[destination][0]
+                        for destination in group_keys // number_of_hops],
+        "annotation": [destinations[destination][1]
+                       for destination in group_keys // number_of_hops],
+        "hop": group_keys % number_of_hops,
+        "probes": probes,
+        "responses": responses,
+        "loss": 1 - responses / probes,
+        "responders": responders,
+        "rtt_min": group_percentiles(sorted_rtt, rtt_starts, rtt_sizes, 0),
+        "rtt_max": group_percentiles(sorted_rtt, rtt_starts, rtt_sizes, 100),
+        "rtt_mean": np.where(rtt_sizes > 0, np.bincount(
+            group[has_rtt], weights=rtt, minlength=number_of_groups
+        ) / rtt_sizes.clip(min=1), np.nan),
+    }
+    for percentile in RTT_PERCENTILES:
+        hop_stats["rtt_p" + str(percentile)] = group_percentiles(
+            sorted_rtt, rtt_starts, rtt_sizes, percentile)
+    # the most common back-TTL and how many of the responses have it
+    backttl = get_backttl(columns["ttl"][responded], columns["hop"][responded])
+    smallest_backttl = int(backttl.min(initial=0))
+    number_of_backttls = int(backttl.max(initial=0)) - smallest_backttl + 1
+    backttl_keys, backttl_counts = np.unique(
+        group[responded] * number_of_backttls + (backttl - smallest_backttl),
+        return_counts=True)
+    backttl_groups = backttl_keys // number_of_backttls
+    # sorted by the count, so the last one of each group is the most common
+    most_common_order = np.lexsort((backttl_counts, backttl_groups))
+    sorted_groups = backttl_groups[most_common_order]
+    is_last = np.append(sorted_groups[1:] != sorted_groups[:-1], True)[:len(sorted_groups)]
+    most_common_groups = sorted_groups[is_last]
+    most_common_backttl = np.full(number_of_groups, NO_RESPONSE)
+    most_common_count = np.zeros(number_of_groups, dtype=np.int64)
+    most_common_backttl[most_common_groups] = (
+        backttl_keys[most_common_order][is_last] % number_of_backttls + smallest_backttl)
+    most_common_count[most_common_groups] = backttl_counts[most_common_order][is_last]
+    hop_stats["backttl"] = most_common_backttl
+    hop_stats["backttl_stability"] = np.where(
+        responses > 0, most_common_count / responses.clip(min=1), np.nan)
+    return hop_stats
+
+
+def format_stats_value(value, has_value=True):
+    if not has_value:
+        return "*"
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return "*"
+        return format(value, '.3f')
+    return str(value)
+
+
+def stats_rows(hop_stats):
+    for row_number in range(len(hop_stats["destination"])):
+        # the back-TTL is NO_RESPONSE without responses, but a back-TTL
+        # of a low TTL can be -1 too
+        has_backttl = hop_stats["responses"][row_number] > 0
+        yield [format_stats_value(hop_stats[column][row_number],
+                                  has_backttl or column != "backttl")
+               for column in STATS_COLUMNS]
+
+
+def print_stats(hop_stats):
+    print(" ".join(column.rjust(10) for column in STATS_COLUMNS))
+    for row in stats_rows(hop_stats):
+        print(" ".join(value.rjust(10) for value in row))
+
+
+def save_stats(hop_stats, stats_path):
+    with open(stats_path, "w", newline='') as stats_file:
+        stats_writer = csv.writer(stats_file)
+        stats_writer.writerow(STATS_COLUMNS)
+        stats_writer.writerows(stats_rows(hop_stats))
+
+
+def json2stats(measurement_paths):
+    if np is None:
+        raise RuntimeError("stats need numpy (pip install numpy)")
+    print("· - · · · making the stats of " + str(len(measurement_paths))
+          + " measurement files · - · · ·")
+    hop_stats = get_hop_stats(load_result_columns(measurement_paths))
+    print_stats(hop_stats)
+    stats_path = os.path.splitext(measurement_paths[0])[0] + "_stats.csv"
+    save_stats(hop_stats, stats_path)
+    print("saved: " + stats_path)
+    print("· · · - · -     · · · - · -     · · · - · -     · · · - · -")
+    return stats_path
@@ -1,31 +1,83 @@
 #!/usr/bin/env python3
 from __future__ import absolute_import, unicode_literals
 
-import json
+import asyncio
+import functools
+import os
 import platform
 import sys
+import threading
 import time
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from time import sleep
 
 from scapy.all import (DNS, ICMP, IP, TCP, UDP, RandInt, RandShort, Raw, conf,
-                       get_if_addr, send, sr, sr1)
+                       get_if_addr, raw, send, sndrcv, sr1)
+from scapy.plist import PacketList, QueryAnswer, SndRcvList
 
 import utils.ephemeral_port
 import utils.geolocate
+import utils.jsonl
+import utils.pcap
+import utils.transport
 from utils.traceroute_struct import traceroute_data
 
 
 LOCALHOST = '127.0.0.1'
 SLEEP_TIME = 1
-have_2_packet = False
-user_iface = conf.iface
-user_source_ip_address = get_if_addr(user_iface)
-measurement_data = [[], []]
+QUIET_INTERVAL = 0.5  # Seconds
+ADAPTIVE_MIN_TIMEOUT = 0.2  # Seconds
+RTT_ALPHA = 1 / 8  # same gains as TCP (RFC 6298)
+RTT_BETA = 1 / 4
+RTT_K = 4
+RTT_GRANULARITY = 0.01  # Seconds
 OS_NAME = platform.system()
 
 
+class RTTEstimator:
+    """ TCP-like retransmission timeout, but per destination and per hop """
+
+    def __init__(self, min_timeout=ADAPTIVE_MIN_TIMEOUT):
+        self.min_timeout = min_timeout
+        self.hops = {}
+        self.destinations = {}
+        self.backoff = {}
+
+    @staticmethod
+    def _add_sample(estimate, rtt):
+        if estimate is None:
+            return rtt, rtt / 2
+        srtt, rttvar = estimate
+        rttvar = (1 - RTT_BETA) * rttvar + RTT_BETA * abs(srtt - rtt)
+        srtt = (1 - RTT_ALPHA) * srtt + RTT_ALPHA * rtt
+        return srtt, rttvar
+
+    def add_rtt(self, request_ip, current_ttl, elapsed_ms):
+        rtt = elapsed_ms / 1000
+        self.hops[(request_ip, current_ttl)] = self._add_sample(
+            self.hops.get((request_ip, current_ttl)), rtt)
+        self.destinations[request_ip] = self._add_sample(
+            self.destinations.get(request_ip), rtt)
+        self.backoff.pop((request_ip, current_ttl), None)
+
+    def add_timeout(self, request_ip, current_ttl):
+        # like TCP, wait twice as long the next time this hop is silent
+        self.backoff[(request_ip, current_ttl)] = self.backoff.get(
+            (request_ip, current_ttl), 1) * 2
+
+    def timeout(self, request_ip, current_ttl, max_timeout):
+        estimate = self.hops.get((request_ip, current_ttl))
+        if estimate is None:
+            estimate = self.destinations.get(request_ip)
+        if estimate is None:
+            return max_timeout
+        srtt, rttvar = estimate
+        rto = max(srtt + max(RTT_GRANULARITY, RTT_K * rttvar), self.min_timeout)
+        rto *= self.backoff.get((request_ip, current_ttl), 1)
+        return min(rto, max_timeout)
+
+
 def choose_desirable_packet(request_and_answers, do_tcphandshake):
     # request_and_answers.summary()
     summary_postfix = str(request_and_answers.summary)
@@ -151,142 +203,18 @@ def get_new_timestamp():
     return timestamp_now, (int(timestamp_now) ^ int(RandInt()))
 
 
-def send_packet_with_tcphandshake(this_request, timeout):
-    global user_iface
-    global user_source_ip_address
-    timestamp_start, new_timestamp = get_new_timestamp()
-    ip_address = this_request[IP].dst
-    destination_port = this_request[TCP].dport
-    syn_tcp_options = generate_syn_tcp_options(new_timestamp)
-    ans = []
-    max_repeat = 0
-    # here we are trying to do a new TCP handshake every time because
-    # we are trying to trace packet data, not SYN packet. And
-    # we know about intermittent stream blocking
-    while len(ans) == 0 and max_repeat < 5:
-        source_port = utils.ephemeral_port.ephemeral_port_reserve(
-            user_source_ip_address, "tcp")
-        send_syn = IP(src=user_source_ip_address,
-                      dst=ip_address, id=RandShort(), flags="DF")/TCP(
-            sport=source_port, dport=destination_port, seq=RandInt(),
-            flags="S", options=syn_tcp_options)
-        tcp_handshake_timeout = timeout + max_repeat
-        ans, unans = sr(send_syn, iface=user_iface, verbose=0,
-                        timeout=tcp_handshake_timeout)
-        if len(ans) == 0:
-            print("Warning: No response to SYN packet yet")
-        max_repeat += 1
-    if len(ans) == 0:
-        print("Error: doing TCP handshake failed "
-              + str(max_repeat)
-              + " times. You should test with PingVis instead")  # todo: xhdix
-        sleep(timeout + max_repeat)  # double sleep (￣o￣) . z Z.
-        return ans, unans
-    else:
-        timeout += 2  # we should wait more for data packets.
-        syn_ack_timestamp = get_timestamp(ans[0][1][TCP].options)
-        new_timestamp = new_timestamp + \
-            int((time.time() - timestamp_start) * 1000)
-        ack_tcp_options = generate_ack_tcp_options(
-            new_timestamp, syn_ack_timestamp)
-        send_ack = IP(src=user_source_ip_address,
-                      dst=ip_address, id=(ans[0][0][IP].id + 1), flags="DF")/TCP(
-            sport=source_port, dport=destination_port, seq=ans[0][1][TCP].ack,
-            ack=ans[0][1][TCP].seq + 1, flags="A", options=ack_tcp_options)
-        send(send_ack, iface=user_iface, verbose=0)
-        send_data = this_request
-        send_data[IP].src = user_source_ip_address
-        send_data[IP].id = ans[0][0][IP].id + 2
-        send_data[TCP].sport = source_port
-        send_data[TCP].seq = ans[0][1][TCP].ack
-        send_data[TCP].ack = ans[0][1][TCP].seq + 1
-        send_data[TCP].options = tcp_options_correction(
-            send_data[TCP].options, new_timestamp, syn_ack_timestamp)
-        del(send_data[TCP].chksum)
-        del(send_data[IP].len)
-        del(send_data[IP].chksum)
-        request_and_answers, unanswered = sr(
-            send_data, iface=user_iface, verbose=0, timeout=timeout, multi=True)
-        # send_fin = send_ack.copy() # todo: xhdix
-        # send_fin[IP].id=ans[0][0][IP].id + 1
-        # send_fin[TCP].flags = "FA"
-        # send(send_fin, verbose=0)
-        # send_last_ack=send_fin.copy()
-        # send_last_ack[IP].id=send_fin[IP].id + 1
-        # send_last_ack[TCP].flags = "A"
-        # send(send_last_ack, verbose=0)
-        return request_and_answers, unanswered
+def is_final_answer(received_packet):
+    if received_packet.haslayer(ICMP) or received_packet.haslayer(UDP):
+        return True
+    if received_packet.haslayer(TCP):
+        # an ACK alone may be sent by a middlebox, we wait for the server
+        return received_packet.haslayer(Raw) or (
+            'R' in received_packet[TCP].flags or 'F' in received_packet[TCP].flags)
+    return False
 
 
-def send_single_packet(this_request, timeout):
-    global user_iface
-    global user_source_ip_address
-    this_request[IP].id = RandShort()
-    if this_request.haslayer(TCP):
-        this_request[TCP].sport = utils.ephemeral_port.ephemeral_port_reserve(
-            user_source_ip_address, "tcp")
-        if this_request[TCP].flags == "S":
-            this_request[TCP].seq = RandInt()
-        _, new_timestamp = get_new_timestamp()
-        this_request[TCP].options = tcp_options_correction(
-            this_request[TCP].options, new_timestamp, 0)
-        del(this_request[TCP].chksum)
-    elif this_request.haslayer(UDP):
-        this_request[UDP].sport = utils.ephemeral_port.ephemeral_port_reserve(
-            user_source_ip_address, "udp")
-        del(this_request[UDP].len)
-        del(this_request[UDP].chksum)
-    if this_request.haslayer(DNS):
-        this_request[DNS].id = RandShort()
-    del(this_request[IP].len)
-    del(this_request[IP].chksum)
-    request_and_answers, unanswered = sr(
-        this_request, iface=user_iface, verbose=0, timeout=timeout)
-    return request_and_answers, unanswered
-
-
-def retransmission_single_packet(this_request, timeout, is_data_packet):
-    global user_iface
-    this_request[IP].id += 1
-    del(this_request[IP].chksum)
-    if is_data_packet:
-        request_and_answers, unanswered = sr(
-            this_request, iface=user_iface, verbose=0, timeout=timeout, multi=True)
-    else:
-        request_and_answers, unanswered = sr(
-            this_request, iface=user_iface, verbose=0, timeout=timeout)
-    return request_and_answers, unanswered
-
-
-def send_packet(request_packet, request_ip, current_ttl, timeout, do_tcphandshake, trace_retransmission, do_not_parse):
-    this_request = request_packet
-    global user_source_ip_address
-    this_request[IP].src = user_source_ip_address
-    this_request[IP].dst = request_ip
-    this_request[IP].ttl = current_ttl
-    if not do_not_parse:
-        print(">>>request:"
-              + "   ip.dst: " + request_ip
-              + "   ip.ttl: " + str(current_ttl))
-    request_and_answers = []
-    unanswered = []
-    start_time = time.perf_counter()
-    if trace_retransmission:
-        request_and_answers, unanswered = retransmission_single_packet(
-            this_request, timeout, do_tcphandshake)
-    elif do_tcphandshake:
-        request_and_answers, unanswered = send_packet_with_tcphandshake(
-            this_request, timeout)
-    else:
-        request_and_answers, unanswered = send_single_packet(
-            this_request, timeout)
-    end_time = time.perf_counter()
-    elapsed_ms = float(format(abs((end_time - start_time) * 1000), '.3f'))
-    if do_not_parse:
-        return request_and_answers, unanswered
-    if do_tcphandshake and not trace_retransmission:
-        sleep(timeout)  # double sleep (￣o￣) . z Z. maybe we should wait more
-    return parse_packet(request_and_answers, unanswered, current_ttl, elapsed_ms, do_tcphandshake)
+def probe_key(sent_packet):
+    return sent_packet[IP].dst, sent_packet[IP].ttl, sent_packet[IP].id
 
 
 def already_reached_destination_int(previous_node_id, current_node_ip):
@@ -296,343 +224,943 @@ def already_reached_destination_int(previous_node_id, current_node_ip):
         return False
 
 
-def are_equal(original_list, result_list):
-    counter = 0
-    for item in original_list:
-        original_item = item
-        reault_item_1 = result_list[0][counter]
-        if reault_item_1 != original_item:
-            return False
-        if have_2_packet:
-            reault_item_2 = result_list[1][counter]
-            if reault_item_2 != original_item:
+def change_dst_port(request_packet, dst_port):
+    if request_packet.haslayer(TCP):
+        request_packet[TCP].dport = dst_port
+    elif request_packet.haslayer(UDP):
+        request_packet[UDP].dport = dst_port
+    return request_packet
+
+
+class TraceSession:
+    """ The state of one trace, so more than one trace can run in a process """
+
+    def __init__(self, iface=None):
+        self.iface = conf.iface
+        if iface is not None:
+            self.iface = iface
+        self.source_ip_address = get_if_addr(self.iface)
+        self.have_2_packet = False
+        self.measurement_data = [[], []]
+        self.probe_transport = None
+        self.quiet_interval = QUIET_INTERVAL
+        self.rtt_estimator = None
+        self.measurement_writer = None
+        self.packet_capture = None
+        self.pcap_path = None
+        self.port_pools = {}
+        # the coroutines of trace_destinations_async ask for ports from many threads
+        self.port_pools_lock = threading.Lock()
+
+    def get_source_port(self, proto):
+        with self.port_pools_lock:
+            if proto not in self.port_pools.keys():
+                self.port_pools[proto] = utils.ephemeral_port.EphemeralPortPool(
+                    self.source_ip_address, proto)
+            port_pool = self.port_pools[proto]
+        return port_pool.get_port()
+
+    def geolocation_cache_key(self):
+        return utils.geolocate.get_cache_key(self.iface, self.source_ip_address)
+
+    def update_geolocation(self, geolocation, new_geolocation):
+        """ Fill a geolocation that was refreshed during the trace into the measurements """
+        _, public_ip, _, _, _, _ = geolocation
+        _, new_public_ip, network_asn, network_name, country_code, city = new_geolocation
+        fields = {"asn": network_asn, "asname": network_name, "cc": country_code,
+                  "city": city}
+        for access_block_steps in range(2 if self.have_2_packet else 1):
+            for ip_steps, measurement in enumerate(self.measurement_data[access_block_steps]):
+                measurement.__dict__.update(fields)
+                self.measurement_writer.update_measurement(
+                    self.measurement_index(access_block_steps, ip_steps), fields)
+        if new_public_ip != public_ip:
+            return new_public_ip
+        return None
+
+    def close_port_pools(self):
+        with self.port_pools_lock:
+            for port_pool in self.port_pools.values():
+                port_pool.close()
+            self.port_pools = {}
+
+    def get_probe_timeout(self, request_ip, current_ttl, timeout):
+        if self.rtt_estimator is None:
+            return timeout
+        return self.rtt_estimator.timeout(request_ip, current_ttl, timeout)
+
+    def add_probe_rtt(self, request_ip, current_ttl, answer_ip, elapsed_ms):
+        if self.rtt_estimator is None:
+            return
+        if answer_ip == "***":
+            self.rtt_estimator.add_timeout(request_ip, current_ttl)
+        else:
+            self.rtt_estimator.add_rtt(request_ip, current_ttl, elapsed_ms)
+
+    def send_receive(self, request_packets, timeout, multi=False):
+        if not isinstance(request_packets, list):
+            request_packets = [request_packets]
+        # build them once, so random fields have the same value in the
+        # matching table as on the wire
+        request_packets = [IP(raw(request_packet))
+                           for request_packet in request_packets]
+        if self.probe_transport is not None:
+            if multi:
+                return self.probe_transport.sr(
+                    request_packets, timeout, multi, self.quiet_interval,
+                    is_final_answer)
+            return self.probe_transport.sr(request_packets, timeout, multi)
+        l3_socket = conf.L3socket(iface=self.iface)
+        try:
+            return sndrcv(l3_socket, request_packets, verbose=0,
+                          timeout=timeout, multi=multi)
+        finally:
+            l3_socket.close()
+
+    def send_only(self, request_packet):
+        if self.probe_transport is not None:
+            self.probe_transport.send(request_packet)
+        else:
+            send(request_packet, iface=self.iface, verbose=0)
+
+    def send_packet_with_tcphandshake(self, this_request, timeout):
+        timestamp_start, new_timestamp = get_new_timestamp()
+        ip_address = this_request[IP].dst
+        destination_port = this_request[TCP].dport
+        syn_tcp_options = generate_syn_tcp_options(new_timestamp)
+        ans = []
+        max_repeat = 0
+        # here we are trying to do a new TCP handshake every time because
+        # we are trying to trace packet data, not SYN packet. And
+        # we know about intermittent stream blocking
+        while len(ans) == 0 and max_repeat < 5:
+            source_port = self.get_source_port("tcp")
+            send_syn = IP(src=self.source_ip_address,
+                          dst=ip_address, id=RandShort(), flags="DF")/TCP(
+                sport=source_port, dport=destination_port, seq=RandInt(),
+                flags="S", options=syn_tcp_options)
+            tcp_handshake_timeout = timeout + max_repeat
+            ans, unans = self.send_receive(send_syn, tcp_handshake_timeout)
+            if len(ans) == 0:
+                print("Warning: No response to SYN packet yet")
+            max_repeat += 1
+        if len(ans) == 0:
+            print("Error: doing TCP handshake failed "
+                  + str(max_repeat)
+                  + " times. You should test with PingVis instead")  # todo: xhdix
+            return ans, unans
+        else:
+            timeout += 2  # we should wait more for data packets.
+            syn_ack_timestamp = get_timestamp(ans[0][1][TCP].options)
+            new_timestamp = new_timestamp + \
+                int((time.time() - timestamp_start) * 1000)
+            ack_tcp_options = generate_ack_tcp_options(
+                new_timestamp, syn_ack_timestamp)
+            send_ack = IP(src=self.source_ip_address,
+                          dst=ip_address, id=(ans[0][0][IP].id + 1), flags="DF")/TCP(
+                sport=source_port, dport=destination_port, seq=ans[0][1][TCP].ack,
+                ack=ans[0][1][TCP].seq + 1, flags="A", options=ack_tcp_options)
+            self.send_only(send_ack)
+            send_data = this_request
+            send_data[IP].src = self.source_ip_address
+            send_data[IP].id = ans[0][0][IP].id + 2
+            send_data[TCP].sport = source_port
+            send_data[TCP].seq = ans[0][1][TCP].ack
+            send_data[TCP].ack = ans[0][1][TCP].seq + 1
+            send_data[TCP].options = tcp_options_correction(
+                send_data[TCP].options, new_timestamp, syn_ack_timestamp)
+            del(send_data[TCP].chksum)
+            del(send_data[IP].len)
+            del(send_data[IP].chksum)
+            request_and_answers, unanswered = self.send_receive(
+                send_data, timeout, multi=True)
+            # send_fin = send_ack.copy() # todo: xhdix
+            # send_fin[IP].id=ans[0][0][IP].id + 1
+            # send_fin[TCP].flags = "FA"
+            # send(send_fin, verbose=0)
+            # send_last_ack=send_fin.copy()
+            # send_last_ack[IP].id=send_fin[IP].id + 1
+            # send_last_ack[TCP].flags = "A"
+            # send(send_last_ack, verbose=0)
+            return request_and_answers, unanswered
+
+    def prepare_single_packet(self, this_request):
+        this_request[IP].id = RandShort()
+        if this_request.haslayer(TCP):
+            this_request[TCP].sport = self.get_source_port("tcp")
+            if this_request[TCP].flags == "S":
+                this_request[TCP].seq = RandInt()
+            _, new_timestamp = get_new_timestamp()
+            this_request[TCP].options = tcp_options_correction(
+                this_request[TCP].options, new_timestamp, 0)
+            del(this_request[TCP].chksum)
+        elif this_request.haslayer(UDP):
+            this_request[UDP].sport = self.get_source_port("udp")
+            del(this_request[UDP].len)
+            del(this_request[UDP].chksum)
+        if this_request.haslayer(DNS):
+            this_request[DNS].id = RandShort()
+        del(this_request[IP].len)
+        del(this_request[IP].chksum)
+        return this_request
+
+    def send_single_packet(self, this_request, timeout):
+        this_request = self.prepare_single_packet(this_request)
+        request_and_answers, unanswered = self.send_receive(this_request, timeout)
+        return request_and_answers, unanswered
+
+    def retransmission_single_packet(self, this_request, timeout, is_data_packet):
+        this_request[IP].id += 1
+        del(this_request[IP].chksum)
+        if is_data_packet:
+            request_and_answers, unanswered = self.send_receive(
+                this_request, timeout, multi=True)
+        else:
+            request_and_answers, unanswered = self.send_receive(
+                this_request, timeout)
+        return request_and_answers, unanswered
+
+    def send_packet(self, request_packet, request_ip, current_ttl, timeout, do_tcphandshake, trace_retransmission, do_not_parse):
+        this_request = request_packet
+        this_request[IP].src = self.source_ip_address
+        this_request[IP].dst = request_ip
+        this_request[IP].ttl = current_ttl
+        if not do_not_parse:
+            timeout = self.get_probe_timeout(request_ip, current_ttl, timeout)
+            print(">>>request:"
+                  + "   ip.dst: " + request_ip
+                  + "   ip.ttl: " + str(current_ttl))
+        request_and_answers = []
+        unanswered = []
+        start_time = time.perf_counter()
+        if trace_retransmission:
+            request_and_answers, unanswered = self.retransmission_single_packet(
+                this_request, timeout, do_tcphandshake)
+        elif do_tcphandshake:
+            request_and_answers, unanswered = self.send_packet_with_tcphandshake(
+                this_request, timeout)
+        else:
+            request_and_answers, unanswered = self.send_single_packet(
+                this_request, timeout)
+        end_time = time.perf_counter()
+        elapsed_ms = float(format(abs((end_time - start_time) * 1000), '.3f'))
+        if do_not_parse:
+            return request_and_answers, unanswered
+        parsed_packet = parse_packet(
+            request_and_answers, unanswered, current_ttl, elapsed_ms, do_tcphandshake)
+        self.add_probe_rtt(request_ip, current_ttl, parsed_packet[0], parsed_packet[1])
+        return parsed_packet
+
+    def send_packet_batch(self, probes, timeout):
+        if len(probes) == 0:
+            return {}, {}, 0
+        # each probe in the batch gets its own IP id, so after scapy matched the
+        # replies by their quoted headers and ports we can put them back in
+        # their own hop even when two probes share the same destination and TTL
+        first_ip_id = int(RandShort())
+        for probe_steps, probe in enumerate(probes):
+            probe[IP].id = (first_ip_id + probe_steps) & 0xffff
+        start_time = time.perf_counter()
+        request_and_answers, unanswered = self.send_receive(probes, timeout)
+        end_time = time.perf_counter()
+        elapsed_ms = float(format(abs((end_time - start_time) * 1000), '.3f'))
+        answered_probes = {}
+        unanswered_probes = {}
+        for sentp, receivedp in request_and_answers:
+            answered_probes.setdefault(
+                probe_key(sentp), []).append(QueryAnswer(sentp, receivedp))
+        for sentp in unanswered:
+            unanswered_probes.setdefault(probe_key(sentp), []).append(sentp)
+        return answered_probes, unanswered_probes, elapsed_ms
+
+    def trace_ttl_window(
+            self, request_packets, request_ips, previous_node_ids, first_ttl, last_ttl,
+            timeout, continue_to_max_ttl):
+        probes = []
+        probe_steps = []
+        window_timeout = 0
+        access_block_steps = 0
+        while access_block_steps < len(request_packets):
+            ip_steps = 0
+            while ip_steps < len(request_ips):
+                if continue_to_max_ttl or not already_reached_destination_int(
+                        previous_node_ids[access_block_steps][ip_steps],
+                        request_ips[ip_steps]):
+                    for current_ttl in range(first_ttl, last_ttl + 1):
+                        this_request = request_packets[access_block_steps].copy()
+                        this_request[IP].src = self.source_ip_address
+                        this_request[IP].dst = request_ips[ip_steps]
+                        this_request[IP].ttl = current_ttl
+                        probes.append(self.prepare_single_packet(this_request))
+                        probe_steps.append(
+                            (access_block_steps, ip_steps, current_ttl))
+                        window_timeout = max(window_timeout, self.get_probe_timeout(
+                            request_ips[ip_steps], current_ttl, timeout))
+                ip_steps += 1
+            access_block_steps += 1
+        answered_probes, unanswered_probes, batch_elapsed_ms = self.send_packet_batch(
+            probes, window_timeout)
+        probe_keys = {}
+        for probe_step, probe in zip(probe_steps, probes):
+            probe_keys[probe_step] = probe_key(probe)
+        # results are added in the same hop order as the one-by-one trace
+        for current_ttl in range(first_ttl, last_ttl + 1):
+            access_block_steps = 0
+            while access_block_steps < len(request_packets):
+                ip_steps = 0
+                while ip_steps < len(request_ips):
+                    not_yet_destination = not (already_reached_destination_int(
+                        previous_node_ids[access_block_steps][ip_steps],
+                        request_ips[ip_steps]))
+                    if continue_to_max_ttl or not_yet_destination:
+                        print(">>>request:"
+                              + "   ip.dst: " + request_ips[ip_steps]
+                              + "   ip.ttl: " + str(current_ttl))
+                        this_probe_key = probe_keys[(
+                            access_block_steps, ip_steps, current_ttl)]
+                        answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered = parse_packet(
+                            SndRcvList(answered_probes.get(this_probe_key, [])),
+                            PacketList(unanswered_probes.get(
+                                this_probe_key, []), "Unanswered"),
+                            current_ttl, batch_elapsed_ms, False)
+                        self.add_probe_rtt(request_ips[ip_steps],
+                                      current_ttl, answer_ip, elapsed_ms)
+                        self.add_hop(
+                            access_block_steps, ip_steps, current_ttl, answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered
+                        )
+                        if not_yet_destination:
+                            previous_node_ids[access_block_steps][ip_steps] = answer_ip
+                        print(
+                            " · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
+                    else:
+                        # to avoid confusing the order of results when we have already reached our destination
+                        self.add_hop(
+                            access_block_steps, ip_steps, current_ttl, "", 0, 0, 0, "", None, None
+                        )
+                    ip_steps += 1
+                access_block_steps += 1
+
+    async def trace_destination_async(
+            self, executor, access_block_steps, ip_steps, request_packet, request_ip, max_ttl,
+            timeout, repeat_requests, do_tcphandshake, trace_retransmission,
+            trace_with_retransmission, continue_to_max_ttl):
+        loop = asyncio.get_running_loop()
+        this_measurement = self.measurement_data[access_block_steps][ip_steps]
+        # each destination has its own packet, so the coroutines never change
+        # the fields of a packet that is being sent by another one
+        current_packet = request_packet.copy()
+        next_send_time = 0
+        repeat_all_steps = 0
+        while repeat_all_steps < repeat_requests:
+            repeat_all_steps += 1
+            if trace_with_retransmission:
+                request_and_answers, unanswered = await loop.run_in_executor(
+                    executor, self.send_packet, request_packet.copy(), request_ip,
+                    0, 1, do_tcphandshake, False, True)
+                if len(request_and_answers) != 0:
+                    current_packet = request_and_answers[0][0].copy()
+                else:
+                    current_packet = unanswered[0].copy()
+                trace_retransmission = True
+            previous_node_id = self.source_ip_address
+            for current_ttl in range(1, max_ttl + 1):
+                not_yet_destination = not (already_reached_destination_int(
+                    previous_node_id, request_ip))
+                if not continue_to_max_ttl and not not_yet_destination:
+                    # to avoid confusing the order of results when we have already reached our destination
+                    self.add_hop(
+                        access_block_steps, ip_steps, current_ttl, "", 0, 0, 0, "", None, None
+                    )
+                    continue
+                # SLEEP_TIME is a rate limit for this destination only
+                wait_time = next_send_time - loop.time()
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+                answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered = await loop.run_in_executor(
+                    executor, self.send_packet, current_packet, request_ip, current_ttl,
+                    timeout, do_tcphandshake, trace_retransmission, False)
+                self.add_hop(
+                    access_block_steps, ip_steps, current_ttl, answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered
+                )
+                next_send_time = loop.time()
+                if answer_ip != "***":
+                    next_send_time += SLEEP_TIME
+                if not_yet_destination:
+                    previous_node_id = answer_ip
+                print(
+                    " · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
+        print(" · · · - · destination done: " + request_ip
+              + " (" + this_measurement.annotation + ")")
+
+    async def trace_destinations_async(
+            self, request_packets, request_ips, max_ttl, timeout, repeat_requests,
+            do_tcphandshake, trace_retransmission, trace_with_retransmission,
+            continue_to_max_ttl):
+        destinations = []
+        # every destination waits for its packets in its own thread; not the
+        # default executor, the event loop may not be ours
+        executor = ThreadPoolExecutor(
+            max_workers=max(len(request_packets) * len(request_ips), 1))
+        access_block_steps = 0
+        while access_block_steps < len(request_packets):
+            ip_steps = 0
+            while ip_steps < len(request_ips):
+                destinations.append(self.trace_destination_async(
+                    executor, access_block_steps, ip_steps,
+                    request_packets[access_block_steps], request_ips[ip_steps],
+                    max_ttl, timeout, repeat_requests,
+                    do_tcphandshake[access_block_steps], trace_retransmission,
+                    trace_with_retransmission, continue_to_max_ttl))
+                ip_steps += 1
+            access_block_steps += 1
+        with executor:
+            await asyncio.gather(*destinations)
+        return len(destinations) != 0
+
+    def measurement_index(self, access_block_steps, ip_steps):
+        # the same order as the measurements in the saved json file
+        if self.have_2_packet:
+            return ip_steps * 2 + access_block_steps
+        return ip_steps
+
+    def add_hop(self, access_block_steps, ip_steps, hop, *hop_info):
+        this_measurement = self.measurement_data[access_block_steps][ip_steps]
+        packetlist = None
+        _, rtt, _, _, _, answered, unanswered = hop_info
+        if self.packet_capture is not None and rtt != 0:
+            packetlist = self.packet_capture.write_packetlist(answered, unanswered)
+        this_measurement.add_hop(hop, *hop_info, packetlist=packetlist)
+        if self.measurement_writer is not None:
+            hop_result = this_measurement.result[hop - 1]["result"][-1]
+            self.measurement_writer.write_hop(
+                self.measurement_index(access_block_steps, ip_steps), hop, hop_result)
+            # the packets are in the jsonl file now, we don't need to keep them
+            hop_result.pop("packets", None)
+
+    def are_equal(self, original_list, result_list):
+        counter = 0
+        for item in original_list:
+            original_item = item
+            reault_item_1 = result_list[0][counter]
+            if reault_item_1 != original_item:
                 return False
-        counter += 1
-    return True
+            if self.have_2_packet:
+                reault_item_2 = result_list[1][counter]
+                if reault_item_2 != original_item:
+                    return False
+            counter += 1
+        return True
 
+    def initialize_first_nodes_json(self, request_ips):
+        nodes = []
+        for _ in request_ips:
+            nodes.append(self.source_ip_address)
+        if self.have_2_packet:
+            return [nodes, nodes.copy()]
+        else:
+            return [nodes]
 
-def initialize_first_nodes_json(request_ips):
-    nodes = []
-    for _ in request_ips:
-        nodes.append(user_source_ip_address)
-    if have_2_packet:
-        return [nodes, nodes.copy()]
-    else:
-        return [nodes]
-
-
-def initialize_json_first_nodes(
-        request_ips, annotation_1, annotation_2, packet_1_proto, packet_2_proto,
-        packet_1_port, packet_2_port, packet_1_size, packet_2_size, paris_id,
-        public_ip, network_asn, network_name, country_code, city):
-    start_time = int(datetime.utcnow().timestamp())
-    for request_ip in request_ips:
-        measurement_data[0].append(
-            traceroute_data(
-                dst_addr=request_ip, annotation=annotation_1,
-                src_addr=user_source_ip_address, proto=packet_1_proto, port=packet_1_port,
-                timestamp=start_time, paris_id=paris_id, size=packet_1_size,
-                from_ip=public_ip, network_asn=network_asn,
-                network_name=network_name, country_code=country_code, city=city
-            )
-        )
-        if have_2_packet:
-            measurement_data[1].append(
+    def initialize_json_first_nodes(
+            self, request_ips, annotation_1, annotation_2, packet_1_proto, packet_2_proto,
+            packet_1_port, packet_2_port, packet_1_size, packet_2_size, paris_id,
+            public_ip, network_asn, network_name, country_code, city):
+        start_time = int(datetime.utcnow().timestamp())
+        for request_ip in request_ips:
+            self.measurement_data[0].append(
                 traceroute_data(
-                    dst_addr=request_ip, annotation=annotation_2,
-                    src_addr=user_source_ip_address, proto=packet_2_proto, port=packet_2_port,
-                    timestamp=start_time, paris_id=paris_id, size=packet_2_size,
+                    dst_addr=request_ip, annotation=annotation_1,
+                    src_addr=self.source_ip_address, proto=packet_1_proto, port=packet_1_port,
+                    timestamp=start_time, paris_id=paris_id, size=packet_1_size,
                     from_ip=public_ip, network_asn=network_asn,
                     network_name=network_name, country_code=country_code, city=city
                 )
             )
+            if self.have_2_packet:
+                self.measurement_data[1].append(
+                    traceroute_data(
+                        dst_addr=request_ip, annotation=annotation_2,
+                        src_addr=self.source_ip_address, proto=packet_2_proto, port=packet_2_port,
+                        timestamp=start_time, paris_id=paris_id, size=packet_2_size,
+                        from_ip=public_ip, network_asn=network_asn,
+                        network_name=network_name, country_code=country_code, city=city
+                    )
+                )
 
+    def get_packets_info(self, request_packets):
+        packet_1_proto = ""
+        packet_2_proto = ""
+        packet_1_port = -1
+        packet_2_port = -1
+        packet_1_size = -1
+        packet_2_size = -1
+        if (request_packets[0]).haslayer(IP):
+            packet_1_proto = "IP"
+            packet_1_size = len(request_packets[0])
+        if (request_packets[0]).haslayer(TCP):
+            packet_1_proto = "TCP"
+            packet_1_port = request_packets[0][TCP].dport
+        elif (request_packets[0]).haslayer(UDP):
+            packet_1_proto = "UDP"
+            packet_1_port = request_packets[0][UDP].dport
+        elif(request_packets[0]).haslayer(ICMP):
+            packet_1_proto = "ICMP"
+        if self.have_2_packet:
+            if (request_packets[1]).haslayer(IP):
+                packet_2_proto = "IP"
+                packet_2_size = len(request_packets[1])
+            if (request_packets[1]).haslayer(TCP):
+                packet_2_proto = "TCP"
+                packet_2_port = request_packets[1][TCP].dport
+            elif (request_packets[1]).haslayer(UDP):
+                packet_2_proto = "UDP"
+                packet_2_port = request_packets[1][UDP].dport
+            elif(request_packets[1]).haslayer(ICMP):
+                packet_2_proto = "ICMP"
+        return packet_1_proto, packet_2_proto, packet_1_port, packet_2_port, packet_1_size, packet_2_size
 
-def get_packets_info(request_packets):
-    packet_1_proto = ""
-    packet_2_proto = ""
-    packet_1_port = -1
-    packet_2_port = -1
-    packet_1_size = -1
-    packet_2_size = -1
-    if (request_packets[0]).haslayer(IP):
-        packet_1_proto = "IP"
-        packet_1_size = len(request_packets[0])
-    if (request_packets[0]).haslayer(TCP):
-        packet_1_proto = "TCP"
-        packet_1_port = request_packets[0][TCP].dport
-    elif (request_packets[0]).haslayer(UDP):
-        packet_1_proto = "UDP"
-        packet_1_port = request_packets[0][UDP].dport
-    elif(request_packets[0]).haslayer(ICMP):
-        packet_1_proto = "ICMP"
-    if have_2_packet:
-        if (request_packets[1]).haslayer(IP):
-            packet_2_proto = "IP"
-            packet_2_size = len(request_packets[1])
-        if (request_packets[1]).haslayer(TCP):
-            packet_2_proto = "TCP"
-            packet_2_port = request_packets[1][TCP].dport
-        elif (request_packets[1]).haslayer(UDP):
-            packet_2_proto = "UDP"
-            packet_2_port = request_packets[1][UDP].dport
-        elif(request_packets[1]).haslayer(ICMP):
-            packet_2_proto = "ICMP"
-    return packet_1_proto, packet_2_proto, packet_1_port, packet_2_port, packet_1_size, packet_2_size
-
-
-def save_measurement_data(
-        request_ips, measurement_name, continue_to_max_ttl, output_dir):
-    end_time = int(datetime.utcnow().timestamp())
-    measurement_data_json = []
-    ip_steps = 0
-    measurement_data_save = deepcopy(measurement_data)
-    while ip_steps < len(request_ips):
-        measurement_data_save[0][ip_steps].set_endtime(end_time)
-        if not continue_to_max_ttl:
-            measurement_data_save[0][ip_steps].clean_extra_result()
-        measurement_data_json.append(measurement_data_save[0][ip_steps])
-        if have_2_packet:
-            measurement_data_save[1][ip_steps].set_endtime(end_time)
-            if not continue_to_max_ttl:
-                measurement_data_save[1][ip_steps].clean_extra_result()
-            measurement_data_json.append(measurement_data_save[1][ip_steps])
-        ip_steps += 1
-    data_path = output_dir + measurement_name + ".json"
-    with open(data_path, "w") as jsonfile:
-        jsonfile.write(json.dumps(measurement_data_json,
-                       default=lambda o: o.__dict__, indent=4))
-    print("saved: " + data_path)
-    return data_path
-
-
-def generate_packets_for_each_ip(request_packets, request_ips, do_tcphandshake):
-    request_packets_for_rexmit = [[], []]
-    req_step = 0
-    print("· - · · · wait · - · · · in preparation · - · · ·")
-    for req_packet in request_packets:
-        for dst_ip in request_ips:
-            new_packet = req_packet.copy()
-            request_and_answers, unanswered = send_packet(
-                new_packet, dst_ip,
-                0, 1, do_tcphandshake[req_step], False, True)
-            if len(request_and_answers) != 0:
-                request_packets_for_rexmit[req_step].append(
-                    request_and_answers[0][0].copy())
-            else:
-                request_packets_for_rexmit[req_step].append(
-                    unanswered[0][0].copy())
-        req_step = 1
-    print("- · - · -     - · - · -     - · - · -     - · - · -")
-    print(
-        " ********************************************************************** ")
-    print(
-        " ********************************************************************** ")
-    print(
-        " ********************************************************************** ")
-    return request_packets_for_rexmit
+    def open_packet_capture(self, request_ips, measurement_name, output_dir, public_ip):
+        pcap_path = output_dir + measurement_name + ".pcap"
+        self.packet_capture = utils.pcap.PacketCapture(pcap_path, public_ip)
+        # kept after the capture is closed, to mask a refreshed public IP
+        self.pcap_path = pcap_path
+        ip_steps = 0
+        while ip_steps < len(request_ips):
+            # so the readers know where the packets of this measurement are
+            self.measurement_data[0][ip_steps].pcap = os.path.basename(pcap_path)
+            if self.have_2_packet:
+                self.measurement_data[1][ip_steps].pcap = os.path.basename(pcap_path)
+            ip_steps += 1
 
+    def close_packet_capture(self):
+        if self.packet_capture is not None:
+            self.packet_capture.close()
+            print("saved: " + self.packet_capture.pcap_path)
+            self.packet_capture = None
 
-def change_dst_port(request_packet, dst_port):
-    if request_packet.haslayer(TCP):
-        request_packet[TCP].dport = dst_port
-    elif request_packet.haslayer(UDP):
-        request_packet[UDP].dport = dst_port
-    return request_packet
+    def open_measurement_writer(self, request_ips, measurement_name, output_dir):
+        self.measurement_writer = utils.jsonl.MeasurementWriter(
+            output_dir + measurement_name + ".jsonl")
+        ip_steps = 0
+        while ip_steps < len(request_ips):
+            self.measurement_writer.write_measurement(
+                self.measurement_index(0, ip_steps), self.measurement_data[0][ip_steps])
+            if self.have_2_packet:
+                self.measurement_writer.write_measurement(
+                    self.measurement_index(1, ip_steps), self.measurement_data[1][ip_steps])
+            ip_steps += 1
 
+    def close_measurement_writer(self, continue_to_max_ttl):
+        end_time = int(datetime.utcnow().timestamp())
+        self.measurement_writer.close(end_time, continue_to_max_ttl)
+        data_path = self.measurement_writer.data_path
+        self.measurement_writer = None
+        return data_path
 
-def check_for_permission():
-    global user_iface
-    global user_source_ip_address
-    try:
-        this_request = IP(
-            src=user_source_ip_address,
-            dst=LOCALHOST, ttl=0)/TCP(
-            sport=0, dport=53)/DNS()
-        sr1(this_request, iface=user_iface, verbose=0, timeout=0)
-    except OSError:
-        print("Error: Unable to send a packet with unprivileged user. Please run as root/admin.")
-        sys.exit(1)
+    def save_measurement_data(self, continue_to_max_ttl, public_ip=None, asn_db=None):
+        jsonl_path = self.close_measurement_writer(continue_to_max_ttl)
+        return utils.jsonl.jsonl2json(
+            jsonl_path, remove_jsonl=True, public_ip=public_ip, asn_db=asn_db)
 
+    def generate_packets_for_each_ip(self, request_packets, request_ips, do_tcphandshake):
+        request_packets_for_rexmit = [[], []]
+        req_step = 0
+        print("· - · · · wait · - · · · in preparation · - · · ·")
+        for req_packet in request_packets:
+            for dst_ip in request_ips:
+                new_packet = req_packet.copy()
+                request_and_answers, unanswered = self.send_packet(
+                    new_packet, dst_ip,
+                    0, 1, do_tcphandshake[req_step], False, True)
+                if len(request_and_answers) != 0:
+                    request_packets_for_rexmit[req_step].append(
+                        request_and_answers[0][0].copy())
+                else:
+                    request_packets_for_rexmit[req_step].append(
+                        unanswered[0][0].copy())
+            req_step = 1
+        print("- · - · -     - · - · -     - · - · -     - · - · -")
+        print(
+            " ********************************************************************** ")
+        print(
+            " ********************************************************************** ")
+        print(
+            " ********************************************************************** ")
+        return request_packets_for_rexmit
 
-def trace_route(
-        ip_list, request_packet_1, output_dir: str,
-        max_ttl: int, timeout: int, repeat_requests: int,
-        request_packet_2: str = "", name_prefix: str = "",
-        annotation_1: str = "", annotation_2: str = "",
-        continue_to_max_ttl: bool = False,
-        do_tcph1: bool = False, do_tcph2: bool = False,
-        trace_retransmission: bool = False,
-        trace_with_retransmission: bool = False, iface=None,
-        dst_port: int = -1
-):
-    if iface is not None:
-        global user_iface
-        user_iface = iface
-        global user_source_ip_address
-        user_source_ip_address = get_if_addr(user_iface)
-    check_for_permission()
-    measurement_name = ""
-    request_packets = []
-    do_tcphandshake = []
-    request_ips = []
-    was_successful = False
-    global have_2_packet
-    repeat_all_steps = 0
-    paris_id = 0
-    if do_tcph1:
-        annotation_1 += " (+tcph)"
-    if do_tcph2:
-        annotation_2 += " (+tcph)"
-    if request_packet_1 is None:
-        print("packet is invalid!")
-        sys.exit(1)
-    if request_packet_2 == "":
-        if trace_retransmission:
-            request_packet_1[IP].id += 15  # == sysctl net.ipv4.tcp_retries2
-        if dst_port != -1:
-            request_packet_1 = change_dst_port(request_packet_1, dst_port)
-        request_packets.append(request_packet_1)
-        do_tcphandshake.append(do_tcph1)
-        have_2_packet = False
-    else:
-        if trace_retransmission:
-            request_packet_1[IP].id += 15  # == sysctl net.ipv4.tcp_retries2
-            request_packet_2[IP].id += 15  # == sysctl net.ipv4.tcp_retries2
-        if dst_port != -1:
-            request_packet_1 = change_dst_port(request_packet_1, dst_port)
-            request_packet_2 = change_dst_port(request_packet_2, dst_port)
-        request_packets.append(request_packet_1)
-        request_packets.append(request_packet_2)
-        do_tcphandshake.append(do_tcph1)
-        do_tcphandshake.append(do_tcph2)
-        have_2_packet = True
-    if len(ip_list) == 0:
-        if request_packet_1[IP].dst == "" or request_packet_1[IP].dst == LOCALHOST:
-            if have_2_packet:
-                if request_packet_2[IP].dst == "" or request_packet_2[IP].dst == LOCALHOST:
+    def check_for_permission(self):
+        try:
+            this_request = IP(
+                src=self.source_ip_address,
+                dst=LOCALHOST, ttl=0)/TCP(
+                sport=0, dport=53)/DNS()
+            sr1(this_request, iface=self.iface, verbose=0, timeout=0)
+        except OSError:
+            print("Error: Unable to send a packet with unprivileged user. Please run as root/admin.")
+            sys.exit(1)
+
+    def prepare_trace(
+            self, ip_list, request_packet_1, output_dir, repeat_requests,
+            request_packet_2, name_prefix, annotation_1, annotation_2,
+            do_tcph1, do_tcph2, trace_retransmission, trace_with_retransmission,
+            dst_port, quiet_interval, adaptive_timeout, packet_rate_limiter,
+            geolocation, pcap):
+        """ Everything before the first probe of trace_route and trace_route_async """
+        self.check_for_permission()
+        self.quiet_interval = quiet_interval
+        self.rtt_estimator = None
+        if adaptive_timeout:
+            self.rtt_estimator = RTTEstimator()
+        measurement_name = ""
+        request_packets = []
+        do_tcphandshake = []
+        request_ips = []
+        paris_id = 0
+        if do_tcph1:
+            annotation_1 += " (+tcph)"
+        if do_tcph2:
+            annotation_2 += " (+tcph)"
+        if request_packet_1 is None:
+            print("packet is invalid!")
+            sys.exit(1)
+        if request_packet_2 == "":
+            if trace_retransmission:
+                request_packet_1[IP].id += 15  # == sysctl net.ipv4.tcp_retries2
+            if dst_port != -1:
+                request_packet_1 = change_dst_port(request_packet_1, dst_port)
+            request_packets.append(request_packet_1)
+            do_tcphandshake.append(do_tcph1)
+            self.have_2_packet = False
+        else:
+            if trace_retransmission:
+                request_packet_1[IP].id += 15  # == sysctl net.ipv4.tcp_retries2
+                request_packet_2[IP].id += 15  # == sysctl net.ipv4.tcp_retries2
+            if dst_port != -1:
+                request_packet_1 = change_dst_port(request_packet_1, dst_port)
+                request_packet_2 = change_dst_port(request_packet_2, dst_port)
+            request_packets.append(request_packet_1)
+            request_packets.append(request_packet_2)
+            do_tcphandshake.append(do_tcph1)
+            do_tcphandshake.append(do_tcph2)
+            self.have_2_packet = True
+        if len(ip_list) == 0:
+            if request_packet_1[IP].dst == "" or request_packet_1[IP].dst == LOCALHOST:
+                if self.have_2_packet:
+                    if request_packet_2[IP].dst == "" or request_packet_2[IP].dst == LOCALHOST:
+                        print("You must set at least one IP. (--ips || -i)")
+                        sys.exit(1)
+                else:
                     print("You must set at least one IP. (--ips || -i)")
                     sys.exit(1)
             else:
-                print("You must set at least one IP. (--ips || -i)")
-                sys.exit(1)
+                request_ips.append(request_packet_1[IP].dst)
+            if self.have_2_packet:
+                if request_packet_2[IP].dst not in ["", LOCALHOST, request_ips[0]]:
+                    request_ips.append(request_packet_2[IP].dst)
         else:
-            request_ips.append(request_packet_1[IP].dst)
-        if have_2_packet:
-            if request_packet_2[IP].dst not in ["", LOCALHOST, request_ips[0]]:
-                request_ips.append(request_packet_2[IP].dst)
-    else:
-        request_ips = ip_list
-    p1_proto, p2_proto, p1_port, p2_port, p1_size, p2_size = get_packets_info(
-        request_packets)
-    if trace_with_retransmission:
-        paris_id = repeat_requests
-    elif trace_retransmission:
-        paris_id = -1
-
-    no_internet, public_ip, network_asn, network_name, country_code, city = utils.geolocate.run_geolocate()
-
-    measurement_name = (f"{name_prefix}-{network_asn}-tracevis-" if name_prefix else f"{network_asn}-tracevis-") + \
-        datetime.utcnow().strftime("%Y%m%d-%H%M")
-
-    initialize_json_first_nodes(
-        request_ips=request_ips, annotation_1=annotation_1, annotation_2=annotation_2,
-        packet_1_proto=p1_proto, packet_2_proto=p2_proto,
-        packet_1_port=p1_port, packet_2_port=p2_port,
-        packet_1_size=p1_size, packet_2_size=p2_size, paris_id=paris_id,
-        public_ip=public_ip, network_asn=network_asn, network_name=network_name,
-        country_code=country_code, city=city
-    )
-    print("- · - · -     - · - · -     - · - · -     - · - · -")
-    while repeat_all_steps < repeat_requests:
-        repeat_all_steps += 1
-        request_packets_for_rexmit = []
+            request_ips = ip_list
+        p1_proto, p2_proto, p1_port, p2_port, p1_size, p2_size = self.get_packets_info(
+            request_packets)
         if trace_with_retransmission:
-            request_packets_for_rexmit = generate_packets_for_each_ip(
-                request_packets, request_ips, do_tcphandshake)
-            trace_retransmission = True
-        previous_node_ids = initialize_first_nodes_json(request_ips)
-        for current_ttl in range(1, max_ttl + 1):
-            if not continue_to_max_ttl and are_equal(request_ips, previous_node_ids):
-                ip_steps = 0
-                access_block_steps = 0
-                while ip_steps < len(request_ips):
-                    # to avoid confusing the order of results when we have already reached our destination
-                    measurement_data[access_block_steps][ip_steps].add_hop(
-                        current_ttl, "", 0, 0, 0, "", None, None
-                    )
-                    ip_steps += 1
-                    if have_2_packet and ip_steps == len(request_ips) and access_block_steps == 0:
+            paris_id = repeat_requests
+        elif trace_retransmission:
+            paris_id = -1
+        # from the cache, so the probing starts at once; an expired one is
+        # refreshed in the background and filled in before saving
+        geolocation_lookup = None
+        if geolocation is None:
+            geolocation_lookup = utils.geolocate.GeolocationLookup(
+                self.geolocation_cache_key())
+            geolocation = geolocation_lookup.start()
+        _, public_ip, network_asn, network_name, country_code, city = geolocation
+
+        measurement_name = (f"{name_prefix}-{network_asn}-tracevis-" if name_prefix else f"{network_asn}-tracevis-") + \
+            datetime.utcnow().strftime("%Y%m%d-%H%M")
+
+        self.initialize_json_first_nodes(
+            request_ips=request_ips, annotation_1=annotation_1, annotation_2=annotation_2,
+            packet_1_proto=p1_proto, packet_2_proto=p2_proto,
+            packet_1_port=p1_port, packet_2_port=p2_port,
+            packet_1_size=p1_size, packet_2_size=p2_size, paris_id=paris_id,
+            public_ip=public_ip, network_asn=network_asn, network_name=network_name,
+            country_code=country_code, city=city
+        )
+        if pcap:
+            self.open_packet_capture(request_ips, measurement_name, output_dir, public_ip)
+        self.open_measurement_writer(request_ips, measurement_name, output_dir)
+        print("- · - · -     - · - · -     - · - · -     - · - · -")
+        self.probe_transport = utils.transport.ProbeTransport(
+            self.iface, packet_rate_limiter)
+        return request_packets, request_ips, do_tcphandshake, geolocation_lookup, geolocation
+
+    def close_trace(self):
+        self.probe_transport.close()
+        self.probe_transport = None
+        self.close_packet_capture()
+        self.close_port_pools()
+
+    def finish_trace(self, was_successful, continue_to_max_ttl, geolocation_lookup,
+                     geolocation, asn_db):
+        no_internet = geolocation[0]
+        pcap_path, self.pcap_path = self.pcap_path, None
+        if was_successful:
+            new_public_ip = None
+            if geolocation_lookup is not None:
+                new_geolocation = geolocation_lookup.wait()
+                no_internet = new_geolocation[0]
+                if new_geolocation != geolocation:
+                    new_public_ip = self.update_geolocation(geolocation, new_geolocation)
+            if new_public_ip is not None and pcap_path is not None:
+                # the pcap was masked with the cached public IP
+                utils.pcap.mask_pcap_file(pcap_path, new_public_ip)
+            print("saving measurement data...")
+            data_path = self.save_measurement_data(continue_to_max_ttl, new_public_ip, asn_db)
+            print("· · · - · -     · · · - · -     · · · - · -     · · · - · -")
+            return(was_successful, data_path, no_internet)
+        else:
+            self.close_measurement_writer(continue_to_max_ttl)
+            return(was_successful, "", no_internet)
+
+    async def trace_route_async(
+            self, ip_list, request_packet_1, output_dir: str,
+            max_ttl: int, timeout: int, repeat_requests: int,
+            request_packet_2: str = "", name_prefix: str = "",
+            annotation_1: str = "", annotation_2: str = "",
+            continue_to_max_ttl: bool = False,
+            do_tcph1: bool = False, do_tcph2: bool = False,
+            trace_retransmission: bool = False,
+            trace_with_retransmission: bool = False,
+            dst_port: int = -1,
+            quiet_interval: float = QUIET_INTERVAL, adaptive_timeout: bool = False,
+            packet_rate_limiter=None, geolocation=None, pcap: bool = False,
+            asn_db=None
+    ):
+        """ trace_route with a coroutine for each destination, in the running event loop """
+        loop = asyncio.get_running_loop()
+        # the geolocation and the files may block, so not in the event loop
+        request_packets, request_ips, do_tcphandshake, geolocation_lookup, geolocation = \
+            await loop.run_in_executor(None, functools.partial(
+                self.prepare_trace, ip_list, request_packet_1, output_dir, repeat_requests,
+                request_packet_2, name_prefix, annotation_1, annotation_2,
+                do_tcph1, do_tcph2, trace_retransmission, trace_with_retransmission,
+                dst_port, quiet_interval, adaptive_timeout, packet_rate_limiter,
+                geolocation, pcap))
+        try:
+            was_successful = await self.trace_destinations_async(
+                request_packets, request_ips, max_ttl, timeout, repeat_requests,
+                do_tcphandshake, trace_retransmission, trace_with_retransmission,
+                continue_to_max_ttl)
+        finally:
+            self.close_trace()
+        return await loop.run_in_executor(None, functools.partial(
+            self.finish_trace, was_successful, continue_to_max_ttl, geolocation_lookup,
+            geolocation, asn_db))
+
+    def trace_route(
+            self, ip_list, request_packet_1, output_dir: str,
+            max_ttl: int, timeout: int, repeat_requests: int,
+            request_packet_2: str = "", name_prefix: str = "",
+            annotation_1: str = "", annotation_2: str = "",
+            continue_to_max_ttl: bool = False,
+            do_tcph1: bool = False, do_tcph2: bool = False,
+            trace_retransmission: bool = False,
+            trace_with_retransmission: bool = False,
+            dst_port: int = -1, ttl_window: int = 0, use_asyncio: bool = False,
+            quiet_interval: float = QUIET_INTERVAL, adaptive_timeout: bool = False,
+            packet_rate_limiter=None, geolocation=None, pcap: bool = False,
+            asn_db=None
+    ):
+        if use_asyncio:
+            if ttl_window > 0:
+                print("Notice: TTL window is not used with asyncio")
+            return asyncio.run(self.trace_route_async(
+                ip_list=ip_list, request_packet_1=request_packet_1, output_dir=output_dir,
+                max_ttl=max_ttl, timeout=timeout, repeat_requests=repeat_requests,
+                request_packet_2=request_packet_2, name_prefix=name_prefix,
+                annotation_1=annotation_1, annotation_2=annotation_2,
+                continue_to_max_ttl=continue_to_max_ttl,
+                do_tcph1=do_tcph1, do_tcph2=do_tcph2,
+                trace_retransmission=trace_retransmission,
+                trace_with_retransmission=trace_with_retransmission,
+                dst_port=dst_port, quiet_interval=quiet_interval,
+                adaptive_timeout=adaptive_timeout,
+                packet_rate_limiter=packet_rate_limiter, geolocation=geolocation,
+                pcap=pcap, asn_db=asn_db))
+        request_packets, request_ips, do_tcphandshake, geolocation_lookup, geolocation = \
+            self.prepare_trace(
+                ip_list, request_packet_1, output_dir, repeat_requests,
+                request_packet_2, name_prefix, annotation_1, annotation_2,
+                do_tcph1, do_tcph2, trace_retransmission, trace_with_retransmission,
+                dst_port, quiet_interval, adaptive_timeout, packet_rate_limiter,
+                geolocation, pcap)
+        if ttl_window > 0 and (trace_retransmission or trace_with_retransmission
+                               or True in do_tcphandshake):
+            print("Notice: TTL window is not supported with rexmit, paris or TCP handshake")
+            print("tracing TTL steps one by one")
+            ttl_window = 0
+        was_successful = False
+        repeat_all_steps = 0
+        try:
+            while repeat_all_steps < repeat_requests:
+                repeat_all_steps += 1
+                request_packets_for_rexmit = []
+                if trace_with_retransmission:
+                    request_packets_for_rexmit = self.generate_packets_for_each_ip(
+                        request_packets, request_ips, do_tcphandshake)
+                    trace_retransmission = True
+                previous_node_ids = self.initialize_first_nodes_json(request_ips)
+                first_ttl = 1
+                while ttl_window > 0 and first_ttl <= max_ttl:
+                    last_ttl = min(first_ttl + ttl_window - 1, max_ttl)
+                    if continue_to_max_ttl or not self.are_equal(request_ips, previous_node_ids):
+                        print(
+                            "  · - · - · repeat step: " + str(repeat_all_steps)
+                            + "  · - · - ·  ttl steps: " + str(first_ttl)
+                            + " to " + str(last_ttl) + " · - · - ·")
+                        print(" · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
+                        was_successful = True
+                    self.trace_ttl_window(
+                        request_packets, request_ips, previous_node_ids,
+                        first_ttl, last_ttl, timeout, continue_to_max_ttl)
+                    first_ttl = last_ttl + 1
+                if ttl_window > 0:
+                    continue
+                for current_ttl in range(1, max_ttl + 1):
+                    if not continue_to_max_ttl and self.are_equal(request_ips, previous_node_ids):
                         ip_steps = 0
-                        access_block_steps = 1
-            else:
-                ip_steps = 0
-                access_block_steps = 0
-                print(
-                    "  · - · - · repeat step: " + str(repeat_all_steps)
-                    + "  · - · - ·  ttl step: " + str(current_ttl) + " · - · - ·")
-                print(" · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
-                while ip_steps < len(request_ips):
-                    sleep_time = SLEEP_TIME
-                    not_yet_destination = not (already_reached_destination_int(
-                        previous_node_ids[access_block_steps][ip_steps],
-                        request_ips[ip_steps]))
-                    current_packet = None
-                    if trace_with_retransmission:
-                        current_packet = request_packets_for_rexmit[access_block_steps][ip_steps]
-                    else:
-                        current_packet = request_packets[access_block_steps]
-                    if not continue_to_max_ttl:
-                        if not_yet_destination:
-                            answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered = send_packet(
-                                current_packet, request_ips[ip_steps],
-                                current_ttl, timeout, do_tcphandshake[access_block_steps],
-                                trace_retransmission, False)
-                            measurement_data[access_block_steps][ip_steps].add_hop(
-                                current_ttl, answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered
-                            )
-                        else:
-                            sleep_time = 0
+                        access_block_steps = 0
+                        while ip_steps < len(request_ips):
                             # to avoid confusing the order of results when we have already reached our destination
-                            measurement_data[access_block_steps][ip_steps].add_hop(
-                                current_ttl, "", 0, 0, 0, "", None, None
+                            self.add_hop(
+                                access_block_steps, ip_steps, current_ttl, "", 0, 0, 0, "", None, None
                             )
+                            ip_steps += 1
+                            if self.have_2_packet and ip_steps == len(request_ips) and access_block_steps == 0:
+                                ip_steps = 0
+                                access_block_steps = 1
                     else:
-                        answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered = send_packet(
-                            current_packet, request_ips[ip_steps],
-                            current_ttl, timeout, do_tcphandshake[access_block_steps],
-                            trace_retransmission, False)
-                        measurement_data[access_block_steps][ip_steps].add_hop(
-                            current_ttl, answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered
-                        )
-                    if not_yet_destination:
-                        if answer_ip == "***":
-                            sleep_time = 0
-                        previous_node_ids[access_block_steps][ip_steps] = answer_ip
-                    print(
-                        " · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
-                    if have_2_packet or len(request_ips) > 1:
-                        sleep(sleep_time)
-                    else:
-                        sleep(0.1)
-                    ip_steps += 1
-                    was_successful = True
-                    if have_2_packet and ip_steps == len(request_ips) and access_block_steps == 0:
                         ip_steps = 0
-                        access_block_steps = 1
+                        access_block_steps = 0
+                        print(
+                            "  · - · - · repeat step: " + str(repeat_all_steps)
+                            + "  · - · - ·  ttl step: " + str(current_ttl) + " · - · - ·")
+                        print(" · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
+                        while ip_steps < len(request_ips):
+                            sleep_time = SLEEP_TIME
+                            not_yet_destination = not (already_reached_destination_int(
+                                previous_node_ids[access_block_steps][ip_steps],
+                                request_ips[ip_steps]))
+                            current_packet = None
+                            if trace_with_retransmission:
+                                current_packet = request_packets_for_rexmit[access_block_steps][ip_steps]
+                            else:
+                                current_packet = request_packets[access_block_steps]
+                            if not continue_to_max_ttl:
+                                if not_yet_destination:
+                                    answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered = self.send_packet(
+                                        current_packet, request_ips[ip_steps],
+                                        current_ttl, timeout, do_tcphandshake[access_block_steps],
+                                        trace_retransmission, False)
+                                    self.add_hop(
+                                        access_block_steps, ip_steps, current_ttl, answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered
+                                    )
+                                else:
+                                    sleep_time = 0
+                                    # to avoid confusing the order of results when we have already reached our destination
+                                    self.add_hop(
+                                        access_block_steps, ip_steps, current_ttl, "", 0, 0, 0, "", None, None
+                                    )
+                            else:
+                                answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered = self.send_packet(
+                                    current_packet, request_ips[ip_steps],
+                                    current_ttl, timeout, do_tcphandshake[access_block_steps],
+                                    trace_retransmission, False)
+                                self.add_hop(
+                                    access_block_steps, ip_steps, current_ttl, answer_ip, elapsed_ms, packet_size, req_answer_ttl, answer_summary, answered, unanswered
+                                )
+                            if not_yet_destination:
+                                if answer_ip == "***":
+                                    sleep_time = 0
+                                previous_node_ids[access_block_steps][ip_steps] = answer_ip
+                            print(
+                                " · · · - - - · · ·     · · · - - - · · ·     · · · - - - · · · ")
+                            if self.have_2_packet or len(request_ips) > 1:
+                                sleep(sleep_time)
+                            else:
+                                sleep(0.1)
+                            ip_steps += 1
+                            was_successful = True
+                            if self.have_2_packet and ip_steps == len(request_ips) and access_block_steps == 0:
+                                ip_steps = 0
+                                access_block_steps = 1
+                                print(
+                                    " ********************************************************************** ")
                         print(
                             " ********************************************************************** ")
-                print(
-                    " ********************************************************************** ")
-                print(
-                    " ********************************************************************** ")
-                print(
-                    " ********************************************************************** ")
-    if was_successful:
-        print("saving measurement data...")
-        data_path = save_measurement_data(
-            request_ips, measurement_name, continue_to_max_ttl, output_dir)
-        print("· · · - · -     · · · - · -     · · · - · -     · · · - · -")
-        return(was_successful, data_path, no_internet)
-    else:
-        return(was_successful, "", no_internet)
+                        print(
+                            " ********************************************************************** ")
+                        print(
+                            " ********************************************************************** ")
+        finally:
+            self.close_trace()
+        return self.finish_trace(
+            was_successful, continue_to_max_ttl, geolocation_lookup, geolocation, asn_db)
+
+
+def trace_route(
+        ip_list, request_packet_1, output_dir: str,
+        max_ttl: int, timeout: int, repeat_requests: int,
+        request_packet_2: str = "", name_prefix: str = "",
+        annotation_1: str = "", annotation_2: str = "",
+        continue_to_max_ttl: bool = False,
+        do_tcph1: bool = False, do_tcph2: bool = False,
+        trace_retransmission: bool = False,
+        trace_with_retransmission: bool = False, iface=None,
+        dst_port: int = -1, ttl_window: int = 0, use_asyncio: bool = False,
+        quiet_interval: float = QUIET_INTERVAL, adaptive_timeout: bool = False,
+        packet_rate_limiter=None, geolocation=None, pcap: bool = False,
+        asn_db=None
+):
+    return TraceSession(iface).trace_route(
+        ip_list=ip_list, request_packet_1=request_packet_1, output_dir=output_dir,
+        max_ttl=max_ttl, timeout=timeout, repeat_requests=repeat_requests,
+        request_packet_2=request_packet_2, name_prefix=name_prefix,
+        annotation_1=annotation_1, annotation_2=annotation_2,
+        continue_to_max_ttl=continue_to_max_ttl,
+        do_tcph1=do_tcph1, do_tcph2=do_tcph2,
+        trace_retransmission=trace_retransmission,
+        trace_with_retransmission=trace_with_retransmission,
+        dst_port=dst_port, ttl_window=ttl_window, use_asyncio=use_asyncio,
+        quiet_interval=quiet_interval, adaptive_timeout=adaptive_timeout,
+        packet_rate_limiter=packet_rate_limiter, geolocation=geolocation,
+        pcap=pcap, asn_db=asn_db)
+
+
+
+async def trace_route_async(
+        ip_list, request_packet_1, output_dir: str,
+        max_ttl: int, timeout: int, repeat_requests: int,
+        request_packet_2: str = "", name_prefix: str = "",
+        annotation_1: str = "", annotation_2: str = "",
+        continue_to_max_ttl: bool = False,
+        do_tcph1: bool = False, do_tcph2: bool = False,
+        trace_retransmission: bool = False,
+        trace_with_retransmission: bool = False, iface=None,
+        dst_port: int = -1,
+        quiet_interval: float = QUIET_INTERVAL, adaptive_timeout: bool = False,
+        packet_rate_limiter=None, geolocation=None, pcap: bool = False,
+        asn_db=None
+):
+    """ trace_route(use_asyncio=True) as a coroutine, for a running event loop """
+    return await TraceSession(iface).trace_route_async(
+        ip_list=ip_list, request_packet_1=request_packet_1, output_dir=output_dir,
+        max_ttl=max_ttl, timeout=timeout, repeat_requests=repeat_requests,
+        request_packet_2=request_packet_2, name_prefix=name_prefix,
+        annotation_1=annotation_1, annotation_2=annotation_2,
+        continue_to_max_ttl=continue_to_max_ttl,
+        do_tcph1=do_tcph1, do_tcph2=do_tcph2,
+        trace_retransmission=trace_retransmission,
+        trace_with_retransmission=trace_with_retransmission,
+        dst_port=dst_port, quiet_interval=quiet_interval,
+        adaptive_timeout=adaptive_timeout,
+        packet_rate_limiter=packet_rate_limiter, geolocation=geolocation,
+        pcap=pcap, asn_db=asn_db)
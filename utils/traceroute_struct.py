@@ -37,7 +37,8 @@ class traceroute_data:
         self.cc = country_code
         self.city = city
 
-    def add_hop(self, hop, from_ip, rtt, size, ttl, answer_summary, answered, unanswered):
+    def add_hop(self, hop, from_ip, rtt, size, ttl, answer_summary, answered, unanswered,
+                packetlist=None):
         if len(self.result) < hop:
             (self.result).append({"hop": hop, "result": []})
         if rtt == 0:
@@ -45,15 +46,17 @@ class traceroute_data:
                 "x": "-",
             })
         elif from_ip == "***":
-            packetlist = utils.convert_packetlist.packetlist2json(
-                answered, unanswered, self.from_ip)
+            if packetlist is None:
+                packetlist = utils.convert_packetlist.packetlist2json(
+                    answered, unanswered, self.from_ip)
             self.result[hop - 1]["result"].append({
                 "x": "*",
                 "packets": packetlist,
             })
         else:
-            packetlist = utils.convert_packetlist.packetlist2json(
-                answered, unanswered, self.from_ip)
+            if packetlist is None:
+                packetlist = utils.convert_packetlist.packetlist2json(
+                    answered, unanswered, self.from_ip)
             self.result[hop - 1]["result"].append({
                 "from": from_ip,
                 "rtt": rtt,
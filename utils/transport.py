@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+import ctypes
+import threading
+import time
+from multiprocessing import Value
+
+from scapy.all import ICMP, IP, TCP, UDP, conf
+from scapy.layers.inet import ICMPerror, IPerror, TCPerror, UDPerror
+from scapy.plist import PacketList, QueryAnswer, SndRcvList
+
+RECEIVE_POLL_TIME = 0.05  # Seconds
+ICMP_ERROR_TYPES = [3, 4, 5, 11, 12]
+
+
+def flow_key(sent_packet):
+    ip_layer = sent_packet[IP]
+    if sent_packet.haslayer(TCP):
+        return (ip_layer.dst, 6, sent_packet[TCP].sport, sent_packet[TCP].dport)
+    elif sent_packet.haslayer(UDP):
+        return (ip_layer.dst, 17, sent_packet[UDP].sport, sent_packet[UDP].dport)
+    elif sent_packet.haslayer(ICMP):
+        return (ip_layer.dst, 1, sent_packet[ICMP].id, sent_packet[ICMP].seq)
+    return (ip_layer.dst, ip_layer.proto, ip_layer.id)
+
+
+def reply_flow_key(received_packet):
+    if not received_packet.haslayer(IP):
+        return None
+    ip_layer = received_packet[IP]
+    if received_packet.haslayer(IPerror) and ip_layer.haslayer(ICMP) and (
+            ip_layer[ICMP].type in ICMP_ERROR_TYPES):
+        # the router quoted our packet, so the key is in the quoted headers
+        quoted_ip = received_packet[IPerror]
+        if quoted_ip.haslayer(TCPerror):
+            return (quoted_ip.dst, 6, quoted_ip[TCPerror].sport, quoted_ip[TCPerror].dport)
+        elif quoted_ip.haslayer(UDPerror):
+            return (quoted_ip.dst, 17, quoted_ip[UDPerror].sport, quoted_ip[UDPerror].dport)
+        elif quoted_ip.haslayer(ICMPerror):
+            return (quoted_ip.dst, 1, quoted_ip[ICMPerror].id, quoted_ip[ICMPerror].seq)
+        return (quoted_ip.dst, quoted_ip.proto, quoted_ip.id)
+    elif ip_layer.haslayer(TCP):
+        return (ip_layer.src, 6, ip_layer[TCP].dport, ip_layer[TCP].sport)
+    elif ip_layer.haslayer(UDP):
+        return (ip_layer.src, 17, ip_layer[UDP].dport, ip_layer[UDP].sport)
+    elif ip_layer.haslayer(ICMP):
+        return (ip_layer.src, 1, ip_layer[ICMP].id, ip_layer[ICMP].seq)
+    return None
+
+
+class PacketRateLimiter:
+    """ One packets-per-second budget, shared by all the worker processes """
+
+    def __init__(self, packets_per_second):
+        self._interval = 1 / packets_per_second
+        self._next_send_time = Value(ctypes.c_double, 0.0)
+
+    def wait(self):
+        with self._next_send_time.get_lock():
+            time_now = time.time()
+            send_time = max(time_now, self._next_send_time.value)
+            self._next_send_time.value = send_time + self._interval
+        if send_time > time_now:
+            time.sleep(send_time - time_now)
+
+
+class ProbeRound:
+    def __init__(self, multi, is_final_answer=None):
+        self.multi = multi
+        self.is_final_answer = is_final_answer
+        self.unanswered = 0
+        self.done = threading.Event()
+        self.new_answer = threading.Event()
+        self.final_answer_time = None
+        self.last_answer_time = None
+
+
+class WaitingProbe:
+    def __init__(self, sent, probe_round):
+        self.sent = sent
+        self.answers = []
+        self.probe_round = probe_round
+
+
+class ProbeTransport:
+    """ One raw socket and one receive loop for all the probes of a trace """
+
+    def __init__(self, iface=None, rate_limiter=None, l3_socket=None):
+        # an already open socket can be given, e.g. a fake one in the tests
+        self._socket = l3_socket if l3_socket is not None else conf.L3socket(iface=iface)
+        self._rate_limiter = rate_limiter
+        self._waiting = {}
+        self._waiting_lock = threading.Lock()
+        self._running = True
+        self._receive_error = None
+        self._receiver = threading.Thread(
+            target=self._receive_loop, daemon=True)
+        self._receiver.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def _receive_loop(self):
+        while self._running:
+            try:
+                # the L3 socket sends on one socket for each interface, so
+                # the replies can be on any of them
+                for ready_socket in self._socket.select([self._socket], RECEIVE_POLL_TIME):
+                    received_packet = ready_socket.recv()
+                    if received_packet is not None:
+                        self._dispatch(received_packet)
+            except (OSError, ValueError) as e:
+                if self._running:
+                    self._stop_receiving(e)
+                break
+
+    def _stop_receiving(self, error):
+        print(f"Error! receiving packets failed\n{error!s}")
+        with self._waiting_lock:
+            self._receive_error = error
+            # the waiting probes fail now, instead of at their timeout
+            for probes in self._waiting.values():
+                for probe in probes:
+                    probe.probe_round.new_answer.set()
+
+    def _dispatch(self, received_packet):
+        key = reply_flow_key(received_packet)
+        if key is None:
+            return
+        quoted_ip_id = None
+        if received_packet.haslayer(IPerror):
+            quoted_ip_id = received_packet[IPerror].id
+        with self._waiting_lock:
+            matching_probes = [
+                probe for probe in self._waiting.get(key, [])
+                if (len(probe.answers) == 0 or probe.probe_round.multi)
+                and received_packet.answers(probe.sent)]
+            # answers() does not check the IP id, so the probes of one flow
+            # with other TTLs match too; the quoted IP id tells them apart
+            matching_probes.sort(key=lambda probe: probe.sent[IP].id != quoted_ip_id)
+            if len(matching_probes) == 0:
+                return
+            probe = matching_probes[0]
+            probe_round = probe.probe_round
+            if len(probe.answers) == 0:
+                probe_round.unanswered -= 1
+            probe.answers.append(received_packet)
+            probe_round.last_answer_time = time.monotonic()
+            if probe_round.is_final_answer is not None and (
+                    probe_round.final_answer_time is None) and (
+                    probe_round.is_final_answer(received_packet)):
+                probe_round.final_answer_time = probe_round.last_answer_time
+            if probe_round.unanswered == 0 and not probe_round.multi:
+                probe_round.done.set()
+            probe_round.new_answer.set()
+
+    def send(self, packet):
+        if self._rate_limiter is not None:
+            self._rate_limiter.wait()
+        self._socket.send(packet)
+
+    def _wait(self, probe_round, timeout, quiet_interval):
+        deadline = time.monotonic() + timeout
+        while not probe_round.done.is_set():
+            if self._receive_error is not None:
+                raise OSError("receiving packets failed: " + str(self._receive_error))
+            wait_time = deadline - time.monotonic()
+            if probe_round.final_answer_time is not None:
+                # the answer we wait for is here, but there may be more
+                # packets on the way (e.g. RST/FIN from a middlebox), so we
+                # only stop when the flow is quiet
+                wait_time = min(
+                    wait_time,
+                    probe_round.last_answer_time + quiet_interval - time.monotonic())
+            if wait_time <= 0:
+                break
+            probe_round.new_answer.wait(wait_time)
+            probe_round.new_answer.clear()
+
+    def sr(self, packets, timeout, multi=False, quiet_interval=None,
+           is_final_answer=None):
+        if quiet_interval is None:
+            is_final_answer = None
+        probe_round = ProbeRound(multi, is_final_answer)
+        probes = []
+        with self._waiting_lock:
+            for sent in packets:
+                probe = WaitingProbe(sent, probe_round)
+                self._waiting.setdefault(flow_key(sent), []).append(probe)
+                probes.append(probe)
+            probe_round.unanswered = len(probes)
+        try:
+            for probe in probes:
+                self.send(probe.sent)
+            # like sr(), the timeout starts after the last packet is sent
+            self._wait(probe_round, timeout, quiet_interval)
+        finally:
+            with self._waiting_lock:
+                for probe in probes:
+                    key = flow_key(probe.sent)
+                    self._waiting[key].remove(probe)
+                    if len(self._waiting[key]) == 0:
+                        del self._waiting[key]
+        answered = []
+        unanswered = []
+        for probe in probes:
+            if len(probe.answers) == 0:
+                unanswered.append(probe.sent)
+            for received_packet in probe.answers:
+                answered.append(QueryAnswer(probe.sent, received_packet))
+        return SndRcvList(answered), PacketList(unanswered, "Unanswered")
+
+    def close(self):
+        self._running = False
+        self._receiver.join()
+        self._socket.close()
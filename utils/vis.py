@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 
+import gzip
 import ipaddress
 import json
 import os
+import tempfile
 
+import jinja2
 import networkx as nx
 import pyvis._version
 from pyvis.network import Network
 
+import utils.json_stream
+import utils.jsonl
+import utils.layout
+import utils.pcap
+
 ROUTER_COLOR = "green"
 WINDOWS_COLOR = "blue"
 LINUX_COLOR = "purple"
@@ -24,6 +32,15 @@ PEP_NAME = "PEP"
 NAT_NAME = "NAT"
 NO_RESPONSE_NAME = "unknown"
 
+# the tooltip of an edge is made from these columns in the template
+EDGE_TOOLTIP_COLUMNS = [
+    "request", "ttl", "backttl", "rtt", "size", "os", "packet", "flags",
+    "tcpflag", "count", "rtt_min", "rtt_max", "repeat"
+]
+NAT_FLAG = 1
+MIDDLEBOX_FLAG = 2
+PEP_FLAG = 4
+
 REQUEST_COLORS = [
     "DarkTurquoise", "HotPink", "LimeGreen", "Red", "DodgerBlue", "Orange",
     "MediumSlateBlue", "DarkGoldenrod", "Green", "Brown", "YellowGreen", "Magenta"
@@ -34,8 +51,59 @@ OFFLINE_TEMPLATE_PATH = os.path.dirname(
     __file__) + "/templates/template_offline.html.jinja"
 MAIN_TEMPLATE_PATH = os.path.dirname(
     __file__) + "/templates/template_main.html.jinja"
-
-multi_directed_graph = nx.MultiDiGraph()
+SHARED_TEMPLATE_PATH = os.path.dirname(
+    __file__) + "/templates/template_shared.html.jinja"
+ASSETS_PATH = os.path.dirname(__file__) + "/templates/assets"
+# next to the graphs, as in template_shared
+SHARED_ASSETS_DIR_NAME = "tracevis_assets"
+
+
+def load_templates():
+    """ Compile the templates once, for all the graphs saved in this process """
+    template_env = jinja2.Environment(loader=jinja2.FileSystemLoader(
+        os.path.dirname(MAIN_TEMPLATE_PATH)))
+    for template_path in [OFFLINE_TEMPLATE_PATH, MAIN_TEMPLATE_PATH, SHARED_TEMPLATE_PATH]:
+        template_env.get_template(os.path.basename(template_path))
+    return template_env
+
+
+def write_file_atomic(file_path, data):
+    # more graphs can be saved in the same directory at the same time
+    temp_file, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path))
+    with os.fdopen(temp_file, "wb") as f:
+        f.write(data)
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, file_path)
+
+
+def write_shared_assets(output_dir, gzip_assets=False):
+    """ Write the VisJS javascript and CSS once, for all the graphs of a directory """
+    shared_assets_dir = os.path.join(output_dir, SHARED_ASSETS_DIR_NAME)
+    os.makedirs(shared_assets_dir, exist_ok=True)
+    for asset_name in os.listdir(ASSETS_PATH):
+        asset_path = os.path.join(ASSETS_PATH, asset_name)
+        shared_asset_path = os.path.join(shared_assets_dir, asset_name)
+        asset_data = None
+        if not (os.path.exists(shared_asset_path) and
+                os.path.getsize(shared_asset_path) == os.path.getsize(asset_path)):
+            with open(asset_path, "rb") as f:
+                asset_data = f.read()
+            write_file_atomic(shared_asset_path, asset_data)
+        # for web servers that send the precompressed files (like gzip_static of
+        # nginx); browsers read the plain ones from the disk
+        if gzip_assets and (asset_data is not None or
+                            not os.path.exists(shared_asset_path + ".gz")):
+            if asset_data is None:
+                with open(asset_path, "rb") as f:
+                    asset_data = f.read()
+            write_file_atomic(shared_asset_path + ".gz", gzip.compress(
+                asset_data, compresslevel=9, mtime=0))
+
+
+def get_graph_path(measurement_path):
+    if measurement_path.endswith(".json"):
+        measurement_path = measurement_path[:-5]
+    return measurement_path + ".html"
 
 
 def get_packet_type(packet_obj):
@@ -177,52 +245,48 @@ def parse_ttl(response_ttl, current_ttl):
     return backttl, device_color, device_os_name, is_middlebox
 
 
-def visualize(previous_node_id, current_node_id,
-              current_node_label, current_node_title, device_color,
-              current_edge_title, requset_color, current_edge_label,
-              current_node_shape):
-    if not multi_directed_graph.has_node(current_node_id):
-        multi_directed_graph.add_node(current_node_id,
-                                      label=current_node_label, color=device_color,
-                                      title=current_node_title, shape=current_node_shape)
-    multi_directed_graph.add_edge(previous_node_id, current_node_id, label=current_edge_label,
-                                  color=requset_color, title=current_edge_title)
-
-
-def tooltips_append_lines(is_nat, is_middlebox, is_pep, packet_type, tcpflag):
-    append_line = ''
-    if packet_type == "TCP":
-        append_line = "<br/>response TCP flag: " + tcpflag
-    return ("<br/>NAT: " + str(is_nat)
-            + "<br/>Middlebox: " + str(is_middlebox)
-            + "<br/>PEP: " + str(is_pep)
-            + "<br/>response packet: " + packet_type
-            + append_line)
-
-
-def styled_tooltips(
-        current_request_color, current_ttl_str, backttl, request_ip, elapsed_ms,
-        packet_size, repeat_step, device_os_name, append_lines, annotation):
-    time_size = "*"
-    elapsed_ms_str = "*"
-    packet_size_str = "*"
-    if packet_size != "*":
-        packet_size_str = str(packet_size) + "B"
-    if elapsed_ms != "*":
-        elapsed_ms_str = str(format(elapsed_ms, '.3f')) + "ms"
-        time_size = str(format(elapsed_ms/packet_size, '.3f')) + "ms/B"
-    tooltips_str = "<pre style=\"color:" + current_request_color
-    tooltips_str += "\">TTL: " + current_ttl_str
-    tooltips_str += "<br/>Back-TTL: " + backttl
-    tooltips_str += "<br/>Request to: " + request_ip
-    tooltips_str += "<br/>annotation: " + annotation
-    tooltips_str += "<br/>Time: " + elapsed_ms_str
-    tooltips_str += "<br/>Size: " + packet_size_str
-    tooltips_str += "<br/>Time/Size: " + time_size
-    tooltips_str += "<br/>OS: " + device_os_name
-    tooltips_str += append_lines
-    tooltips_str += "<br/>Repeat step: " + repeat_step + "</pre>"
-    return tooltips_str
+def get_edge_tooltips(edge_tooltips):
+    """ The tooltips of the edges in columns; the template makes them in the browser """
+    requests = {}
+    strings = {}
+    columns = {column: [] for column in EDGE_TOOLTIP_COLUMNS}
+
+    def string_index(value):
+        if value is None:
+            return None
+        return strings.setdefault(value, len(strings))
+
+    def number_or_none(value):
+        if value == "*":
+            return None
+        return value
+
+    for edge_tooltip in edge_tooltips:
+        request = (edge_tooltip["current_request_color"], edge_tooltip["request_ip"],
+                   edge_tooltip["annotation"])
+        columns["request"].append(requests.setdefault(request, len(requests)))
+        columns["ttl"].append(int(edge_tooltip["current_ttl_str"]))
+        columns["backttl"].append(number_or_none(edge_tooltip["backttl"]))
+        columns["rtt"].append(number_or_none(edge_tooltip["elapsed_ms"]))
+        columns["size"].append(number_or_none(edge_tooltip["packet_size"]))
+        columns["os"].append(string_index(edge_tooltip["device_os_name"]))
+        response_packet = edge_tooltip["response_packet"]
+        if response_packet is None:
+            columns["packet"].append(None)
+            columns["flags"].append(0)
+            columns["tcpflag"].append(None)
+        else:
+            is_nat, is_middlebox, is_pep, packet_type, tcpflag = response_packet
+            columns["packet"].append(string_index(packet_type))
+            columns["flags"].append(
+                is_nat * NAT_FLAG + is_middlebox * MIDDLEBOX_FLAG + is_pep * PEP_FLAG)
+            columns["tcpflag"].append(string_index(tcpflag or None))
+        columns["count"].append(edge_tooltip["count"])
+        columns["rtt_min"].append(number_or_none(edge_tooltip["rtt_min"]))
+        columns["rtt_max"].append(number_or_none(edge_tooltip["rtt_max"]))
+        columns["repeat"].append(string_index(edge_tooltip["repeat_step"]))
+    return {"requests": list(requests.keys()), "strings": list(strings.keys()),
+            "columns": columns}
 
 
 def already_reached_destination_str(previous_node_id, dst_addr_id):
@@ -246,151 +310,310 @@ def initialize_first_nodes_nx(src_addr, length_all):
     return nodes
 
 
-def save_measurement_graph(graph_name, attach_jscss):
-    net_vis = Network("1500px", "1500px",
-                      directed=True, bgcolor="#eeeeee")
-    if pyvis._version.__version__ > '0.1.9':
-        net_vis.from_nx(multi_directed_graph, show_edge_weights=False)
-    else:
-        net_vis.from_nx(multi_directed_graph)
-    net_vis.set_edge_smooth('dynamic')
-    if attach_jscss:
-        net_vis.set_template(OFFLINE_TEMPLATE_PATH)
-    else:
-        net_vis.set_template(MAIN_TEMPLATE_PATH)
-    if graph_name.endswith(".json"):
-        graph_name = graph_name[:-5]
-    graph_path = graph_name + ".html"
-    net_vis.save_graph(graph_path)
-    print("saved: " + graph_path)
-
-
-def vis(measurement_path, attach_jscss, edge_lable: str = "none"):
-    all_measurements = []
-    was_successful = False
-    with open(measurement_path) as json_file:
-        all_measurements = json.load(json_file)
-    measurement_steps = 0
-    src_addr = all_measurements[0]["src_addr"]
-    src_addr_id = 'x' + str(int(ipaddress.IPv4Address(src_addr))) + 'x'
-    multi_directed_graph.add_node(
-        src_addr_id, label=src_addr, color="Chocolate", title="source address",
-        shape="diamond")
-    for measurement in all_measurements:
-        dst_addr = measurement["dst_addr"]
-        dst_addr_id = 'x' + str(int(ipaddress.IPv4Address(dst_addr))) + 'x'
-        annotation = "-"
-        if "annotation" in measurement.keys():
-            annotation = measurement["annotation"]
-        all_results = measurement["result"]
-        results_repeat_length = len(all_results[0]["result"])
-        previous_node_ids = initialize_first_nodes_nx(
-            src_addr_id, results_repeat_length)
-        already_detected = initialize_detected(results_repeat_length)
-        for try_step in all_results:  # will be up to 255
-            current_ttl = try_step["hop"]
-            current_ttl_str = str(current_ttl)
-            results = try_step["result"]
-            repeat_steps = 0
-            skip_next = False
-            for result in results:
-                if skip_next:
-                    skip_next = False
-                    continue
-                not_yet_destination = not (already_reached_destination_str(
-                    previous_node_ids[repeat_steps], dst_addr_id))
-                if not_yet_destination:
-                    if "late" in result.keys():
-                        skip_next = True
-                    current_node_label = "***"
-                    current_edge_title = "***"
-                    current_edge_label = ""
-                    current_node_id = "0"
-                    current_node_shape = "dot"
-                    elapsed_ms = "*"
-                    packet_size = "*"
-                    backttl = "*"
-                    device_color = NO_RESPONSE_COLOR
-                    device_name = NO_RESPONSE_NAME
-                    append_lines = ""
-                    is_middlebox = False
-                    if 'x' in result.keys():
-                        current_node_id = (
-                            "unknown" + previous_node_ids[repeat_steps] + "x")
-                        if edge_lable != "none":
-                            current_edge_label = "*"
-                    else:
-                        answer_ip = result["from"]
-                        backttl, device_color, device_name, is_middlebox_ttl = parse_ttl(
-                            result["ttl"], current_ttl)
-                        if "rtt" in result.keys():
-                            elapsed_ms = result["rtt"]
-                        if edge_lable == "rtt":
-                            if elapsed_ms != "*":
-                                current_edge_label = format(elapsed_ms, '.3f')
-                        elif edge_lable == "backttl":
-                            current_edge_label = str(backttl)
-                        current_node_id = 'x' + str(
-                            int(ipaddress.IPv4Address(answer_ip))) + 'x'
-                        if "packets" in result.keys():
-                            if "received" in result['packets'].keys():
-                                if len(result['packets']['received']) != 0:
-                                    is_nat, is_middlebox, is_pep, packet_type, tcpflag = detect_nat_pep_middlebox(
-                                        result['packets']['sent'], result['packets']['received']
-                                    )
-                                    if (is_middlebox_ttl or is_middlebox
-                                            ) and not already_detected[repeat_steps]["is_middlebox"]:
-                                        pass  # we decide about it later
-                                    elif is_pep and not already_detected[repeat_steps]["is_pep"]:
-                                        device_color = PEP_COLOR
-                                        device_name = PEP_NAME
-                                        current_node_shape = "star"
-                                        already_detected[repeat_steps]["is_pep"] = True
-                                        if current_node_id != dst_addr_id:
-                                            current_node_id = "pep" + current_node_id + "x"
-                                    elif is_nat and not already_detected[repeat_steps]["is_nat"]:
-                                        device_color = NAT_COLOR
-                                        device_name = NAT_NAME
-                                        already_detected[repeat_steps]["is_nat"] = True
-                                        if current_node_id != dst_addr_id:
-                                            current_node_id = "nat" + current_node_id + "x"
-                                    append_lines = tooltips_append_lines(
-                                        is_nat, is_middlebox, is_pep, packet_type, tcpflag)
-                                    if (is_middlebox_ttl or is_middlebox):
-                                        already_detected[repeat_steps]["is_middlebox"] = True
-                                    if is_pep:
-                                        already_detected[repeat_steps]["is_pep"] = True
-                                    if is_nat:
-                                        already_detected[repeat_steps]["is_nat"] = True
-                        if is_middlebox_ttl or is_middlebox:
-                            current_node_id = "middlebox" + current_node_id + "x"
-                            current_node_shape = "star"
-                            device_color = MIDDLEBOX_COLOR
-                            device_name = MIDDLEBOX_NAME
-                            already_detected[repeat_steps]["is_middlebox"] = True
-                        elif current_node_id == dst_addr_id:
-                            current_node_shape = "square"
-                        current_node_label = answer_ip
-                        packet_size = result["size"]
-                    repeat_step_str = str(repeat_steps + 1)
-                    current_edge_title = styled_tooltips(
-                        current_request_color=(
-                            REQUEST_COLORS[measurement_steps]),
-                        current_ttl_str=current_ttl_str, backttl=str(backttl),
-                        request_ip=dst_addr, elapsed_ms=elapsed_ms,
-                        packet_size=packet_size, repeat_step=repeat_step_str,
-                        device_os_name=device_name, append_lines=append_lines,
-                        annotation=annotation
-                    )
-                    visualize(
-                        previous_node_ids[repeat_steps], current_node_id,
-                        current_node_label, device_name, device_color,
-                        current_edge_title, REQUEST_COLORS[measurement_steps],
-                        current_edge_label, current_node_shape
-                    )
-                    previous_node_ids[repeat_steps] = current_node_id
-                repeat_steps += 1
-        measurement_steps += 1
-    print("saving measurement graph...")
-    save_measurement_graph(measurement_path, attach_jscss)
-    print("· · · - · -     · · · - · -     · · · - · -     · · · - · -")
+class GraphBuilder:
+    """ The graph of one measurement file, so more than one can be made in a process """
+
+    def __init__(self, template_env=None, asn_db=None, reverse_resolver=None):
+        # the templates of load_templates(), if more graphs are saved with them
+        self.template_env = template_env
+        # an utils.asn_db.AsnDatabase, for the hops without an ASN in the file
+        self.asn_db = asn_db
+        self.hop_asns = {}
+        # an utils.rdns.ReverseResolver, for the names of the hops
+        self.reverse_resolver = reverse_resolver
+        self.hop_names = {}
+        self.multi_directed_graph = nx.MultiDiGraph()
+        # node -> ASN, so the edges between two ASes can be marked
+        self.node_asns = {}
+        # (previous node, current node, measurement) -> the same edge of all repeats
+        self.edge_stats = {}
+
+    def visualize(self, previous_node_id, current_node_id,
+                  current_node_label, current_node_title, device_color,
+                  current_edge_tooltip, requset_color, current_edge_label,
+                  current_node_shape, measurement_steps, current_node_asn=None):
+        if not self.multi_directed_graph.has_node(current_node_id):
+            self.multi_directed_graph.add_node(current_node_id,
+                                          label=current_node_label, color=device_color,
+                                          title=current_node_title, shape=current_node_shape)
+            if current_node_asn is not None:
+                self.node_asns[current_node_id] = current_node_asn
+        edge_key = (previous_node_id, current_node_id, measurement_steps)
+        if edge_key not in self.edge_stats.keys():
+            self.edge_stats[edge_key] = {
+                "label": current_edge_label, "color": requset_color,
+                "tooltip": current_edge_tooltip, "repeat_steps": [], "count": 0,
+                "rtt_count": 0, "rtt_min": 0, "rtt_max": 0, "rtt_sum": 0}
+        this_edge = self.edge_stats[edge_key]
+        this_edge["count"] += 1
+        this_edge["repeat_steps"].append(current_edge_tooltip["repeat_step"])
+        elapsed_ms = current_edge_tooltip["elapsed_ms"]
+        if elapsed_ms != "*":
+            if this_edge["rtt_count"] == 0:
+                this_edge["rtt_min"] = elapsed_ms
+                this_edge["rtt_max"] = elapsed_ms
+            this_edge["rtt_min"] = min(this_edge["rtt_min"], elapsed_ms)
+            this_edge["rtt_max"] = max(this_edge["rtt_max"], elapsed_ms)
+            this_edge["rtt_sum"] += elapsed_ms
+            this_edge["rtt_count"] += 1
+
+    def add_aggregated_edges(self, edge_lable):
+        for (previous_node_id, current_node_id, _), this_edge in self.edge_stats.items():
+            edge_tooltip = dict(this_edge["tooltip"])
+            edge_label = this_edge["label"]
+            edge_tooltip["repeat_step"] = ", ".join(this_edge["repeat_steps"])
+            edge_tooltip["count"] = this_edge["count"]
+            edge_tooltip["rtt_min"] = None
+            edge_tooltip["rtt_max"] = None
+            if this_edge["rtt_count"] != 0:
+                rtt_avg = this_edge["rtt_sum"] / this_edge["rtt_count"]
+                edge_tooltip["elapsed_ms"] = rtt_avg
+                edge_tooltip["rtt_min"] = this_edge["rtt_min"]
+                edge_tooltip["rtt_max"] = this_edge["rtt_max"]
+                if edge_lable == "rtt":
+                    edge_label = format(rtt_avg, '.3f')
+            edge_attributes = {}
+            if self.is_as_boundary(previous_node_id, current_node_id):
+                edge_attributes["dashes"] = True
+            # not a title: save_measurement_graph puts the tooltips in columns
+            self.multi_directed_graph.add_edge(
+                previous_node_id, current_node_id, label=edge_label,
+                color=this_edge["color"], tooltip=edge_tooltip, **edge_attributes)
+
+    def is_as_boundary(self, previous_node_id, current_node_id):
+        previous_node_asn = self.node_asns.get(previous_node_id)
+        current_node_asn = self.node_asns.get(current_node_id)
+        return (previous_node_asn is not None and current_node_asn is not None
+                and previous_node_asn != current_node_asn)
+
+    def get_asn_info(self, result):
+        # annotated when the file was saved, or from the database
+        if "asn" in result.keys():
+            return result["asn"], result.get("cc", "")
+        return self.hop_asns.get(result["from"])
+
+    def set_node_positions(self, layout):
+        positions = utils.layout.get_node_positions(self.multi_directed_graph, layout)
+        for node_id, (x, y) in positions.items():
+            self.multi_directed_graph.nodes[node_id].update(x=x, y=y)
+        # without physics, the edges of more measurements between the same
+        # nodes are curved apart with their keys (0, 1, 2, ...)
+        for _, _, edge_key, edge_data in self.multi_directed_graph.edges(
+                keys=True, data=True):
+            edge_data["smooth"] = {
+                "type": "curvedCW", "roundness": min(edge_key * 0.15, 1)}
+
+    def save_measurement_graph(self, graph_name, attach_jscss,
+                               shared_assets=False, gzip_assets=False, layout=None):
+        if layout:
+            self.set_node_positions(layout)
+        net_vis = Network("1500px", "1500px",
+                          directed=True, bgcolor="#eeeeee")
+        if pyvis._version.__version__ > '0.1.9':
+            net_vis.from_nx(self.multi_directed_graph, show_edge_weights=False)
+        else:
+            net_vis.from_nx(self.multi_directed_graph)
+        if layout:
+            # the positions are fixed, so the browser has nothing to stabilise
+            net_vis.toggle_physics(False)
+            net_vis.set_edge_smooth('curvedCW')
+        else:
+            net_vis.set_edge_smooth('dynamic')
+        edge_tooltips = get_edge_tooltips(
+            [edge.pop("tooltip") for edge in net_vis.edges])
+        for edge in net_vis.edges:
+            # the same for all the edges, so it is in the options once
+            edge.pop("arrows", None)
+            edge.pop("width", None)
+        # a dict is written without the indents of the Options object, and
+        # the template takes edgeTooltips out of it
+        net_vis.options = json.loads(net_vis.options.to_json())
+        net_vis.options["edges"]["arrows"] = "to"
+        net_vis.options["edgeTooltips"] = edge_tooltips
+        if shared_assets:
+            net_vis.set_template(SHARED_TEMPLATE_PATH)
+        elif attach_jscss:
+            net_vis.set_template(OFFLINE_TEMPLATE_PATH)
+        else:
+            net_vis.set_template(MAIN_TEMPLATE_PATH)
+        if self.template_env is not None and hasattr(net_vis, "templateEnv"):
+            net_vis.templateEnv = self.template_env
+        graph_path = get_graph_path(graph_name)
+        if shared_assets:
+            write_shared_assets(os.path.dirname(os.path.abspath(graph_path)), gzip_assets)
+        net_vis.save_graph(graph_path)
+        print("saved: " + graph_path)
+
+    def vis(self, measurement_path, attach_jscss, edge_lable: str = "none",
+            shared_assets=False, gzip_assets=False, layout=None):
+        if self.reverse_resolver is not None or self.asn_db is not None:
+            hop_ips = utils.jsonl.get_hop_ips(measurement_path)
+            # all the names and ASNs at once, before the graph is made
+            if self.reverse_resolver is not None:
+                self.hop_names = self.reverse_resolver.resolve_many(hop_ips)
+            if self.asn_db is not None:
+                self.hop_asns = self.asn_db.lookup_map(hop_ips)
+        # one measurement at a time, so only the graph is kept in memory
+        all_measurements = utils.json_stream.iter_json_array(measurement_path)
+        measurement_steps = 0
+        src_addr_id = ""
+        pcap_readers = {}
+        for measurement in all_measurements:
+            if measurement_steps == 0:
+                src_addr = measurement["src_addr"]
+                src_addr_id = 'x' + str(int(ipaddress.IPv4Address(src_addr))) + 'x'
+                self.multi_directed_graph.add_node(
+                    src_addr_id, label=src_addr, color="Chocolate", title="source address",
+                    shape="diamond")
+                # the network of the probe, from the geolocation
+                if measurement.get("asn", "AS0") not in ["AS0", ""]:
+                    self.node_asns[src_addr_id] = measurement["asn"]
+            pcap_reader = None
+            if "pcap" in measurement.keys():
+                # the packets are in a pcap file next to the measurement file
+                if measurement["pcap"] not in pcap_readers.keys():
+                    pcap_readers[measurement["pcap"]] = utils.pcap.PacketCaptureReader(
+                        os.path.join(os.path.dirname(measurement_path), measurement["pcap"]))
+                pcap_reader = pcap_readers[measurement["pcap"]]
+            dst_addr = measurement["dst_addr"]
+            dst_addr_id = 'x' + str(int(ipaddress.IPv4Address(dst_addr))) + 'x'
+            annotation = "-"
+            if "annotation" in measurement.keys():
+                annotation = measurement["annotation"]
+            all_results = measurement["result"]
+            results_repeat_length = len(all_results[0]["result"])
+            previous_node_ids = initialize_first_nodes_nx(
+                src_addr_id, results_repeat_length)
+            already_detected = initialize_detected(results_repeat_length)
+            for try_step in all_results:  # will be up to 255
+                current_ttl = try_step["hop"]
+                current_ttl_str = str(current_ttl)
+                results = try_step["result"]
+                repeat_steps = 0
+                skip_next = False
+                for result in results:
+                    if skip_next:
+                        skip_next = False
+                        continue
+                    not_yet_destination = not (already_reached_destination_str(
+                        previous_node_ids[repeat_steps], dst_addr_id))
+                    if not_yet_destination:
+                        if "late" in result.keys():
+                            skip_next = True
+                        current_node_label = "***"
+                        current_edge_label = ""
+                        current_node_id = "0"
+                        current_node_shape = "dot"
+                        elapsed_ms = "*"
+                        packet_size = "*"
+                        backttl = "*"
+                        device_color = NO_RESPONSE_COLOR
+                        device_name = NO_RESPONSE_NAME
+                        response_packet = None
+                        is_middlebox = False
+                        asn_info = None
+                        if 'x' in result.keys():
+                            current_node_id = (
+                                "unknown" + previous_node_ids[repeat_steps] + "x")
+                            if edge_lable != "none":
+                                current_edge_label = "*"
+                        else:
+                            answer_ip = result["from"]
+                            asn_info = self.get_asn_info(result)
+                            backttl, device_color, device_name, is_middlebox_ttl = parse_ttl(
+                                result["ttl"], current_ttl)
+                            if "rtt" in result.keys():
+                                elapsed_ms = result["rtt"]
+                            if edge_lable == "rtt":
+                                if elapsed_ms != "*":
+                                    current_edge_label = format(elapsed_ms, '.3f')
+                            elif edge_lable == "backttl":
+                                current_edge_label = str(backttl)
+                            current_node_id = 'x' + str(
+                                int(ipaddress.IPv4Address(answer_ip))) + 'x'
+                            if "packets" in result.keys():
+                                if "received" in result['packets'].keys():
+                                    if len(result['packets']['received']) != 0:
+                                        packets = result['packets']
+                                        if pcap_reader is not None:
+                                            packets = pcap_reader.packetlist2json(packets)
+                                        is_nat, is_middlebox, is_pep, packet_type, tcpflag = detect_nat_pep_middlebox(
+                                            packets['sent'], packets['received']
+                                        )
+                                        if (is_middlebox_ttl or is_middlebox
+                                                ) and not already_detected[repeat_steps]["is_middlebox"]:
+                                            pass  # we decide about it later
+                                        elif is_pep and not already_detected[repeat_steps]["is_pep"]:
+                                            device_color = PEP_COLOR
+                                            device_name = PEP_NAME
+                                            current_node_shape = "star"
+                                            already_detected[repeat_steps]["is_pep"] = True
+                                            if current_node_id != dst_addr_id:
+                                                current_node_id = "pep" + current_node_id + "x"
+                                        elif is_nat and not already_detected[repeat_steps]["is_nat"]:
+                                            device_color = NAT_COLOR
+                                            device_name = NAT_NAME
+                                            already_detected[repeat_steps]["is_nat"] = True
+                                            if current_node_id != dst_addr_id:
+                                                current_node_id = "nat" + current_node_id + "x"
+                                        response_packet = (
+                                            is_nat, is_middlebox, is_pep, packet_type, tcpflag)
+                                        if (is_middlebox_ttl or is_middlebox):
+                                            already_detected[repeat_steps]["is_middlebox"] = True
+                                        if is_pep:
+                                            already_detected[repeat_steps]["is_pep"] = True
+                                        if is_nat:
+                                            already_detected[repeat_steps]["is_nat"] = True
+                            if is_middlebox_ttl or is_middlebox:
+                                current_node_id = "middlebox" + current_node_id + "x"
+                                current_node_shape = "star"
+                                device_color = MIDDLEBOX_COLOR
+                                device_name = MIDDLEBOX_NAME
+                                already_detected[repeat_steps]["is_middlebox"] = True
+                            elif current_node_id == dst_addr_id:
+                                current_node_shape = "square"
+                            current_node_label = answer_ip
+                            if self.hop_names.get(answer_ip):
+                                current_node_label += "\n" + self.hop_names[answer_ip]
+                            packet_size = result["size"]
+                        repeat_step_str = str(repeat_steps + 1)
+                        # the tooltip is made when the edges of all repeats are merged
+                        current_edge_tooltip = dict(
+                            current_request_color=(
+                                REQUEST_COLORS[measurement_steps % len(REQUEST_COLORS)]),
+                            current_ttl_str=current_ttl_str, backttl=backttl,
+                            request_ip=dst_addr, elapsed_ms=elapsed_ms,
+                            packet_size=packet_size, repeat_step=repeat_step_str,
+                            device_os_name=device_name, response_packet=response_packet,
+                            annotation=annotation
+                        )
+                        current_node_title = device_name
+                        current_node_asn = None
+                        if asn_info is not None:
+                            current_node_asn, country_code = asn_info
+                            current_node_title += ", " + " ".join(
+                                [current_node_asn, country_code]).strip()
+                        self.visualize(
+                            previous_node_ids[repeat_steps], current_node_id,
+                            current_node_label, current_node_title, device_color,
+                            current_edge_tooltip, REQUEST_COLORS[measurement_steps % len(REQUEST_COLORS)],
+                            current_edge_label, current_node_shape, measurement_steps,
+                            current_node_asn
+                        )
+                        previous_node_ids[repeat_steps] = current_node_id
+                    repeat_steps += 1
+            measurement_steps += 1
+        for pcap_reader in pcap_readers.values():
+            pcap_reader.close()
+        self.add_aggregated_edges(edge_lable)
+        print("saving measurement graph...")
+        self.save_measurement_graph(
+            measurement_path, attach_jscss, shared_assets, gzip_assets, layout)
+        print("· · · - · -     · · · - · -     · · · - · -     · · · - · -")
+
+
+def vis(measurement_path, attach_jscss, edge_lable: str = "none",
+        shared_assets=False, gzip_assets=False, layout=None, asn_db=None,
+        reverse_resolver=None):
+    return GraphBuilder(asn_db=asn_db, reverse_resolver=reverse_resolver).vis(
+        measurement_path, attach_jscss, edge_lable, shared_assets, gzip_assets, layout)